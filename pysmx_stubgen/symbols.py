@@ -282,7 +282,7 @@ class Native(PyStubBase):
 
         return_type = py_format_type(self.return_type, **kwargs)
         return (
-            f'{indent}@{mod_natives_base.native}\n'
+            f'{indent}@{mod_natives_base.native}(stub=True)\n'
             f'{indent}def {self.name}({", ".join(params)}) -> {return_type}:\n'
             f'{indent}    raise {mod_exc.SourcePawnUnboundNativeError}'
         )
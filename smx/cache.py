@@ -0,0 +1,195 @@
+# Persistent cache of loaded plug-ins (.smxc files), keyed by the SHA-256 of their .smx files
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Dict, NamedTuple, Sequence, TYPE_CHECKING
+
+from smx.decoder import CaseTable, instruction_starts
+from smx.definitions import SPFileSection
+from smx.version import VERSION
+
+if TYPE_CHECKING:
+    from smx.plugin import SourcePawnPlugin
+
+__all__ = [
+    'CachedPlugin',
+    'SMXC_EXTENSION',
+    'SMXC_MAGIC',
+    'SMXC_VERSION',
+    'plugin_cache_path',
+    'read_plugin_cache',
+    'write_plugin_cache',
+]
+
+logger = logging.getLogger(__name__)
+
+SMXC_EXTENSION = '.smxc'
+SMXC_MAGIC = b'SMXC'
+#: Bumped whenever the layout of .smxc files changes
+SMXC_VERSION = 1
+
+###
+# Layout of a .smxc file (all little-endian):
+#
+#   header  magic, format version, SHA-256 of the .smx file, and the sizes of what follows
+#   meta    JSON: pysmx version, header fields of the image, and its section headers by name
+#   starts  uint32 cell index of each instruction in the code section
+#   cases   int32 case table records: casetbl addr, default target, num cases, then (value, target) pairs
+#   image   the uncompressed plug-in image, aligned so it can be memory-mapped on its own
+#
+_HEADER = struct.Struct('<4sH2x32sIIIQQ')  # magic, version, digest, meta size, num starts, num case cells, image offset, image size
+
+
+class CachedPlugin(NamedTuple):
+    #: The uncompressed plug-in image, memory-mapped from the cache file. The file must
+    #: not be modified or truncated while it's mapped; write_plugin_cache() replaces it.
+    base: mmap.mmap
+    stringtab: int
+    dataoffs: int
+    is_unpacked: bool
+    sections: Dict[str, SPFileSection]
+    instruction_starts: Sequence[int]
+    case_tables: Dict[int, CaseTable]
+
+
+def plugin_cache_path(cache_dir: str | Path, digest: str) -> Path:
+    return Path(cache_dir) / f'{digest}{SMXC_EXTENSION}'
+
+
+def write_plugin_cache(path: str | Path, digest: str, plugin: SourcePawnPlugin) -> None:
+    """Write the cache of a loaded plug-in, whose .smx file has the given SHA-256 hex digest"""
+    path = Path(path)
+
+    meta = json.dumps({
+        'pysmx': VERSION,
+        'stringtab': plugin.stringtab,
+        'dataoffs': plugin.dataoffs,
+        'is_unpacked': plugin.is_unpacked,
+        'sections': {
+            name: [sect.nameoffs, sect.dataoffs, sect.size]
+            for name, sect in plugin.image_sections.items()
+        },
+    }).encode('utf-8')
+
+    starts = _little_endian(array('I', instruction_starts(plugin.decoded_code)))
+
+    cases = array('i')
+    for addr, table in plugin.case_tables.items():
+        cases.extend((addr, table.default, len(table.cases)))
+        for value, target in table.cases.items():
+            cases.extend((value, target))
+    cases = _little_endian(cases)
+
+    image_offset = _HEADER.size + len(meta) + len(starts) * starts.itemsize + len(cases) * cases.itemsize
+    image_offset += -image_offset % mmap.ALLOCATIONGRANULARITY
+
+    header = _HEADER.pack(
+        SMXC_MAGIC,
+        SMXC_VERSION,
+        bytes.fromhex(digest),
+        len(meta),
+        len(starts),
+        len(cases),
+        image_offset,
+        len(plugin.base),
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so readers never see a partial cache
+    with NamedTemporaryFile('wb', dir=path.parent, prefix=path.name, suffix='.tmp', delete=False) as fp:
+        try:
+            fp.write(header)
+            fp.write(meta)
+            starts.tofile(fp)
+            cases.tofile(fp)
+            fp.write(b'\0' * (image_offset - fp.tell()))
+            fp.write(plugin.base)
+        except BaseException:
+            fp.close()
+            os.unlink(fp.name)
+            raise
+
+    os.replace(fp.name, path)
+
+
+def read_plugin_cache(path: str | Path, digest: str) -> CachedPlugin | None:
+    """Read the cache of the .smx file with the given SHA-256 hex digest
+
+    Returns None if there is no cache at `path`, if it's stale (written for
+    another file, or by another version of pysmx or the cache format), or if
+    it's damaged (e.g. truncated).
+    """
+    try:
+        fp = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+
+    with fp:
+        try:
+            return _read_plugin_cache(fp, digest)
+        except (ValueError, EOFError, KeyError, TypeError) as e:
+            # NOTE: json.JSONDecodeError and UnicodeDecodeError are ValueErrors, as is
+            #       mapping an image which extends past the end of the file
+            logger.warning('Ignoring damaged plug-in cache %s: %s', path, e)
+            return None
+
+
+def _read_plugin_cache(fp: BinaryIO, digest: str) -> CachedPlugin | None:
+    header = fp.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+
+    magic, version, cached_digest, meta_size, num_starts, num_case_cells, image_offset, image_size = \
+        _HEADER.unpack(header)
+    if magic != SMXC_MAGIC or version != SMXC_VERSION or cached_digest != bytes.fromhex(digest):
+        return None
+
+    meta = json.loads(fp.read(meta_size).decode('utf-8'))
+    if meta['pysmx'] != VERSION:
+        return None
+
+    starts = array('I')
+    starts.fromfile(fp, num_starts)
+    cases = array('i')
+    cases.fromfile(fp, num_case_cells)
+
+    cases = _little_endian(cases)
+    case_tables: Dict[int, CaseTable] = {}
+    i = 0
+    while i < num_case_cells:
+        addr, default, num_cases = cases[i:i + 3]
+        records = cases[i + 3:i + 3 + num_cases * 2]
+        case_tables[addr] = CaseTable(dict(zip(records[::2], records[1::2])), default)
+        i += 3 + num_cases * 2
+
+    sections = {
+        name: SPFileSection(nameoffs=nameoffs, dataoffs=dataoffs, size=size)
+        for name, (nameoffs, dataoffs, size) in meta['sections'].items()
+    }
+
+    base = mmap.mmap(fp.fileno(), image_size, offset=image_offset, access=mmap.ACCESS_READ)
+
+    return CachedPlugin(
+        base=base,
+        stringtab=meta['stringtab'],
+        dataoffs=meta['dataoffs'],
+        is_unpacked=meta['is_unpacked'],
+        sections=sections,
+        instruction_starts=_little_endian(starts),
+        case_tables=case_tables,
+    )
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
@@ -11,6 +11,7 @@ __all__ = [
     'iskeyword',
     'hexlify',
     'get_annotations',
+    'cached_property',
 ]
 
 
@@ -124,6 +125,27 @@ else:
         return sep.join(f'{b:02x}' for b in data)
 
 
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    class cached_property:
+        """Property computed once per instance, then cached as a normal attribute"""
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = None
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner, name):
+            self.attrname = name
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
 if sys.version_info >= (3, 10):
     from inspect import get_annotations
 else:
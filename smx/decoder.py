@@ -0,0 +1,266 @@
+# Load-time decoding of a plug-in's code section into ready-to-dispatch instructions
+from __future__ import annotations
+
+import struct
+from ctypes import sizeof
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from smx.definitions import cell
+from smx.opcodes import opcodes, SourcePawnInstruction, SourcePawnInstructionParam, sp_opcodes_list
+from smx.pawn import SMXInstructions
+
+__all__ = [
+    'CaseTable',
+    'DecodedInstruction',
+    'decode_case_tables',
+    'decode_code',
+    'fuse_superinstructions',
+    'instruction_starts',
+    'read_code_cells',
+    'SUPERINSTRUCTIONS',
+]
+
+
+class DecodedInstruction(NamedTuple):
+    #: Code address of the instruction
+    addr: int
+    #: Opcode number
+    op: int
+    instr: SourcePawnInstruction
+    #: Unbound SMXInstructions method implementing the opcode, or None if unimplemented
+    handler: Callable[..., object] | None
+    #: Raw param cells, as stored in the code section (stack params are frame-relative)
+    params: Tuple[int, ...]
+    #: Address of the following instruction
+    next_cip: int
+    #: Indices into `params` which are frame-relative stack offsets
+    stack_params: Tuple[int, ...]
+
+
+def read_code_cells(code: bytes) -> Tuple[int, ...]:
+    """Unpack an entire code section into signed cells in one pass"""
+    return struct.unpack(f'<{len(code) // sizeof(cell)}l', code[:len(code) - len(code) % sizeof(cell)])
+
+
+def decode_code(code: bytes, starts: Iterable[int] | None = None) -> List[DecodedInstruction | None]:
+    """Decode a code section into a list of instructions, indexed by cell (i.e. `addr >> 2`)
+
+    Cells which do not begin an instruction (params, case tables, and invalid
+    opcodes) are left as None.
+
+    :param starts:
+        The cell indices at which instructions begin, if already known (e.g. from
+        a previous decoding, see `instruction_starts`). Otherwise, the code is
+        scanned for them.
+
+    """
+    cells = read_code_cells(code)
+    num_cells = len(cells)
+
+    decoded: List[DecodedInstruction | None] = [None] * num_cells
+
+    if starts is None:
+        starts = _scan_instruction_starts(cells)
+
+    # NOTE: this is the hot loop of loading a plug-in, so the DecodedInstruction
+    #       tuples are built positionally, from per-opcode fields computed once.
+    new_instruction = tuple.__new__
+    opcode_fields = _OPCODE_FIELDS
+    cell_size = sizeof(cell)
+
+    for i in starts:
+        op = cells[i] & 0xffff
+        instr, handler, num_params, stack_params = opcode_fields[op]
+        params = cells[i + 1:i + 1 + num_params]
+
+        next_i = i + 1 + len(params)
+        if op == _CASETBL_OP and params:
+            # Skip over the (value, addr) records of the case table
+            next_i += params[0] * 2
+
+        decoded[i] = new_instruction(DecodedInstruction, (
+            i * cell_size, op, instr, handler, params, next_i * cell_size, stack_params,
+        ))
+
+    return decoded
+
+
+def instruction_starts(decoded: Sequence[DecodedInstruction | None]) -> List[int]:
+    """Return the cell indices at which the decoded instructions begin"""
+    return [i for i, d in enumerate(decoded) if d is not None]
+
+
+def _scan_instruction_starts(cells: Sequence[int]) -> Iterator[int]:
+    num_cells = len(cells)
+    num_opcodes = len(sp_opcodes_list)
+
+    i = 0
+    while i < num_cells:
+        op = cells[i] & 0xffff
+        if op >= num_opcodes:
+            i += 1
+            continue
+
+        yield i
+
+        start = i
+        i += 1 + len(sp_opcodes_list[op].params)
+        if op == _CASETBL_OP and start + 1 < num_cells:
+            # Skip over the (value, addr) records of the case table
+            i += cells[start + 1] * 2
+
+
+class CaseTable(NamedTuple):
+    #: Jump target of each case value
+    cases: Dict[int, int]
+    #: Jump target when no case matches
+    default: int
+
+
+def decode_case_tables(
+    decoded: Sequence[DecodedInstruction | None],
+    code: bytes,
+) -> Dict[int, CaseTable]:
+    """Decode every case table in a code section, keyed by the address of its `casetbl` instruction"""
+    tables: Dict[int, CaseTable] = {}
+    for d in decoded:
+        if d is None or d.op != _CASETBL_OP or len(d.params) != 2:
+            continue
+
+        num_cases, default = d.params
+        records = struct.unpack_from(f'<{num_cases * 2}l', code, d.addr + 3 * sizeof(cell))
+        cases: Dict[int, int] = {}
+        for value, target in zip(records[::2], records[1::2]):
+            # As in a linear scan of the table, the first matching record wins
+            cases.setdefault(value, target)
+
+        tables[d.addr] = CaseTable(cases, default)
+
+    return tables
+
+
+#: Opcode sequences fused into a single dispatch by fuse_superinstructions, chosen
+#: by their (static and executed) frequency across the sourcemod_tests corpus.
+#: Only the last opcode of a sequence may transfer control.
+#:
+#: NOTE: push.c + push.c + call, const.pri + jsless and load.s.both + add + stor.s.pri
+#:       were measured and left out: none of them occur in the 122 compiled corpus
+#:       plugins, as spcomp pushes constant arguments with const.pri + push.pri, and
+#:       only the argument count with push.c (push.c + call: 180 occurrences).
+SUPERINSTRUCTIONS: Tuple[Tuple[str, ...], ...] = (
+    ('load.pri', 'push.pri'),
+    ('load.s.pri', 'push.pri'),
+    ('load.i', 'push.pri'),
+    ('const.pri', 'push.pri'),
+    ('addr.pri', 'push.pri'),
+    ('move.pri', 'push.pri'),
+    ('push.pri', 'push.c'),
+    ('add.c', 'load.i'),
+    ('load.s.pri', 'jzer'),
+    ('load.s.pri', 'jnz'),
+    ('pop.alt', 'jsless'),
+    ('push.c', 'call'),
+    ('push.pri', 'sysreq.n'),
+    ('zero.pri', 'retn'),
+    ('load.pri', 'retn'),
+)
+
+
+def fuse_superinstructions(decoded: Sequence[DecodedInstruction | None]) -> List[DecodedInstruction | None]:
+    """Peephole pass replacing common opcode sequences with fused superinstructions
+
+    The fused instruction takes the place of the sequence's first instruction;
+    the rest remain in place, so jumps into the middle of a sequence still land
+    on ordinary instructions. Additionally, each `break` (a no-op marking the
+    start of a statement) is folded into the instruction following it.
+    """
+    fused = list(decoded)
+
+    # Walk backwards, so breaks are folded into already-fused instructions
+    for i in range(len(fused) - 1, -1, -1):
+        d = fused[i]
+        if d is None:
+            continue
+
+        for ops, instr, handler in _FUSIONS.get(d.op, ()):
+            seq = _match_sequence(decoded, d, ops)
+            if seq is not None:
+                fused[i] = _fuse(seq, instr, handler)
+                break
+
+        if d.op == _BREAK_OP:
+            next_i = d.next_cip >> 2
+            following = fused[next_i] if next_i < len(fused) else None
+            if following is not None and following.handler is not None:
+                # NOTE: the folded instruction keeps the address of the instruction it runs
+                fused[i] = following._replace(
+                    instr=following.instr._replace(name=f'{d.instr.name} + {following.instr.name}'),
+                )
+
+    return fused
+
+
+def _match_sequence(
+    decoded: Sequence[DecodedInstruction | None],
+    first: DecodedInstruction,
+    ops: Tuple[int, ...],
+) -> List[DecodedInstruction] | None:
+    seq = [first]
+    for op in ops[1:]:
+        next_i = seq[-1].next_cip >> 2
+        d = decoded[next_i] if next_i < len(decoded) else None
+        if d is None or d.op != op:
+            return None
+        seq.append(d)
+    return seq
+
+
+def _fuse(seq: List[DecodedInstruction], instr: SourcePawnInstruction, handler: Callable[..., object]) -> DecodedInstruction:
+    params: Tuple[int, ...] = ()
+    stack_params: Tuple[int, ...] = ()
+    for d in seq:
+        stack_params += tuple(len(params) + i for i in d.stack_params)
+        params += d.params
+
+    return DecodedInstruction(
+        addr=seq[0].addr,
+        op=seq[0].op,
+        instr=instr,
+        handler=handler,
+        params=params,
+        next_cip=seq[-1].next_cip,
+        stack_params=stack_params,
+    )
+
+
+def _superinstruction(names: Tuple[str, ...]) -> Tuple[Tuple[int, ...], SourcePawnInstruction, Callable[..., object]]:
+    instrs = [opcodes[name] for name in names]
+    fused = SourcePawnInstruction(
+        name=' + '.join(names),
+        method='__'.join(instr.method for instr in instrs),
+        params=tuple(param for instr in instrs for param in instr.params),
+        is_generated=True,
+    )
+    ops = tuple(sp_opcodes_list.index(instr) for instr in instrs)
+    return ops, fused, getattr(SMXInstructions, fused.method)
+
+
+def _stack_param_indices(params: Sequence[SourcePawnInstructionParam]) -> Tuple[int, ...]:
+    return tuple(i for i, param in enumerate(params) if param is SourcePawnInstructionParam.STACK)
+
+
+_CASETBL_OP = sp_opcodes_list.index(opcodes['casetbl'])
+_HANDLERS = [getattr(SMXInstructions, instr.method, None) for instr in sp_opcodes_list]
+_STACK_PARAMS = [_stack_param_indices(instr.params) for instr in sp_opcodes_list]
+#: (instr, handler, num params, stack params) of each opcode, in DecodedInstruction order
+_OPCODE_FIELDS = [
+    (instr, _HANDLERS[op], len(instr.params), _STACK_PARAMS[op])
+    for op, instr in enumerate(sp_opcodes_list)
+]
+_BREAK_OP = sp_opcodes_list.index(opcodes['break'])
+
+#: Superinstructions by their first opcode, longest first
+_FUSIONS: Dict[int, List[Tuple[Tuple[int, ...], SourcePawnInstruction, Callable[..., object]]]] = {}
+for _names in sorted(SUPERINSTRUCTIONS, key=len, reverse=True):
+    _fusion = _superinstruction(_names)
+    _FUSIONS.setdefault(_fusion[0][0], []).append(_fusion)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import ctypes
+import struct
 from enum import IntEnum
 from typing import List, Tuple
 
@@ -80,6 +81,11 @@ cell = ctypes.c_int32
 PyCSimpleType = type(cell)
 
 
+def wrap_cell(value: int) -> int:
+    """Truncate an int to a signed 32-bit cell value, as a C store would"""
+    return ((value + 0x80000000) & 0xffffffff) - 0x80000000
+
+
 class SPCodeFeature(FlagsEnumBase):
     Deprecated0 = 1 << 0
 
@@ -201,6 +207,23 @@ class SPFdbgSymbol(Struct):
     dims: List[SPFdbgArrayDim] = csfield(SPFdbgArrayDim[cs.this.dimcount])
 
 
+###
+# struct formats of the fixed-size records above, for unpacking them without construct
+#
+SPFILE_HDR_RECORD = struct.Struct('<IHBIIBII')      # magic, version, compression, disksize, imagesize, sections, stringtab, dataoffs
+SPFILE_SECTION_RECORD = struct.Struct('<III')       # nameoffs, dataoffs, size
+SPFILE_CODE_RECORD = struct.Struct('<IBBHIII')      # codesize, cellsize, codeversion, flags, main, code, features
+SPFILE_DATA_RECORD = struct.Struct('<III')          # datasize, memsize, data
+SPFILE_PUBLICS_RECORD = struct.Struct('<II')        # address, name
+SPFILE_NATIVES_RECORD = struct.Struct('<I')         # name
+SPFILE_PUBVARS_RECORD = struct.Struct('<II')        # address, name
+SPFILE_TAG_RECORD = struct.Struct('<II')            # tag_id, name
+SPFDBG_FILE_RECORD = struct.Struct('<II')           # addr, name
+SPFDBG_LINE_RECORD = struct.Struct('<II')           # addr, line
+SPFDBG_ARRAYDIM_RECORD = struct.Struct('<HI')       # tagid, size
+SPFDBG_SYMBOL_RECORD = struct.Struct('<IHIIBBHI')   # addr, tagid, codestart, codeend, ident, vclass, dimcount, name
+
+
 class SPFdbgNtvArg(Struct):
     """An argument of a .dbg.natives entry
 
@@ -599,3 +622,6 @@ class Myinfo(Struct):
     author: int = csfield(cs.Int32ul)
     version: int = csfield(cs.Int32ul)
     url: int = csfield(cs.Int32ul)
+
+
+MYINFO_RECORD = struct.Struct('<IIIII')  # name, description, author, version, url
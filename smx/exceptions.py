@@ -68,3 +68,7 @@ class SourcePawnRuntimeError(SourcePawnPluginError, RuntimeError):
 
         frame_name = frame.name or '<unknown>'
         return f'Error executing {frame_name}: {self}\n'
+
+
+class SourcePawnWorkerError(SourcePawnPluginError):
+    """Error calling a SourcePawn function in a worker process (see smx.parallel)"""
@@ -0,0 +1,122 @@
+# Opt-in recording of the instructions executed by an abstract machine
+from __future__ import annotations
+
+import collections
+import weakref
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Deque, Iterator, NamedTuple, Sequence, TextIO, Tuple, TYPE_CHECKING
+
+from smx.tracing import Tracer
+
+if TYPE_CHECKING:
+    from smx.opcodes import SourcePawnInstruction
+    from smx.runtime import SourcePawnPluginRuntime
+    from smx.vm import SourcePawnAbstractMachine
+
+__all__ = [
+    'ExecutedInstruction',
+    'ExecutionHistory',
+    'RingBufferHistory',
+    'FileHistory',
+]
+
+
+class ExecutedInstruction(NamedTuple):
+    #: Code address of the instruction
+    addr: int
+    instr: SourcePawnInstruction
+    #: Params passed to the instruction's handler
+    params: Tuple[Any, ...]
+    #: Value returned by the instruction's handler, if any
+    rval: Any
+
+
+class ExecutionHistory(Tracer, ABC):
+    """Records instructions as they're executed by the interpreter
+
+    Pass an instance as SourcePawnPluginRuntime's `history` option to enable
+    recording. By default, no history is kept.
+
+    NOTE: the threaded and JIT engines do not record history, beyond the
+          instructions they hand off to the interpreter.
+    """
+
+    #: The runtime which owns the history, set when it's attached to one
+    _runtime: weakref.ref[SourcePawnPluginRuntime] | None = None
+
+    def after_instruction(
+        self,
+        amx: SourcePawnAbstractMachine,
+        addr: int,
+        instr: SourcePawnInstruction,
+        params: Sequence[Any],
+        rval: Any,
+    ) -> None:
+        self.record(ExecutedInstruction(addr, instr, tuple(params), rval))
+
+    @abstractmethod
+    def record(self, entry: ExecutedInstruction) -> None:
+        """Record an executed instruction"""
+
+    def clear(self) -> None:
+        """Forget all recorded instructions (called whenever the abstract machine is initialized)"""
+
+    def close(self) -> None:
+        """Release any resources held by the history (called when its runtime is done with it)"""
+
+    def __enter__(self) -> ExecutionHistory:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self) -> Iterator[ExecutedInstruction]:
+        return iter(())
+
+
+class RingBufferHistory(ExecutionHistory):
+    """Keeps the last `size` executed instructions in memory (e.g. for crash dumps)"""
+
+    def __init__(self, size: int = 1000):
+        self.entries: Deque[ExecutedInstruction] = collections.deque(maxlen=size)
+
+    def record(self, entry: ExecutedInstruction) -> None:
+        self.entries.append(entry)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def __iter__(self) -> Iterator[ExecutedInstruction]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class FileHistory(ExecutionHistory):
+    """Streams every executed instruction to a file, one per line
+
+    If given a path, the history opens (and owns) the file, closing it on `close()`
+    — or when used as a context manager, or when its runtime is done with it.
+    Files passed in already open are left open.
+    """
+
+    def __init__(self, file: str | Path | TextIO):
+        if isinstance(file, (str, Path)):
+            self.fp = open(file, 'w')
+            self._owns_fp = True
+        else:
+            self.fp = file
+            self._owns_fp = False
+
+    def record(self, entry: ExecutedInstruction) -> None:
+        params = ', '.join(map(str, entry.params))
+        line = f'{entry.addr:05x}: {entry.instr.name} {params}'
+        if entry.rval is not None:
+            line = f'{line:<70}-> {entry.rval!r}'
+        self.fp.write(f'{line}\n')
+
+    def close(self) -> None:
+        if self._owns_fp and not self.fp.closed:
+            self.fp.close()
@@ -22,37 +22,63 @@ ParamArrayValueT = Union[str, bytes, List[ParamScalarValueT]]
 ParamValueT = Union[ParamScalarValueT, ParamArrayValueT]
 
 
-@dataclasses.dataclass
 class ParamInfo:
-    value: ParamValueT | None = None
-
-    #: Whether the input was a scalar or a list of values
-    is_scalar: bool = True
-
-    #: Whether this is a pseudo-param holding a return value buffer addr,
-    #: and should not be included in the nargs for the call.
-    is_rval_buffer: bool = False
-
-    #: Copy-back flags
-    flags: ParamCopyFlag = 0
-
-    # XXX(zk): this is a terrible name. ported from SM
-    #: Whether this is marked as being used
-    marked: bool = False
-
-    #: Size of array in cells, or string in bytes
-    size: int = 0
-
-    #: Whether this is a string
-    is_string: bool = False
-
-    #: String flags
-    string_flags: ParamStringFlag = 0
-
-    #: Local addr of allocated memory for the param
-    local_addr: int = -1
-    #: Physical addr of allocated memory for the param
-    phys_addr: int = -1
+    """An arg pushed to a callable, to be passed to it when invoked
+
+    Params are never modified by invoking them, so they may be invoked any number
+    of times, reentrantly or not, without being copied.
+    """
+
+    __slots__ = (
+        'value',
+        'is_scalar',
+        'is_rval_buffer',
+        'flags',
+        'marked',
+        'size',
+        'is_string',
+        'string_flags',
+    )
+
+    def __init__(
+        self,
+        value: ParamValueT | None = None,
+        is_scalar: bool = True,
+        is_rval_buffer: bool = False,
+        flags: ParamCopyFlag = 0,
+        marked: bool = False,
+        size: int = 0,
+        is_string: bool = False,
+        string_flags: ParamStringFlag = 0,
+    ):
+        self.value = value
+
+        #: Whether the input was a scalar or a list of values
+        self.is_scalar = is_scalar
+
+        #: Whether this is a pseudo-param holding a return value buffer addr,
+        #: and should not be included in the nargs for the call.
+        self.is_rval_buffer = is_rval_buffer
+
+        #: Copy-back flags
+        self.flags = flags
+
+        # XXX(zk): this is a terrible name. ported from SM
+        #: Whether this is marked as being used
+        self.marked = marked
+
+        #: Size of array in cells, or string in bytes
+        self.size = size
+
+        #: Whether this is a string
+        self.is_string = is_string
+
+        #: String flags
+        self.string_flags = string_flags
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
 
 
 RV = TypeVar('RV')
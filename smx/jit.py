@@ -0,0 +1,612 @@
+# Tier-2 "JIT" compiler: hot functions are translated into Python source, one basic block at a time
+from __future__ import annotations
+
+import struct
+from ctypes import sizeof
+from typing import Callable, Dict, List, NamedTuple, Set, Tuple, TYPE_CHECKING
+
+from smx.definitions import cell, wrap_cell
+from smx.opcodes import SourcePawnInstruction
+from smx.threaded import _sync
+
+if TYPE_CHECKING:
+    from smx.decoder import DecodedInstruction
+    from smx.plugin import SourcePawnPlugin
+    from smx.pawn import SMXInstructions
+    from smx.vm import SourcePawnAbstractMachine
+
+__all__ = ['JitCompiler', 'JitFunction']
+
+CELL_SIZE = sizeof(cell)
+
+#: Code which writes the register locals back to the abstract machine
+WRITE_BACK = 'amx.PRI, amx.ALT, amx.STK, amx.FRM = PRI, ALT, STK, FRM'
+#: Code which reloads the register locals from the abstract machine
+RELOAD = 'PRI, ALT, STK, FRM = amx.PRI, amx.ALT, amx.STK, amx.FRM'
+
+
+class JitFunction(NamedTuple):
+    #: Code address of the function's first instruction
+    start: int
+    #: Code address just past the function's last instruction
+    end: int
+    #: Addresses at which execution may enter the compiled code (block leaders)
+    entries: Tuple[int, ...]
+    #: The compiled function. It receives the abstract machine and the address
+    #: of the block to begin executing, and returns once execution leaves the
+    #: function (or reaches an instruction it can't handle), with amx.CIP set
+    #: to the address at which to resume.
+    fn: Callable[['SourcePawnAbstractMachine', int], None]
+    #: Generated Python source of the function, for debugging
+    source: str
+
+
+class JitCompiler:
+    """Compiles a plug-in's hot functions into Python source
+
+    Each function (bounded by its RTTIMethod) is split into basic blocks, and
+    translated into a single Python function, with PRI/ALT/STK/FRM held in
+    locals. Jumps and switches become assignments to a `block` variable,
+    dispatched by a binary tree of if statements within a `while True` loop.
+
+    Functions are compiled once they've been entered `jit_threshold` times
+    (counting both calls and iterations of their loops), and are cached on the
+    plug-in, for use by all of its runtimes. Compiled code is entered from the
+    interpreter: each abstract machine executes a private copy of the plug-in's
+    decoded instructions, in which the leader of every compiled block is
+    replaced with an instruction that runs the compiled function from there.
+
+    Calls, returns, and anything the compiler doesn't understand exit back to
+    the interpreter, with the registers written back to the abstract machine.
+    Execution re-enters compiled code at the next block leader it reaches.
+    """
+
+    def __init__(self, plugin: SourcePawnPlugin):
+        self.plugin = plugin
+        #: Number of times execution has entered each function, by start address
+        self.counts: Dict[int, int] = {}
+        #: Compiled functions by start address (None if the function couldn't be compiled)
+        self.functions: Dict[int, JitFunction | None] = {}
+        self._loop_headers: Dict[int, Tuple[int, ...]] | None = None
+
+    def install(self, amx: SourcePawnAbstractMachine) -> List[DecodedInstruction | None]:
+        """Return a copy of the plug-in's decoded instructions, with JIT entry points installed"""
+        code = list(self.plugin.decoded_code)
+        if amx.STP % CELL_SIZE:
+            # Compiled code presumes stack frames are cell-aligned
+            return code
+
+        loop_headers = self._find_loop_headers()
+        for meth in self.plugin.rtti_methods:
+            start = meth.pcode_start
+            if start in self.functions:
+                func = self.functions[start]
+                if func is not None:
+                    self._install_entries(code, func)
+                continue
+
+            for addr in (start,) + loop_headers.get(start, ()):
+                d = code[addr >> 2] if 0 <= addr < len(code) << 2 else None
+                if d is not None:
+                    code[addr >> 2] = d._replace(
+                        instr=_entry_instruction(d), handler=_count_entry, params=(start, d), stack_params=())
+
+        return code
+
+    def enter(self, amx: SourcePawnAbstractMachine, start: int, d: DecodedInstruction) -> None:
+        """Count an entry into the function at `start`, compiling it once hot, and execute `d`"""
+        count = self.counts[start] = self.counts.get(start, 0) + 1
+        if count >= amx.runtime.jit_threshold:
+            func = self.compile(start)
+            if func is not None:
+                self._install_entries(amx._code, func)
+                if d.addr in func.entries:
+                    func.fn(amx, d.addr)
+                    return
+            else:
+                for addr in range(start, self._find_end(start), CELL_SIZE):
+                    orig = self.plugin.decoded_code[addr >> 2]
+                    if orig is not None:
+                        amx._code[addr >> 2] = orig
+
+        if d.handler is not None:
+            params = d.params
+            if d.stack_params:
+                params = list(params)
+                for i in d.stack_params:
+                    params[i] = amx.FRM + params[i]
+            d.handler(amx.instructions, amx, *params)
+
+    def compile(self, start: int) -> JitFunction | None:
+        """Compile (or fetch the cached compilation of) the function beginning at `start`"""
+        if start not in self.functions:
+            self.functions[start] = _FunctionCompiler(self.plugin, start, self._find_end(start)).compile()
+        return self.functions[start]
+
+    def _find_end(self, start: int) -> int:
+        meth = self.plugin.rtti_methods_by_addr.get(start)
+        end = meth.pcode_end if meth is not None else start
+        return min(end, len(self.plugin.decoded_code) * CELL_SIZE)
+
+    def _find_loop_headers(self) -> Dict[int, Tuple[int, ...]]:
+        """Map each function's start address to the targets of its backward jumps"""
+        if self._loop_headers is None:
+            headers: Dict[int, Set[int]] = {}
+            for meth in self.plugin.rtti_methods:
+                start, end = meth.pcode_start, self._find_end(meth.pcode_start)
+                for addr in range(start, end, CELL_SIZE):
+                    d = self.plugin.decoded_code[addr >> 2]
+                    if (
+                        d is not None and d.instr.method in _JUMP_CONDITIONS
+                        and d.params and start < d.params[0] <= addr
+                    ):
+                        headers.setdefault(start, set()).add(d.params[0])
+            self._loop_headers = {start: tuple(sorted(addrs)) for start, addrs in headers.items()}
+        return self._loop_headers
+
+    @staticmethod
+    def _install_entries(code: List[DecodedInstruction | None], func: JitFunction) -> None:
+        for addr in func.entries:
+            d = code[addr >> 2]
+            code[addr >> 2] = d._replace(
+                instr=_entry_instruction(d), handler=_enter_compiled, params=(func.fn, addr), stack_params=())
+
+
+def _entry_instruction(d: DecodedInstruction) -> SourcePawnInstruction:
+    # NOTE: entry points take params of their own, so the spew must not format the original params
+    return d.instr._replace(name=f'{d.instr.name} [jit]', params=())
+
+
+def _count_entry(
+    instructions: SMXInstructions,
+    amx: SourcePawnAbstractMachine,
+    start: int,
+    d: DecodedInstruction,
+) -> None:
+    amx.plugin.jit_code.enter(amx, start, d)
+
+
+def _enter_compiled(
+    instructions: SMXInstructions,
+    amx: SourcePawnAbstractMachine,
+    fn: Callable[[SourcePawnAbstractMachine, int], None],
+    addr: int,
+) -> None:
+    fn(amx, addr)
+
+
+def _bad_address(offset: int):
+    # NOTE: mirrors SourcePawnAbstractMachine._throw_if_bad_addr
+    raise ValueError(f'Address {offset} is out of bounds')
+
+
+def _write_unaligned(amx: SourcePawnAbstractMachine, offset: int, value: int):
+    struct.pack_into('<i', amx.mem, offset, wrap_cell(value))
+
+
+class _Addr(NamedTuple):
+    #: Python expression evaluating to the address
+    expr: str
+    #: The address, if known at compile time
+    const: int | None
+    #: Whether the address is known to be cell-aligned
+    aligned: bool
+
+
+class _FunctionCompiler:
+    def __init__(self, plugin: SourcePawnPlugin, start: int, end: int):
+        self.plugin = plugin
+        self.start = start
+        self.end = end
+        self.decoded = plugin.decoded_code
+        self.namespace = {
+            'bad_address': _bad_address,
+            'write_unaligned': _write_unaligned,
+            'wrap_cell': wrap_cell,
+            'sync': _sync,
+        }
+
+    def compile(self) -> JitFunction | None:
+        instrs = [
+            d for d in self.decoded[self.start >> 2:self.end >> 2]
+            if d is not None
+        ]
+        if not instrs or instrs[0].addr != self.start:
+            return None
+
+        leaders = self._find_leaders(instrs)
+        blocks: Dict[int, List[str]] = {}
+        entries = []
+        cur: List[str] | None = None
+        terminated = True
+        for i, d in enumerate(instrs):
+            if d.addr in leaders:
+                if not terminated:
+                    cur.extend(self._goto(d.addr))
+                cur = blocks[d.addr] = []
+                if self._is_supported(d):
+                    entries.append(d.addr)
+
+            lines, terminated = self._translate(d)
+            cur.extend(lines)
+
+        if not terminated:
+            cur.extend(self._exit(instrs[-1].next_cip))
+
+        name = f'jit_{self.start:x}'
+        source = '\n'.join([
+            f'def {name}(amx, block):',
+            '    PRI, ALT, STK, FRM = amx.PRI, amx.ALT, amx.STK, amx.FRM',
+            '    STP = amx.STP',
+            '    C = amx.mem_cells',
+            '    load = amx._getheapcell',
+            '    instructions = amx.instructions',
+            '    while True:',
+            *self._dispatch(sorted(blocks), blocks, 2),
+            '',
+        ])
+        code = compile(source, f'<jit {self.plugin.filename or "plugin"}:{self.start:#x}>', 'exec')
+        exec(code, self.namespace)
+        return JitFunction(self.start, self.end, tuple(entries), self.namespace[name], source)
+
+    def _find_leaders(self, instrs: List[DecodedInstruction]) -> Set[int]:
+        leaders = {self.start}
+        for d in instrs:
+            method = d.instr.method
+            if method in _JUMP_CONDITIONS:
+                leaders.add(d.next_cip)
+                if d.params:
+                    leaders.add(d.params[0])
+            elif method == 'switch':
+                leaders.add(d.next_cip)
+                table = self._read_case_table(d)
+                if table is not None:
+                    cases, default = table
+                    leaders.add(default)
+                    leaders.update(cases.values())
+            elif method in ('call', 'retn') or not self._is_supported(d):
+                leaders.add(d.next_cip)
+
+        return {addr for addr in leaders if self.start <= addr < self.end and self.decoded[addr >> 2] is not None}
+
+    def _read_case_table(self, d: DecodedInstruction) -> Tuple[Dict[int, int], int] | None:
+        table = self.plugin.case_tables.get(d.params[0])
+        if table is None:
+            return None
+
+        cases, default = table
+        if not all(self.start <= addr < self.end for addr in (default, *cases.values())):
+            return None
+        return cases, default
+
+    def _is_supported(self, d: DecodedInstruction) -> bool:
+        method = d.instr.method
+        if len(d.params) != len(d.instr.params) or not d.instr.is_generated:
+            return False
+        if method == 'stack':
+            return d.params[0] % CELL_SIZE == 0
+        if method == 'switch':
+            return self._read_case_table(d) is not None
+        return (
+            method in _REGISTER_OPS or method in _MEMORY_OPS or method in _JUMP_CONDITIONS
+            or method in _EXITS or method in _CALLOUTS and d.handler is not None
+        )
+
+    def _dispatch(self, addrs: List[int], blocks: Dict[int, List[str]], depth: int) -> List[str]:
+        """Generate a binary tree of ifs selecting the block to execute"""
+        indent = '    ' * depth
+        if len(addrs) == 1:
+            return [f'{indent}# {addrs[0]:#x}'] + [indent + line for line in blocks[addrs[0]]]
+
+        mid = len(addrs) // 2
+        return [
+            f'{indent}if block < {addrs[mid]}:',
+            *self._dispatch(addrs[:mid], blocks, depth + 1),
+            f'{indent}else:',
+            *self._dispatch(addrs[mid:], blocks, depth + 1),
+        ]
+
+    def _goto(self, addr: int) -> List[str]:
+        if self.start <= addr < self.end and self.decoded[addr >> 2] is not None:
+            return [f'block = {addr}', 'continue']
+        return self._exit(addr)
+
+    @staticmethod
+    def _exit(addr: int) -> List[str]:
+        return [WRITE_BACK, f'amx.CIP = {addr}', 'return']
+
+    def _translate(self, d: DecodedInstruction) -> Tuple[List[str], bool]:
+        """Translate an instruction into lines of Python, and whether it ends its block"""
+        method = d.instr.method
+        if not self._is_supported(d):
+            # Deopt: let the interpreter execute this instruction
+            return self._exit(d.addr), True
+
+        args = [self._param(d, i) for i in range(len(d.params))]
+        if method in _REGISTER_OPS:
+            template = _REGISTER_OPS[method]
+            return (template.format(*(a.expr for a in args)).split('\n') if template else []), False
+        if method in _MEMORY_OPS:
+            return _MEMORY_OPS[method](*args), False
+
+        if method in _JUMP_CONDITIONS:
+            cond = _JUMP_CONDITIONS[method]
+            target = d.params[0]
+            if cond is None:
+                return self._goto(target), True
+            return [f'if {cond}:', *('    ' + line for line in self._goto(target))], False
+
+        if method == 'switch':
+            cases, default = self._read_case_table(d)
+            name = f'cases_{d.addr:x}'
+            self.namespace[name] = cases
+            return [f'block = {name}.get(PRI, {default})', 'continue'], True
+
+        if method == 'bounds':
+            limit = d.params[0]
+            return [
+                f'if PRI & 0xffffffff > {limit}:',
+                '    ' + WRITE_BACK,
+                f'    sync(amx, {d.addr})',
+                f'    amx.report_out_of_bounds_error(PRI, {limit})',
+            ], False
+
+        if method == 'call':
+            target = d.params[0]
+            return [
+                WRITE_BACK,
+                f'sync(amx, {d.addr})',
+                f'amx._push_frame(addr={target}, return_addr={d.next_cip})',
+                f'amx.CIP = {target}',
+                'return',
+            ], True
+
+        if method == 'retn':
+            return [WRITE_BACK, 'instructions.retn(amx)', 'return'], True
+
+        if method == 'sysreq_n':
+            native_index, num_params = d.params
+            return [
+                WRITE_BACK,
+                f'sync(amx, {d.addr})',
+                f'amx.CIP = {d.next_cip}',
+                f'amx._push({num_params})',
+                f'PRI = amx._nativecall({native_index}, amx.STK)',
+                f'STK = amx.STK = amx.STK + {(num_params + 1) * CELL_SIZE}',
+                # Natives may re-enter the plug-in, which leaves ALT clobbered
+                'ALT, FRM = amx.ALT, amx.FRM',
+            ], False
+
+        # Call out to the SMXInstructions handler
+        handler_name = f'handler_{method}'
+        self.namespace[handler_name] = d.handler
+        return [
+            WRITE_BACK,
+            f'sync(amx, {d.addr})',
+            f'amx.CIP = {d.next_cip}',
+            f'{handler_name}({", ".join(["instructions", "amx", *(a.expr for a in args)])})',
+            RELOAD,
+        ], False
+
+    @staticmethod
+    def _param(d: DecodedInstruction, i: int) -> _Addr:
+        value = d.params[i]
+        if i in d.stack_params:
+            expr = f'FRM + {value}' if value >= 0 else f'FRM - {-value}'
+            return _Addr(expr, None, value % CELL_SIZE == 0)
+        return _Addr(str(value), value, value % CELL_SIZE == 0)
+
+
+def _dynamic(expr: str) -> _Addr:
+    return _Addr(expr, None, False)
+
+
+def _load(target: str, addr: _Addr) -> List[str]:
+    if addr.const is not None and addr.const >= 0 and addr.aligned:
+        return [f'{target} = C[{addr.const >> 2}]']
+    if addr.const is None and addr.aligned:
+        return [f'{target} = C[({addr.expr}) >> 2]']
+    return [
+        f'_a = {addr.expr}',
+        f'{target} = C[_a >> 2] if not _a & 3 and _a >= 0 else load(_a)',
+    ]
+
+
+def _cell(value: str) -> str:
+    """Expression truncating a value to 32 bits, as memory views won't store out-of-range ints"""
+    try:
+        return str(wrap_cell(int(value)))
+    except ValueError:
+        pass
+    if value in ('STK', 'FRM'):
+        return value
+    return f'({value} if -0x80000000 <= {value} <= 0x7fffffff else wrap_cell({value}))'
+
+
+def _store(addr: _Addr, value: str) -> List[str]:
+    # NOTE: bounds checks mirror SourcePawnAbstractMachine._throw_if_bad_addr
+    value = _cell(value)
+    if addr.const is not None:
+        if addr.const < 0:
+            return [f'bad_address({addr.const})']
+        lines = [f'if amx.HEA <= {addr.const} < STK or {addr.const} >= STP: bad_address({addr.const})']
+        if addr.aligned:
+            return lines + [f'C[{addr.const >> 2}] = {value}']
+        return lines + [f'write_unaligned(amx, {addr.const}, {value})']
+
+    lines = [
+        f'_a = {addr.expr}',
+        'if _a < 0 or amx.HEA <= _a < STK or _a >= STP: bad_address(_a)',
+    ]
+    if addr.aligned:
+        return lines + [f'C[_a >> 2] = {value}']
+    return lines + [
+        'if _a & 3: write_unaligned(amx, _a, %s)' % value,
+        'else: C[_a >> 2] = %s' % value,
+    ]
+
+
+def _push(*values: str, loaded: bool = False) -> List[str]:
+    """
+    :param loaded:
+        Whether the values were just loaded from memory (and so need no truncation)
+    """
+    lines = []
+    for value in values:
+        lines += [
+            'STK -= 4',
+            'if STK < 0 or STK >= STP: bad_address(STK)',
+            f'C[STK >> 2] = {value if loaded else _cell(value)}',
+        ]
+    return lines
+
+
+def _push_loads(*addrs: _Addr) -> List[str]:
+    # All values are read before any are pushed, like the interpreter
+    lines = []
+    for i, addr in enumerate(addrs):
+        lines += _load(f'_v{i}', addr)
+    return lines + _push(*(f'_v{i}' for i in range(len(addrs))), loaded=True)
+
+
+def _inc_dec(delta: str) -> Callable[[_Addr], List[str]]:
+    def translate(addr: _Addr) -> List[str]:
+        if addr.const is None:
+            # Evaluate address expressions only once
+            return [f'_b = {addr.expr}'] + _load('_v', _dynamic('_b')) + _store(_dynamic('_b'), f'_v {delta}')
+        return _load('_v', addr) + _store(addr, f'_v {delta}')
+    return translate
+
+
+#: Opcodes which only touch registers, as templates formatted with their params (empty for no-ops)
+_REGISTER_OPS: Dict[str, str] = {
+    'proc': '',
+    'endproc': '',
+    'nop': '',
+    'break_': '',
+    'casetbl': '',
+    'const_pri': 'PRI = {0}',
+    'const_alt': 'ALT = {0}',
+    'addr_pri': 'PRI = {0}',
+    'addr_alt': 'ALT = {0}',
+    'move_pri': 'PRI = ALT',
+    'move_alt': 'ALT = PRI',
+    'xchg': 'PRI, ALT = ALT, PRI',
+    'idxaddr': 'PRI = PRI * 4 + ALT',
+    'idxaddr_b': 'PRI = (PRI << {0}) + ALT',
+    'stack': 'ALT = STK\nSTK += {0}',
+    'shl': 'PRI <<= ALT',
+    'shr': 'PRI = (PRI & 0xffffffff) >> ALT',
+    'sshr': 'PRI >>= ALT',
+    'shl_c_pri': 'PRI <<= {0}',
+    'shl_c_alt': 'ALT <<= {0}',
+    'smul': 'PRI *= ALT',
+    'smul_c': 'PRI *= {0}',
+    'add': 'PRI += ALT',
+    'add_c': 'PRI += {0}',
+    'sub': 'PRI = PRI - ALT',
+    'sub_alt': 'PRI = ALT - PRI',
+    'and_': 'PRI &= ALT',
+    'or_': 'PRI |= ALT',
+    'xor': 'PRI ^= ALT',
+    'not_': 'PRI = not PRI',
+    'neg': 'PRI = -PRI',
+    'invert': 'PRI = ~PRI',
+    'zero_pri': 'PRI = 0',
+    'zero_alt': 'ALT = 0',
+    'eq': 'PRI = 1 if PRI == ALT else 0',
+    'neq': 'PRI = 1 if PRI != ALT else 0',
+    'sless': 'PRI = 1 if PRI < ALT else 0',
+    'sleq': 'PRI = 1 if PRI <= ALT else 0',
+    'sgrtr': 'PRI = 1 if PRI > ALT else 0',
+    'sgeq': 'PRI = 1 if PRI >= ALT else 0',
+    'eq_c_pri': 'PRI = 1 if PRI == {0} else 0',
+    'eq_c_alt': 'PRI = 1 if ALT == {0} else 0',
+    'inc_pri': 'PRI += 1',
+    'inc_alt': 'ALT += 1',
+    'dec_pri': 'PRI -= 1',
+    'dec_alt': 'ALT -= 1',
+    'stradjust_pri': 'PRI = (PRI + 4) << 2',
+}
+
+#: Opcodes which touch memory, as functions receiving their params and returning lines of Python
+_MEMORY_OPS: Dict[str, Callable[..., List[str]]] = {
+    'load_pri': lambda addr: _load('PRI', addr),
+    'load_alt': lambda addr: _load('ALT', addr),
+    'load_s_pri': lambda offs: _load('PRI', offs),
+    'load_s_alt': lambda offs: _load('ALT', offs),
+    'lref_s_pri': lambda offs: _load('_v', offs) + _load('PRI', _dynamic('_v')),
+    'lref_s_alt': lambda offs: _load('_v', offs) + _load('ALT', _dynamic('_v')),
+    'load_i': lambda: _load('PRI', _dynamic('PRI')),
+    'lidx': lambda: _load('PRI', _dynamic('PRI + 4 + ALT')),
+    'lidx_b': lambda shift: _load('PRI', _dynamic(f'(PRI << {shift.expr}) + ALT')),
+    'load_both': lambda pri, alt: _load('PRI', pri) + _load('ALT', alt),
+    'load_s_both': lambda pri, alt: _load('PRI', pri) + _load('ALT', alt),
+    'stor_pri': lambda addr: _store(addr, 'PRI'),
+    'stor_alt': lambda addr: _store(addr, 'ALT'),
+    'stor_s_pri': lambda offs: _store(offs, 'PRI'),
+    'stor_s_alt': lambda offs: _store(offs, 'ALT'),
+    'sref_s_pri': lambda offs: _load('_v', offs) + _store(_dynamic('_v'), 'PRI'),
+    'sref_s_alt': lambda offs: _load('_v', offs) + _store(_dynamic('_v'), 'ALT'),
+    'stor_i': lambda: _store(_dynamic('ALT'), 'PRI'),
+    'zero': lambda addr: _store(addr, '0'),
+    'zero_s': lambda offs: _store(offs, '0'),
+    'const_': lambda addr, val: _store(addr, val.expr),
+    'const_s': lambda offs, val: _store(offs, val.expr),
+    'inc': _inc_dec('+ 1'),
+    'inc_s': _inc_dec('+ 1'),
+    'inc_i': lambda: _inc_dec('+ 1')(_dynamic('PRI')),
+    'dec': _inc_dec('- 1'),
+    'dec_s': _inc_dec('- 1'),
+    'dec_i': lambda: _inc_dec('- 1')(_dynamic('PRI')),
+    'push_pri': lambda: _push('PRI'),
+    'push_alt': lambda: _push('ALT'),
+    'pop_pri': lambda: ['PRI = C[STK >> 2]', 'STK += 4'],
+    'pop_alt': lambda: ['ALT = C[STK >> 2]', 'STK += 4'],
+    'swap_pri': lambda: ['_v = C[STK >> 2]', *_store(_Addr('STK', None, True), 'PRI'), 'PRI = _v'],
+    'swap_alt': lambda: ['_v = C[STK >> 2]', *_store(_Addr('STK', None, True), 'ALT'), 'ALT = _v'],
+    **{
+        f'push{n}_c': lambda *vals: _push(*(v.expr for v in vals))
+        for n in ('', '2', '3', '4', '5')
+    },
+    **{
+        f'push{n}_adr': lambda *offsets: _push(*(o.expr for o in offsets))
+        for n in ('', '2', '3', '4', '5')
+    },
+    **{f'push{n}': _push_loads for n in ('', '2', '3', '4', '5')},
+    **{f'push{n}_s': _push_loads for n in ('', '2', '3', '4', '5')},
+}
+
+#: Conditions under which each jump is taken (None for unconditional)
+_JUMP_CONDITIONS: Dict[str, str | None] = {
+    'jump': None,
+    'jzer': 'PRI == 0',
+    'jnz': 'PRI != 0',
+    'jeq': 'PRI == ALT',
+    'jneq': 'PRI != ALT',
+    'jsless': 'PRI < ALT',
+    'jsleq': 'PRI <= ALT',
+    'jsgrtr': 'PRI > ALT',
+    'jsgeq': 'PRI >= ALT',
+}
+
+#: Opcodes with dedicated translations, which leave compiled code or can fault
+_EXITS = {'call', 'retn', 'switch', 'bounds', 'sysreq_n'}
+
+#: Opcodes executed by calling their SMXInstructions handler from compiled code
+_CALLOUTS = {
+    'lodb_i',
+    'strb_i',
+    'sdiv',
+    'sdiv_alt',
+    'movs',
+    'fill',
+    'heap',
+    'genarray',
+    'genarray_z',
+    'initarray_pri',
+    'initarray_alt',
+    'heap_save',
+    'heap_restore',
+    'sysreq_c',
+}
@@ -0,0 +1,163 @@
+# Fans out calls of a plug-in's public functions across forked worker processes
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple, TYPE_CHECKING
+
+from smx.exceptions import SourcePawnPluginError, SourcePawnRuntimeError, SourcePawnWorkerError
+from smx.interfaces import CallableReturnValue
+
+if TYPE_CHECKING:
+    from smx.runtime import SourcePawnPluginRuntime
+    from smx.vm import AmxSnapshot
+
+__all__ = [
+    'PluginPool',
+]
+
+# Runtimes (and the snapshots each call is made from) of all open pools, by pool ID.
+# Forked workers inherit this, and find their runtime in it, rather than unpickling it.
+_pool_states: Dict[int, Tuple[SourcePawnPluginRuntime, AmxSnapshot | None]] = {}
+_pool_ids = itertools.count()
+
+# The runtime of the current worker process, and the snapshot restored before each call
+_worker_runtime: SourcePawnPluginRuntime | None = None
+_worker_snapshot: AmxSnapshot | None = None
+
+
+class PluginPool:
+    """Process pool calling the public functions of a plug-in loaded in this process
+
+    Workers are forked from this process, inheriting the runtime as it was when the
+    pool was created: the plug-in is parsed and its AMX initialized only once (run
+    OnPluginStart before creating the pool, if need be). As the "fork" start method
+    is required, pools are unavailable on Windows.
+
+        >>> runtime.run()
+        >>> with PluginPool(runtime) as pool:
+        ...     for rval, args in pool.map('IsPrime', [(n,) for n in range(100_000)], chunksize=256):
+        ...         ...
+
+    """
+
+    def __init__(
+        self,
+        runtime: SourcePawnPluginRuntime,
+        processes: int | None = None,
+        *,
+        reset: bool = True,
+    ):
+        """
+        :param runtime:
+            Runtime whose plug-in's functions will be called
+
+        :param processes:
+            Number of worker processes. Defaults to the number of CPUs.
+
+        :param reset:
+            Whether to restore each worker's AMX to the runtime's state at pool creation
+            before every call (see `SourcePawnAbstractMachine.snapshot()`), so results
+            don't depend on which calls a worker happened to run before. Otherwise, calls
+            see the effects of the calls before them in the same worker.
+
+        """
+        if not runtime.amx.initialized:
+            runtime.amx.init()
+
+        self.runtime = runtime
+        self.reset = reset
+
+        # NOTE: the snapshot is taken here, rather than in each worker, so that errors
+        #       (e.g. handles which can't be copied) are raised to the caller
+        snapshot = runtime.amx.snapshot() if reset else None
+
+        self._id = next(_pool_ids)
+        _pool_states[self._id] = (runtime, snapshot)
+
+        try:
+            context = multiprocessing.get_context('fork')
+            self._pool = context.Pool(processes, initializer=_init_worker, initargs=(self._id,))
+        except BaseException:
+            del _pool_states[self._id]
+            raise
+
+    def __enter__(self) -> PluginPool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def map(
+        self,
+        name: str,
+        args: Iterable[Sequence[Any]],
+        *,
+        ordered: bool = True,
+        chunksize: int = 1,
+    ) -> Iterator[CallableReturnValue]:
+        """Call the public function `name` with each sequence of args, yielding results as they arrive
+
+        Each result is a CallableReturnValue of the function's return value, and the
+        values of its by-ref args after the call.
+
+        :param name:
+            Name of the public function to call
+
+        :param args:
+            Args of each call. This may be a lazy iterable; calls are dispatched as it's consumed.
+
+        :param ordered:
+            Whether to yield results in the order of `args`. Otherwise, they're yielded as
+            soon as each completes.
+
+        :param chunksize:
+            Number of calls sent to a worker at a time. Larger chunks cut the overhead of
+            inter-process communication, when calls are short.
+
+        """
+        if self.runtime.get_function_by_name(name) is None:
+            raise ValueError(f'{name!r} is not a valid public function name')
+
+        tasks = ((name, tuple(call_args)) for call_args in args)
+        imap = self._pool.imap if ordered else self._pool.imap_unordered
+        return imap(_call_in_worker, tasks, chunksize)
+
+    def close(self) -> None:
+        """Wait for all dispatched calls to complete, then stop the workers"""
+        self._pool.close()
+        self._pool.join()
+        _pool_states.pop(self._id, None)
+
+    def terminate(self) -> None:
+        """Stop the workers immediately, abandoning any outstanding calls"""
+        self._pool.terminate()
+        self._pool.join()
+        _pool_states.pop(self._id, None)
+
+
+def _init_worker(pool_id: int) -> None:
+    global _worker_runtime, _worker_snapshot
+    _worker_runtime, _worker_snapshot = _pool_states[pool_id]
+
+
+def _call_in_worker(task: Tuple[str, Tuple[Any, ...]]) -> CallableReturnValue:
+    name, args = task
+
+    runtime = _worker_runtime
+    if _worker_snapshot is not None:
+        runtime.amx.restore(_worker_snapshot)
+
+    func = runtime.get_function_by_name(name)
+    try:
+        call_rval, _ = func.call(*args)
+    except SourcePawnRuntimeError as e:
+        # NOTE: runtime errors reference the AMX, which can't be pickled back to the parent
+        raise SourcePawnWorkerError(e.debug_output()) from None
+    except SourcePawnPluginError as e:
+        raise SourcePawnWorkerError(f'{type(e).__name__}: {e}') from None
+
+    return call_rval
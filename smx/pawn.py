@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
-import itertools
-from ctypes import addressof, c_uint16, c_uint32, c_uint8, memmove, memset, sizeof
+import struct
+from ctypes import sizeof
 from typing import List, TYPE_CHECKING
 
-from smx.definitions import cell
+from smx.definitions import cell, wrap_cell
 from smx.errors import SourcePawnErrorCode
 from smx.exceptions import SourcePawnOpcodeDeprecated, SourcePawnOpcodeNotGenerated, SourcePawnOpcodeNotSupported
 
@@ -61,15 +61,11 @@ class SMXInstructions:
         amx._push(num_params)
         amx.PRI = amx._nativecall(native_index, amx.STK)
         amx.STK += (num_params + 1) * sizeof(cell)  # +1 to remove number of params
-        # keep our Python stack in check
-        amx._filter_stack(amx.STK)
 
         return amx.PRI
 
     def sysreq_c(self, amx: SourcePawnAbstractMachine, native_index: int):
         rval = amx._nativecall(native_index, amx.STK)
-        # keep our Python stack in check
-        amx._filter_stack(amx.STK)
         return rval
 
     def call(self, amx: SourcePawnAbstractMachine, addr: int):
@@ -86,7 +82,6 @@ class SMXInstructions:
         # Remove params
         num_params = amx._pop()
         amx.STK += num_params * sizeof(cell)
-        amx._filter_stack(amx.STK)
 
         return amx.PRI
 
@@ -102,8 +97,8 @@ class SMXInstructions:
         return amx.ALT
 
     def zero(self, amx: SourcePawnAbstractMachine, offs: int):
-        amx._writeheap(offs, amx.ZERO)
-        return amx.ZERO
+        amx._writeheap(offs, 0)
+        return 0
 
     def break_(self, amx: SourcePawnAbstractMachine):
         # TODO
@@ -139,59 +134,53 @@ class SMXInstructions:
         return amx.ALT
 
     def stor_pri(self, amx: SourcePawnAbstractMachine, addr: int):
-        amx._writeheap(addr, cell(amx.PRI))
+        amx._writeheap(addr, amx.PRI)
         return amx.PRI
 
     def stor_alt(self, amx: SourcePawnAbstractMachine, addr: int):
-        amx._writeheap(addr, cell(amx.ALT))
+        amx._writeheap(addr, amx.ALT)
         return amx.ALT
 
     def stor_s_pri(self, amx: SourcePawnAbstractMachine, addr: int):
-        val = cell(amx.PRI)
-        amx._writeheap(addr, val)
-        # Keep our Python stack list updated
-        amx._stack_set(addr, val)
+        amx._writeheap(addr, amx.PRI)
         return amx.PRI
 
     def stor_s_alt(self, amx: SourcePawnAbstractMachine, addr: int):
-        val = cell(amx.ALT)
-        amx._writeheap(addr, val)
-        # Keep our Python stack list updated
-        amx._stack_set(addr, val)
+        amx._writeheap(addr, amx.ALT)
         return amx.ALT
 
     def sref_pri(self, amx: SourcePawnAbstractMachine, offs: int):
         ref = amx._getheapcell(offs)
-        amx._writeheap(ref, cell(amx.PRI))
+        amx._writeheap(ref, amx.PRI)
         return amx.PRI
 
     def sref_alt(self, amx: SourcePawnAbstractMachine, offs: int):
         ref = amx._getheapcell(offs)
-        amx._writeheap(ref, cell(amx.ALT))
+        amx._writeheap(ref, amx.ALT)
         return amx.ALT
 
     def sref_s_pri(self, amx: SourcePawnAbstractMachine, offs: int):
         ref = amx._getheapcell(offs)
-        amx._writeheap(ref, cell(amx.PRI))
+        amx._writeheap(ref, amx.PRI)
         return amx.PRI
 
     def sref_s_alt(self, amx: SourcePawnAbstractMachine, offs: int):
         ref = amx._getheapcell(offs)
-        amx._writeheap(ref, cell(amx.ALT))
+        amx._writeheap(ref, amx.ALT)
         return amx.ALT
 
     def stor_i(self, amx: SourcePawnAbstractMachine):
-        amx._writeheap(amx.ALT, cell(amx.PRI))
+        amx._writeheap(amx.ALT, amx.PRI)
         return amx.PRI
 
     def strb_i(self, amx: SourcePawnAbstractMachine, number: int):
         # TODO: memory checking
         if number == 1:
-            amx._writeheap(amx.ALT, c_uint8(amx.PRI))
+            amx._writeheapbyte(amx.ALT, amx.PRI)
         elif number == 2:
-            amx._writeheap(amx.ALT, c_uint16(amx.PRI))
+            amx._writeheapshort(amx.ALT, amx.PRI)
         elif number == 4:
-            amx._writeheap(amx.ALT, c_uint32(amx.PRI))
+            amx._writeheap(amx.ALT, amx.PRI)
 
         return amx.PRI
 
@@ -244,8 +233,6 @@ class SMXInstructions:
     def stack(self, amx: SourcePawnAbstractMachine, offs: int):
         amx.ALT = amx.STK
         amx.STK += offs
-        # Keep our Python stack list up to date
-        amx._filter_stack(amx.STK)
         # TODO: CHKMARGIN CHKHEAP
         return amx.ALT
 
@@ -411,7 +398,7 @@ class SMXInstructions:
         return amx.PRI
 
     def zero_s(self, amx: SourcePawnAbstractMachine, offs: int):
-        amx._writeheap(offs, cell(0))
+        amx._writeheap(offs, 0)
         return 0
 
     def sign_pri(self, amx: SourcePawnAbstractMachine):
@@ -464,20 +451,19 @@ class SMXInstructions:
 
     def inc(self, amx: SourcePawnAbstractMachine, addr: int):
         val = amx._getheapcell(addr) + 1
-        amx._writeheap(addr, cell(val))
+        amx._writeheap(addr, val)
         return val
 
     def inc_s(self, amx: SourcePawnAbstractMachine, addr: int):
         val = amx._getheapcell(addr) + 1
-        amx._writeheap(addr, cell(val))
-        amx._stack_set(addr, cell(val))
+        amx._writeheap(addr, val)
         return val
 
     def inc_i(self, amx: SourcePawnAbstractMachine):
         # XXX(zk): does PRI need to be interpreted as ucell?
         offs = amx.PRI
         val = amx._getheapcell(offs) + 1
-        amx._writeheap(offs, cell(val))
+        amx._writeheap(offs, val)
         return val
 
     # Decrementation
@@ -491,32 +477,31 @@ class SMXInstructions:
 
     def dec(self, amx: SourcePawnAbstractMachine, addr: int):
         val = amx._getheapcell(addr) - 1
-        amx._writeheap(addr, cell(val))
+        amx._writeheap(addr, val)
         return val
 
     def dec_s(self, amx: SourcePawnAbstractMachine, addr: int):
-        val = cell(amx._getheapcell(addr) - 1)
+        val = amx._getheapcell(addr) - 1
         amx._writeheap(addr, val)
-        amx._stack_set(addr, val)
         return val
 
     def dec_i(self, amx: SourcePawnAbstractMachine):
         # XXX(zk): does PRI need to be interpreted as ucell?
         offs = amx.PRI
         val = amx._getheapcell(offs) - 1
-        amx._writeheap(offs, cell(val))
+        amx._writeheap(offs, val)
         return val
 
     def movs(self, amx: SourcePawnAbstractMachine, num_bytes: int):
-        dest = amx._throw_if_bad_addr(amx.ALT)
-        source = amx._throw_if_bad_addr(amx.PRI)
-        memmove(dest, source, num_bytes)
-        return amx.heap[amx.ALT:][:num_bytes]
+        amx._throw_if_bad_addr(amx.PRI)
+        source = amx.mem[amx.PRI:amx.PRI + num_bytes]
+        amx._writeheapbytes(amx.ALT, source)
+        return bytes(amx.mem[amx.ALT:amx.ALT + num_bytes])
 
     def fill(self, amx: SourcePawnAbstractMachine, offs: int):
         i = amx.ALT
         while offs >= sizeof(cell):
-            amx._writeheap(i, cell(amx.PRI))
+            amx._writeheap(i, amx.PRI)
             i += sizeof(cell)
             offs -= sizeof(cell)
 
@@ -534,43 +519,26 @@ class SMXInstructions:
             amx.report_out_of_bounds_error(amx.PRI, limit)
 
     def switch(self, amx: SourcePawnAbstractMachine, casetbl_addr: int):
-        cptr = casetbl_addr + sizeof(cell)  # skip actual instr
-        num_cases = amx._readcodecell(cptr)
+        # Case tables are decoded once, at load time
+        table = amx.plugin.case_tables.get(casetbl_addr)
+        if table is None:
+            amx.report_error(SourcePawnErrorCode.INVALID_INSTRUCTION)
 
-        cptr += sizeof(cell)
-        default_case_addr = amx._readcodecell(cptr)
-
-        # After casetbl's args, all cases are defined
-        cptr += sizeof(cell)
-
-        # TODO: assert amx.CIP == OP_CASETBL
-        # preset to none-matched case
-        amx.CIP = default_case_addr
-
-        # number of records in the case table
-        i = num_cases
-
-        # Check each case
-        while i > 0 and amx._readcodecell(cptr) != amx.PRI:
-            i -= 1
-            cptr += sizeof(cell) * 2
-
-        if i > 0:
-            amx.CIP = amx._jumprel(cptr + sizeof(cell))  # case found
-            return amx.CIP
+        amx.CIP = table.cases.get(amx.PRI, table.default)
+        return amx.CIP
 
     def casetbl(self, amx: SourcePawnAbstractMachine, num_cases: int, addr: int):
         pass
 
     def swap_pri(self, amx: SourcePawnAbstractMachine):
         offs = amx._getheapcell(amx.STK)
-        amx._writeheap(amx.STK, cell(amx.PRI))
+        amx._writeheap(amx.STK, amx.PRI)
         amx.PRI = offs
         return amx.PRI
 
     def swap_alt(self, amx: SourcePawnAbstractMachine):
         offs = amx._getheapcell(amx.STK)
-        amx._writeheap(amx.STK, cell(amx.ALT))
+        amx._writeheap(amx.STK, amx.ALT)
         amx.ALT = offs
         return amx.ALT
 
@@ -605,7 +573,7 @@ class SMXInstructions:
     load_s_both = load_both
 
     def const_(self, amx: SourcePawnAbstractMachine, offs: int, val: int):
-        amx._writeheap(offs, cell(val))
+        amx._writeheap(offs, val)
         return val
 
     const_s = const_
@@ -712,8 +680,7 @@ class SMXInstructions:
             amx._pop()
 
         # Output the base address of the array
-        amx._writestack(cell(base_addr))
-        amx._stack_set(amx.STK, cell(base_addr))
+        amx._writestack(base_addr)
 
         return base_addr
 
@@ -759,28 +726,20 @@ class SMXInstructions:
             tpl_iv_vec_addr = dat_addr
             tpl_data_vec_addr = tpl_iv_vec_addr + iv_size_bytes
 
-            tpl_iv_vec = (cell * iv_size).from_buffer_copy(
-                amx.data[tpl_iv_vec_addr:tpl_iv_vec_addr + iv_size_bytes]
-            )
+            tpl_iv_vec = memoryview(amx.data[tpl_iv_vec_addr:tpl_iv_vec_addr + iv_size_bytes]).cast('i')
             for i, offset in enumerate(tpl_iv_vec):
-                amx._writeheap(iv_vec_addr + i * sizeof(cell), cell(offset + array_addr))
+                amx._writeheap(iv_vec_addr + i * sizeof(cell), offset + array_addr)
 
-            tpl_data_vec = (cell * data_copy_size).from_buffer_copy(
-                amx.data[tpl_data_vec_addr:tpl_data_vec_addr + data_copy_size_bytes]
-            )
-            amx._writeheap(data_vec_addr, tpl_data_vec)
+            tpl_data_vec = amx.data[tpl_data_vec_addr:tpl_data_vec_addr + data_copy_size_bytes]
+            amx._writeheapbytes(data_vec_addr, tpl_data_vec)
 
         if data_fill_size:
             fill_pos = data_vec_addr + data_copy_size_bytes
-            fill_vec_type = cell * data_fill_size
-            if fill_value:
-                fill_vec = fill_vec_type(*itertools.repeat(cell(fill_value), data_fill_size))
-            else:
-                fill_vec = fill_vec_type()
-            amx._writeheap(fill_pos, fill_vec)
+            fill_vec = struct.pack('<i', wrap_cell(fill_value)) * data_fill_size
+            amx._writeheapbytes(fill_pos, fill_vec)
 
-        array = (cell * data_copy_size).from_address(addressof(amx.heap) + data_vec_addr + data_copy_size_bytes)
-        return bytes(array)
+        array_pos = data_vec_addr + data_copy_size_bytes
+        return bytes(amx.mem[array_pos:array_pos + data_copy_size_bytes])
 
     def initarray_pri(self, amx: SourcePawnAbstractMachine, *args):
         return self._initarray(amx, True, *args)
@@ -830,3 +789,84 @@ class SMXInstructions:
 
     def floatcmp(self, amx: SourcePawnAbstractMachine):
         raise NotImplementedError
+
+    ###
+    # Superinstructions
+    #
+    # Fused handlers for sequences of opcodes spcomp commonly emits back-to-back.
+    # They're named after their constituents, joined by double underscores, and
+    # take the params of each constituent, in order. See smx.decoder.SUPERINSTRUCTIONS
+    #
+
+    def load_pri__push_pri(self, amx: SourcePawnAbstractMachine, offs: int):
+        amx.PRI = val = amx._getheapcell(offs)
+        amx._push(val)
+        return val
+
+    def load_s_pri__push_pri(self, amx: SourcePawnAbstractMachine, offs: int):
+        amx.PRI = val = amx._getheapcell(offs)
+        amx._push(val)
+        return val
+
+    def load_i__push_pri(self, amx: SourcePawnAbstractMachine):
+        amx.PRI = val = amx._getheapcell(amx.PRI)
+        amx._push(val)
+        return val
+
+    def const_pri__push_pri(self, amx: SourcePawnAbstractMachine, val: int):
+        amx.PRI = val
+        amx._push(val)
+        return val
+
+    def addr_pri__push_pri(self, amx: SourcePawnAbstractMachine, val: int):
+        amx.PRI = val
+        amx._push(val)
+        return val
+
+    def move_pri__push_pri(self, amx: SourcePawnAbstractMachine):
+        amx.PRI = val = amx.ALT
+        amx._push(val)
+        return val
+
+    def push_pri__push_c(self, amx: SourcePawnAbstractMachine, val: int):
+        amx._push(amx.PRI)
+        amx._push(val)
+        return val
+
+    def add_c__load_i(self, amx: SourcePawnAbstractMachine, value: int):
+        amx.PRI = amx._getheapcell(amx.PRI + value)
+        return amx.PRI
+
+    def load_s_pri__jzer(self, amx: SourcePawnAbstractMachine, offs: int, addr: int):
+        amx.PRI = amx._getheapcell(offs)
+        if amx.PRI == 0:
+            amx.CIP = addr
+            return amx.CIP
+
+    def load_s_pri__jnz(self, amx: SourcePawnAbstractMachine, offs: int, addr: int):
+        amx.PRI = amx._getheapcell(offs)
+        if amx.PRI != 0:
+            amx.CIP = addr
+            return amx.CIP
+
+    def pop_alt__jsless(self, amx: SourcePawnAbstractMachine, addr: int):
+        amx.ALT = amx._pop()
+        if amx.PRI < amx.ALT:
+            amx.CIP = addr
+            return amx.CIP
+
+    def push_c__call(self, amx: SourcePawnAbstractMachine, val: int, addr: int):
+        amx._push(val)
+        self.call(amx, addr)
+
+    def push_pri__sysreq_n(self, amx: SourcePawnAbstractMachine, native_index: int, num_params: int):
+        amx._push(amx.PRI)
+        return self.sysreq_n(amx, native_index, num_params)
+
+    def zero_pri__retn(self, amx: SourcePawnAbstractMachine):
+        amx.PRI = 0
+        return self.retn(amx)
+
+    def load_pri__retn(self, amx: SourcePawnAbstractMachine, offs: int):
+        amx.PRI = amx._getheapcell(offs)
+        return self.retn(amx)
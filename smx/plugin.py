@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import logging
+import mmap
 import zlib
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
-from ctypes import c_char_p
-from typing import BinaryIO, Dict, List
-
-import more_bisect
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Sequence
 
+import smx.cache
+import smx.jit
 import smx.runtime
+import smx.threaded
+from smx.compat import cached_property
+from smx.decoder import CaseTable, decode_case_tables, decode_code, DecodedInstruction, fuse_superinstructions
 from smx.definitions import (
     Myinfo,
     RTTI_TYPE_ID_COMPLEX,
@@ -31,22 +39,25 @@ from smx.definitions import (
     SP_CODEVERS_MINIMUM,
     SP_FLAG_DEBUG, SP_NATIVE_UNBOUND,
     SPCodeFeature,
-    SPFdbgFile,
+    SPFDBG_ARRAYDIM_RECORD,
+    SPFDBG_FILE_RECORD,
+    SPFDBG_LINE_RECORD,
+    SPFDBG_SYMBOL_RECORD,
+    SPFdbgArrayDim,
     SPFdbgInfo,
-    SPFdbgLine,
     SPFdbgNative, SPFdbgNtvTab,
-    SPFdbgSymbol,
+    SPFILE_CODE_RECORD,
     SPFILE_COMPRESSION_GZ,
     SPFILE_COMPRESSION_NONE,
+    SPFILE_DATA_RECORD,
+    SPFILE_HDR_RECORD,
     SPFILE_MAGIC,
-    SPFileCode,
-    SPFileData,
-    SPFileHdr,
-    SPFileNatives,
-    SPFilePublics,
-    SPFilePubvars,
+    SPFILE_NATIVES_RECORD,
+    SPFILE_PUBLICS_RECORD,
+    SPFILE_PUBVARS_RECORD,
+    SPFILE_SECTION_RECORD,
+    SPFILE_TAG_RECORD,
     SPFileSection,
-    SPFileTag,
 )
 from smx.exceptions import SourcePawnPluginError, SourcePawnPluginFormatError, SourcePawnPluginNativeError
 from smx.reader import (
@@ -58,6 +69,8 @@ from smx.reader import (
     PCode,
     Public,
     Pubvar,
+    read_cells,
+    read_cstring,
     RTTIClassDef,
     RTTIDbgVar,
     RTTIEnum,
@@ -70,33 +83,94 @@ from smx.reader import (
     RTTITypeset,
     Tag,
     TypedSymbol,
+    unpack_records,
 )
 from smx.rtti import parse_type_id, RTTI, RTTIParser
 
+logger = logging.getLogger(__name__)
+
 
 class SourcePawnPlugin:
-    def __init__(self, plugin: str | bytes | BinaryIO, *, filename: str | None = None, **runtime_options):
+    #: Sections decoded when loading in code-only mode; all others (debug info, RTTI, tags) are skipped
+    CODE_ONLY_SECTIONS = frozenset({'.code', '.data', '.publics', '.pubvars', '.natives', '.names'})
+
+    def __init__(
+        self,
+        plugin: str | bytes | BinaryIO,
+        *,
+        filename: str | None = None,
+        code_only: bool = False,
+        cache_dir: str | Path | None = None,
+        **runtime_options,
+    ):
+        """
+        :param plugin:
+            Path or file object of a .smx file, or its contents. Uncompressed .smx files
+            are memory-mapped, not read: the file must not be modified or truncated while
+            the plug-in is loaded. Rewriting it in place changes the loaded code and data,
+            and truncating it crashes the process (SIGBUS). Replace the file instead, e.g.
+            by writing a new one and renaming it over the old with os.replace(). To avoid
+            mapping altogether, pass the file's contents as bytes.
+
+        :param code_only:
+            Load only what's needed to execute the plug-in, skipping debug info, RTTI, and tags.
+            Without these, stack traces and spew lack names and lines, return values are not
+            interpreted as Python types, and functions must be called with push_xyz methods.
+            The threaded and JIT engines also rely on RTTI for function bounds, so they compile
+            little to nothing; use the interpreter with code-only plug-ins.
+
+        :param cache_dir:
+            Directory of .smxc files, caching the decompressed image and decoded code of each
+            plug-in by the SHA-256 of its .smx file. When the cache is warm, the image is
+            memory-mapped from it, and the code section need not be decompressed or scanned.
+            The same constraint as for mapped .smx files applies to .smxc files; pysmx
+            itself only ever replaces them, never rewriting them in place.
+
+        """
         self.runtime_options = runtime_options
+        self.code_only = code_only
+        self.cache_dir = cache_dir
 
         self.name: str = '<unnamed>'
         self.filename: str = '<unknown>'
         self.filled: bool = False
 
-        self.base: bytes | None = None
+        # The uncompressed image: the .smx file itself (bytes, or memory-mapped) if it's
+        # uncompressed, or a bytearray it was inflated into
+        self.base: bytes | bytearray | mmap.mmap | None = None
         self.stringbase: int | None = None
         self.stringtable: Dict[int, str] | None = None
         self.stringtab: int | None = None
+        # Offset to the file proper, after the section headers (compression starts here)
+        self.dataoffs: int | None = None
 
         self.data: int | None = None
         self.datasize: int | None = None
         self.memsize: int | None = None
         self.pcode: PCode | None = None
+        # Views of the code and data sections of `base`, shared by all runtimes of the
+        # plug-in. They must never be written to.
+        self.code_section: memoryview | None = None
+        self.data_section: memoryview | None = None
+        # Pre-decoded instructions, indexed by code cell (i.e. `addr >> 2`)
+        self.decoded_code: List[DecodedInstruction | None] = []
+        self._fused_code: List[DecodedInstruction | None] | None = None
+        # Decoded switch case tables, keyed by the address of their `casetbl` instruction
+        self.case_tables: Dict[int, CaseTable] = {}
+        self._threaded_code: smx.threaded.ThreadedCode | None = None
+        self._jit_code: smx.jit.JitCompiler | None = None
 
         self.features: SPCodeFeature = SPCodeFeature.Deprecated0
         self.is_unpacked: bool = False
 
-        self.tags: Dict[int, Tag] = {}
+        # Section headers by name, from which debug info and RTTI are parsed on first access
+        self.sections: Dict[str, SPFileSection] = {}
+        # All section headers of the image, including those skipped in code-only mode
+        self.image_sections: Dict[str, SPFileSection] = {}
+
         self.inlines: Dict[str, Public] = {}
+        # Publics in file order, indexed by `funcid >> 1`
+        self.publics: List[Public] = []
         self.publics_by_id: Dict[int, Public] = {}
         self.publics_by_name: Dict[str, Public] = {}
         self.publics_by_offs: Dict[int, Public] = {}
@@ -105,45 +179,9 @@ class SourcePawnPlugin:
         self.natives_by_name: Dict[str, Native] = {}
 
         self.rtti_data: bytes | None = None
+        # Parsed on first access, by _load_rtti_dbg_vars()
+        self._rtti_dbg_vars: List[RTTIDbgVar] | None = None
 
-        self.rtti_enums: List[RTTIEnum] = []
-        self.rtti_enums_by_name: Dict[str, RTTIEnum] = {}
-
-        self.rtti_methods: List[RTTIMethod] = []
-        self.rtti_methods_by_name: Dict[str, RTTIMethod] = {}
-        self.rtti_methods_by_addr: Dict[int, RTTIMethod] = {}
-
-        self.rtti_natives: List[RTTINative] = []
-        self.rtti_natives_by_name: Dict[str, RTTINative] = {}
-
-        self.rtti_typedefs: List[RTTITypedef] = []
-        self.rtti_typedefs_by_name: Dict[str, RTTITypedef] = {}
-
-        self.rtti_typesets: List[RTTITypeset] = []
-        self.rtti_typesets_by_name: Dict[str, RTTITypeset] = {}
-
-        self.rtti_enum_struct_fields: List[RTTIEnumStructField] = []
-        self.rtti_enum_structs: List[RTTIEnumStruct] = []
-        self.rtti_enum_structs_by_name: Dict[str, RTTIEnumStruct] = {}
-
-        self.rtti_fields: List[RTTIField] = []
-        self.rtti_class_defs: List[RTTIClassDef] = []
-        self.rtti_class_defs_by_name: Dict[str, RTTIClassDef] = {}
-
-        self.rtti_dbg_vars: List[RTTIDbgVar] = []
-        self.rtti_globals: List[RTTIDbgVar] = []
-        self.rtti_locals: List[RTTIDbgVar] = []
-
-        self.dbg_info: SPFdbgInfo | None = None
-        self.dbg_files: List[DbgFile] = []
-        self.dbg_lines: List[DbgLine] = []
-        self.dbg_symbols: List[DbgSymbol] = []
-        self.dbg_natives: List[SPFdbgNative] = []
-        self.dbg_natives_by_index: Dict[int, SPFdbgNative] = {}
-
-        self.symbols_by_addr: Dict[int, List[TypedSymbol]] = defaultdict(list)
-
-        self.num_tags: int = 0
         self.num_publics: int = 0
         self.num_pubvars: int = 0
         self.num_natives: int = 0
@@ -167,18 +205,58 @@ class SourcePawnPlugin:
     def load(self, plugin: str | bytes | BinaryIO):
         if isinstance(plugin, str):
             with open(plugin, 'rb') as fp:
-                self.extract_from_buffer(fp)
+                self.filename = plugin
+                data = _map_plugin_file(fp)
+        elif isinstance(plugin, bytes):
+            data = plugin
+        else:
+            if isinstance(plugin, io.IOBase) and hasattr(plugin, 'name'):
+                self.filename = plugin.name
+            data = _map_plugin_file(plugin)
+
+        if self.cache_dir is not None:
+            self.load_cached(data)
+        else:
+            self.extract_from_memory(data)
+
+    def load_cached(self, data: bytes | mmap.mmap):
+        """Load the plug-in from its .smxc file in `cache_dir`, writing it first if need be
+
+        :param data:
+            Contents of the plug-in's .smx file
+
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = smx.cache.plugin_cache_path(self.cache_dir, digest)
+
+        cached = smx.cache.read_plugin_cache(path, digest)
+        if cached is not None:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+            self.base = cached.base
+            self.stringtab = cached.stringtab
+            self.dataoffs = cached.dataoffs
+            self.is_unpacked = cached.is_unpacked
+            self.load_image(
+                cached.sections,
+                instruction_starts=cached.instruction_starts,
+                case_tables=cached.case_tables,
+            )
             return
 
-        if isinstance(plugin, bytes):
-            plugin = io.BytesIO(plugin)
+        self.extract_from_memory(data)
 
-        self.extract_from_buffer(plugin)
+        try:
+            smx.cache.write_plugin_cache(path, digest, self)
+        except OSError as e:
+            logger.warning('Unable to write plug-in cache %s: %s', path, e)
 
     @property
     def runtime(self):
+        """The plug-in's default runtime, created on first access"""
         if self._runtime is None:
-            self._runtime = smx.runtime.SourcePawnPluginRuntime(self, **self.runtime_options)
+            self._runtime = self.new_runtime()
         return self._runtime
 
     @runtime.setter
@@ -188,6 +266,41 @@ class SourcePawnPlugin:
     def run(self):
         self.runtime.run()
 
+    def new_runtime(self, **runtime_options) -> smx.runtime.SourcePawnPluginRuntime:
+        """Create a runtime of the plug-in, independent of all its others
+
+        Runtimes share everything loaded from the plug-in's file — its image, decoded
+        and compiled code, RTTI, and debug info — which is never modified after load.
+        Each runtime owns only its memory, SourceMod system (handles, timers, etc.),
+        and bound natives.
+
+        :param runtime_options:
+            Options for SourcePawnPluginRuntime, overriding those the plug-in was created with
+
+        """
+        return smx.runtime.SourcePawnPluginRuntime(self, **{**self.runtime_options, **runtime_options})
+
+    @property
+    def fused_code(self) -> List[DecodedInstruction | None]:
+        """Decoded instructions with common sequences fused into superinstructions, run by the interpreter"""
+        if self._fused_code is None:
+            self._fused_code = fuse_superinstructions(self.decoded_code)
+        return self._fused_code
+
+    @property
+    def threaded_code(self) -> smx.threaded.ThreadedCode:
+        """Closure-compiled code, used by the threaded execution engine"""
+        if self._threaded_code is None:
+            self._threaded_code = smx.threaded.ThreadedCode(self)
+        return self._threaded_code
+
+    @property
+    def jit_code(self) -> smx.jit.JitCompiler:
+        """Compiler of hot functions into Python source, used by the JIT execution engine"""
+        if self._jit_code is None:
+            self._jit_code = smx.jit.JitCompiler(self)
+        return self._jit_code
+
     @property
     def flags(self):
         if self.pcode is None:
@@ -207,13 +320,13 @@ class SourcePawnPlugin:
         return bool(self.features & SPCodeFeature.HeapScopes)
 
     def _get_data_string(self, dataoffset: int) -> str:
-        return c_char_p(self.base[self.data + dataoffset:]).value.decode('utf8')
+        return read_cstring(self.base, self.data + dataoffset).decode('utf8')
 
     def _get_data_char(self, dataoffset: int) -> int:
-        return c_char_p(self.base[self.data + dataoffset:]).value[0]
+        return self.base[self.data + dataoffset]
 
     def _get_string(self, stroffset: int) -> str:
-        return c_char_p(self.base[self.stringbase + stroffset:]).value.decode('utf8')
+        return read_cstring(self.base, self.stringbase + stroffset).decode('utf8')
 
     def rtti_from_type_id(self, type_id: int) -> RTTI | None:
         if self.rtti_data is None:
@@ -260,71 +373,451 @@ class SourcePawnPlugin:
                 return meth
 
     def find_line_by_addr(self, addr: int) -> DbgLine | None:
-        if not self.dbg_lines:
-            return None
-
-        line_idx = more_bisect.last_pos_le(addr, self.dbg_lines, key=lambda line: line.addr)
-        if line_idx is not None:
-            return self.dbg_lines[line_idx]
+        line_idx = bisect_right(self.dbg_line_addrs, addr)
+        if line_idx:
+            return DbgLine(self, self.dbg_line_addrs[line_idx - 1], self.dbg_line_numbers[line_idx - 1])
 
     def find_file_by_addr(self, addr: int) -> DbgFile | None:
-        if not self.dbg_files:
-            return None
+        file_idx = bisect_right(self.dbg_file_addrs, addr)
+        if file_idx:
+            return self.dbg_files[file_idx - 1]
+
+    ###
+    # Debug info and RTTI are parsed from their sections only when first accessed
+    #
+
+    @cached_property
+    def tags(self) -> Dict[int, Tag]:
+        tags = {}
+        if '.tags' in self.sections:
+            sect = self.sections['.tags']
+
+            records = unpack_records(self.base, sect.dataoffs, sect.size, SPFILE_TAG_RECORD)
+            for index, (tag_id, name) in enumerate(records):
+                tags[index] = Tag(self, tag_id, name)
+        return tags
+
+    @property
+    def num_tags(self) -> int:
+        return len(self.tags)
+
+    @cached_property
+    def dbg_info(self) -> SPFdbgInfo | None:
+        if '.dbg.info' in self.sections:
+            sect = self.sections['.dbg.info']
+            return SPFdbgInfo.parse(self.base[sect.dataoffs:])
+
+    @cached_property
+    def dbg_natives(self) -> List[SPFdbgNative]:
+        if '.dbg.natives' not in self.sections:
+            return []
+
+        sect = self.sections['.dbg.natives']
+        ntvtab = SPFdbgNtvTab.parse(self.base[sect.dataoffs:])
+        return list(ntvtab.natives)
+
+    @cached_property
+    def dbg_natives_by_index(self) -> Dict[int, SPFdbgNative]:
+        return {native.index: native for native in self.dbg_natives}
+
+    @cached_property
+    def dbg_files(self) -> List[DbgFile]:
+        if '.dbg.files' not in self.sections:
+            return []
+
+        sect = self.sections['.dbg.files']
+        records = unpack_records(self.base, sect.dataoffs, sect.size, SPFDBG_FILE_RECORD)
+        return [DbgFile(self, addr, name) for addr, name in records]
+
+    @cached_property
+    def dbg_file_addrs(self) -> array:
+        """Code addresses of the debug files, in the same order as `dbg_files`"""
+        return array('I', (dbg_file.addr for dbg_file in self.dbg_files))
+
+    @cached_property
+    def _dbg_line_table(self) -> array:
+        """The .dbg.lines section, as interleaved pairs of code address and line number"""
+        if '.dbg.lines' not in self.sections:
+            return array('I')
+
+        sect = self.sections['.dbg.lines']
+        return read_cells(self.base, sect.dataoffs, sect.size - sect.size % SPFDBG_LINE_RECORD.size)
+
+    @cached_property
+    def dbg_line_addrs(self) -> array:
+        """Code addresses of the debug lines, in ascending order"""
+        return self._dbg_line_table[0::2]
+
+    @cached_property
+    def dbg_line_numbers(self) -> array:
+        """Line numbers of the debug lines, in the same order as `dbg_line_addrs`"""
+        return self._dbg_line_table[1::2]
+
+    @cached_property
+    def dbg_lines(self) -> List[DbgLine]:
+        return [DbgLine(self, addr, line) for addr, line in zip(self.dbg_line_addrs, self.dbg_line_numbers)]
+
+    @cached_property
+    def dbg_symbols(self) -> List[DbgSymbol]:
+        if '.dbg.symbols' not in self.sections:
+            return []
+
+        sect = self.sections['.dbg.symbols']
+        dbg_symbols = []
+
+        # Each symbol is followed by its array dimensions, so records are walked one by one
+        offset = sect.dataoffs
+        end = sect.dataoffs + sect.size
+        while offset + SPFDBG_SYMBOL_RECORD.size <= end:
+            addr, tagid, codestart, codeend, ident, vclass, dimcount, name = \
+                SPFDBG_SYMBOL_RECORD.unpack_from(self.base, offset)
+            offset += SPFDBG_SYMBOL_RECORD.size
+
+            arraydims = []
+            for _ in range(dimcount):
+                dim_tagid, dim_size = SPFDBG_ARRAYDIM_RECORD.unpack_from(self.base, offset)
+                arraydims.append(SPFdbgArrayDim(tagid=dim_tagid, size=dim_size))
+                offset += SPFDBG_ARRAYDIM_RECORD.size
+
+            dbg_symbols.append(DbgSymbol(
+                plugin=self,
+                addr=addr,
+                tagid=tagid,
+                codestart=codestart,
+                codeend=codeend,
+                ident=ident,
+                vclass=vclass,
+                dimcount=dimcount,
+                name=name,
+                arraydims=arraydims,
+            ))
+
+        return dbg_symbols
+
+    @cached_property
+    def rtti_enums(self) -> List[RTTIEnum]:
+        if 'rtti.enums' not in self.sections:
+            return []
+
+        sect = self.sections['rtti.enums']
+        enums_table = SmxRTTIEnumTable.parse(self.base[sect.dataoffs:])
+        return [RTTIEnum(plugin=self, name=enum.name) for enum in enums_table.enums]
+
+    @cached_property
+    def rtti_enums_by_name(self) -> Dict[str, RTTIEnum]:
+        return {rtti_enum.name: rtti_enum for rtti_enum in self.rtti_enums}
+
+    # TODO(zk): require rtti.methods and rtti.natives
+
+    @cached_property
+    def rtti_methods(self) -> List[RTTIMethod]:
+        if 'rtti.methods' not in self.sections:
+            return []
+
+        sect = self.sections['rtti.methods']
+        methods_table = SmxRTTIMethodTable.parse(self.base[sect.dataoffs:])
+        return [
+            RTTIMethod(
+                plugin=self,
+                name=entry.name,
+                pcode_start=entry.pcode_start,
+                pcode_end=entry.pcode_end,
+                signature=entry.signature,
+            )
+            for entry in methods_table.methods
+        ]
+
+    @cached_property
+    def rtti_methods_by_name(self) -> Dict[str, RTTIMethod]:
+        return {rtti_method.name: rtti_method for rtti_method in self.rtti_methods}
+
+    @cached_property
+    def rtti_methods_by_addr(self) -> Dict[int, RTTIMethod]:
+        return {rtti_method.pcode_start: rtti_method for rtti_method in self.rtti_methods}
+
+    @cached_property
+    def rtti_natives(self) -> List[RTTINative]:
+        if 'rtti.natives' not in self.sections:
+            return []
+
+        sect = self.sections['rtti.natives']
+        natives_table = SmxRTTINativeTable.parse(self.base[sect.dataoffs:])
+        return [
+            RTTINative(plugin=self, name=native.name, signature=native.signature)
+            for native in natives_table.natives
+        ]
+
+    @cached_property
+    def rtti_natives_by_name(self) -> Dict[str, RTTINative]:
+        return {rtti_native.name: rtti_native for rtti_native in self.rtti_natives}
+
+    @cached_property
+    def rtti_typedefs(self) -> List[RTTITypedef]:
+        if 'rtti.typedefs' not in self.sections:
+            return []
+
+        sect = self.sections['rtti.typedefs']
+        typedefs_table = SmxRTTITypedefTable.parse(self.base[sect.dataoffs:])
+        return [
+            RTTITypedef(plugin=self, name=typedef.name, type_id=typedef.type_id)
+            for typedef in typedefs_table.typedefs
+        ]
+
+    @cached_property
+    def rtti_typedefs_by_name(self) -> Dict[str, RTTITypedef]:
+        return {rtti_typedef.name: rtti_typedef for rtti_typedef in self.rtti_typedefs}
+
+    @cached_property
+    def rtti_typesets(self) -> List[RTTITypeset]:
+        if 'rtti.typesets' not in self.sections:
+            return []
+
+        sect = self.sections['rtti.typesets']
+        typesets_table = SmxRTTITypesetTable.parse(self.base[sect.dataoffs:])
+        return [
+            RTTITypeset(plugin=self, name=typeset.name, signature=typeset.signature)
+            for typeset in typesets_table.typesets
+        ]
+
+    @cached_property
+    def rtti_typesets_by_name(self) -> Dict[str, RTTITypeset]:
+        return {rtti_typeset.name: rtti_typeset for rtti_typeset in self.rtti_typesets}
+
+    @cached_property
+    def rtti_enum_struct_fields(self) -> List[RTTIEnumStructField]:
+        if 'rtti.enumstructs' not in self.sections:
+            return []
+        if 'rtti.enumstruct_fields' not in self.sections:
+            raise SourcePawnPluginFormatError('rtti.enumstruct_fields section is missing, but required by rtti.enumstructs')
+
+        sect = self.sections['rtti.enumstruct_fields']
+        es_fields_table = SmxRTTIEnumStructFieldTable.parse(self.base[sect.dataoffs:])
+        return [
+            RTTIEnumStructField(
+                plugin=self,
+                name=es_field.name,
+                type_id=es_field.type_id,
+                offset=es_field.offset,
+            )
+            for es_field in es_fields_table.fields
+        ]
+
+    @cached_property
+    def rtti_enum_structs(self) -> List[RTTIEnumStruct]:
+        fields = self.rtti_enum_struct_fields
+        if 'rtti.enumstructs' not in self.sections:
+            return []
+
+        sect = self.sections['rtti.enumstructs']
+        enumstructs_table = SmxRTTIEnumStructTable.parse(self.base[sect.dataoffs:])
+
+        last_fields = (
+            [e.first_field for e in enumstructs_table.enumstructs[1:]] + [len(fields)]
+        )
+        return [
+            RTTIEnumStruct(
+                plugin=self,
+                name=enumstruct.name,
+                fields=fields[enumstruct.first_field:last_field],
+            )
+            for enumstruct, last_field in zip(enumstructs_table.enumstructs, last_fields)
+        ]
+
+    @cached_property
+    def rtti_enum_structs_by_name(self) -> Dict[str, RTTIEnumStruct]:
+        return {rtti_enum_struct.name: rtti_enum_struct for rtti_enum_struct in self.rtti_enum_structs}
+
+    @cached_property
+    def rtti_fields(self) -> List[RTTIField]:
+        if 'rtti.classdef' not in self.sections:
+            return []
+        if 'rtti.fields' not in self.sections:
+            raise SourcePawnPluginFormatError('rtti.fields section is missing, but required by rtti.classdef')
+
+        sect = self.sections['rtti.fields']
+        fields_table = SmxRTTIFieldTable.parse(self.base[sect.dataoffs:])
+        return [
+            RTTIField(
+                plugin=self,
+                name=field.name,
+                flags=field.flags,
+                type_id=field.type_id,
+            )
+            for field in fields_table.fields
+        ]
+
+    @cached_property
+    def rtti_class_defs(self) -> List[RTTIClassDef]:
+        fields = self.rtti_fields
+        if 'rtti.classdef' not in self.sections:
+            return []
+
+        sect = self.sections['rtti.classdef']
+        classdef_table = SmxRTTIClassDefTable.parse(self.base[sect.dataoffs:])
+
+        last_fields = (
+            [c.first_field for c in classdef_table.classdefs[1:]] + [len(fields)]
+        )
+        return [
+            RTTIClassDef(
+                plugin=self,
+                name=classdef.name,
+                flags=classdef.flags,
+                fields=fields[classdef.first_field:last_field],
+            )
+            for classdef, last_field in zip(classdef_table.classdefs, last_fields)
+        ]
+
+    @cached_property
+    def rtti_class_defs_by_name(self) -> Dict[str, RTTIClassDef]:
+        return {rtti_classdef.name: rtti_classdef for rtti_classdef in self.rtti_class_defs}
+
+    @property
+    def rtti_dbg_vars(self) -> List[RTTIDbgVar]:
+        return self._load_rtti_dbg_vars()
+
+    def _load_rtti_dbg_vars(self) -> List[RTTIDbgVar]:
+        """Parse the debug vars, if not already done, associating locals with their methods"""
+        if self._rtti_dbg_vars is not None:
+            return self._rtti_dbg_vars
+
+        rtti_dbg_vars = []
+        for dbg_var_sect_name in ('.dbg.globals', '.dbg.locals'):
+            if dbg_var_sect_name not in self.sections:
+                continue
 
-        file_idx = more_bisect.last_pos_le(addr, self.dbg_files, key=lambda file: file.addr)
-        if file_idx is not None:
-            return self.dbg_files[file_idx]
+            sect = self.sections[dbg_var_sect_name]
+            vars_tab = SmxRTTIDebugVarTable.parse(self.base[sect.dataoffs:])
 
-    # TODO(zk): split me up, jesus
-    def extract_from_buffer(self, fp):
+            for var in vars_tab.vars:
+                rtti_dbg_vars.append(RTTIDbgVar(
+                    plugin=self,
+                    address=var.address,
+                    vclass=var.vclass,
+                    name=var.name,
+                    code_start=var.code_start,
+                    code_end=var.code_end,
+                    type_id=var.type_id,
+                ))
+
+        if '.dbg.methods' in self.sections:
+            sect = self.sections['.dbg.methods']
+            debug_methods_table = SmxRTTIDebugMethodTable.parse(self.base[sect.dataoffs:])
+
+            rtti_locals = [rtti_var for rtti_var in rtti_dbg_vars if not rtti_var.is_global]
+            last_locals = (
+                [m.first_local for m in debug_methods_table.methods[1:]] + [len(rtti_locals)]
+            )
+            for entry, last_local in zip(debug_methods_table.methods, last_locals):
+                rtti_method = self.rtti_methods[entry.method_index]
+                for rtti_var in rtti_locals[entry.first_local:last_local]:
+                    rtti_var.associated_method = rtti_method
+                    rtti_method._associated_locals[rtti_var.address] = rtti_var
+
+        self._rtti_dbg_vars = rtti_dbg_vars
+        return rtti_dbg_vars
+
+    @cached_property
+    def rtti_globals(self) -> List[RTTIDbgVar]:
+        return [rtti_var for rtti_var in self.rtti_dbg_vars if rtti_var.is_global]
+
+    @cached_property
+    def rtti_locals(self) -> List[RTTIDbgVar]:
+        return [rtti_var for rtti_var in self.rtti_dbg_vars if not rtti_var.is_global]
+
+    @cached_property
+    def symbols_by_addr(self) -> Dict[int, List[TypedSymbol]]:
+        symbols_by_addr = defaultdict(list)
+        for rtti_method in self.rtti_methods:
+            symbols_by_addr[rtti_method.pcode_start].append(rtti_method)
+        for rtti_var in self.rtti_dbg_vars:
+            symbols_by_addr[rtti_var.address].append(rtti_var)
+        return symbols_by_addr
+
+    def extract_from_buffer(self, fp: BinaryIO):
         if isinstance(fp, io.IOBase) and hasattr(fp, 'name'):
             self.filename = fp.name
+        self.extract_from_memory(_map_plugin_file(fp))
 
-        hdr = SPFileHdr.parse_stream(fp)
+    def extract_from_memory(self, data: bytes | mmap.mmap):
+        """Load the plug-in from the contents of its .smx file
 
-        if hdr.magic != SPFILE_MAGIC:
-            raise SourcePawnPluginFormatError(
-                f'Invalid magic number 0x{hdr.magic:08x} (expected 0x{SPFILE_MAGIC:08x})')
+        Uncompressed plug-ins are used in place, so when `data` is memory-mapped,
+        all plug-ins loaded from the same file share its pages. Compressed plug-ins
+        are inflated into a single buffer, sized from the header.
 
-        if hdr.version not in (SP1_VERSION_1_0, SP1_VERSION_1_1, SP1_VERSION_1_7):
-            raise SourcePawnPluginFormatError(f'Unspported version number 0x{hdr.version:04x}')
+        """
+        if len(data) < SPFILE_HDR_RECORD.size:
+            raise SourcePawnPluginFormatError('File is too small to be a SourcePawn plug-in')
 
-        if hdr.version == SP1_VERSION_1_0:
-            self.is_unpacked = True
+        magic, version, compression, disksize, imagesize, num_sections, stringtab, dataoffs = \
+            SPFILE_HDR_RECORD.unpack_from(data)
 
-        self.stringtab = hdr.stringtab
+        if magic != SPFILE_MAGIC:
+            raise SourcePawnPluginFormatError(
+                f'Invalid magic number 0x{magic:08x} (expected 0x{SPFILE_MAGIC:08x})')
+
+        if version not in (SP1_VERSION_1_0, SP1_VERSION_1_1, SP1_VERSION_1_7):
+            raise SourcePawnPluginFormatError(f'Unspported version number 0x{version:04x}')
 
-        _hdr_size = hdr.sizeof()
-        if hdr.compression == SPFILE_COMPRESSION_GZ:
-            uncompsize = hdr.imagesize - hdr.dataoffs
-            compsize = hdr.disksize - hdr.dataoffs
-            sectsize = hdr.dataoffs - _hdr_size
+        if version == SP1_VERSION_1_0:
+            self.is_unpacked = True
 
-            sectheader = fp.read(sectsize)
-            compdata = fp.read(compsize)
-            fp.seek(0)
-            fileheader = fp.read(_hdr_size)
+        if compression == SPFILE_COMPRESSION_GZ:
+            base = bytearray(imagesize)
+            with memoryview(data) as view:
+                # The header and section headers are stored uncompressed
+                base[:dataoffs] = view[:dataoffs]
+                _inflate_into(base, dataoffs, view[dataoffs:disksize])
 
-            uncompdata = zlib.decompress(compdata, 15, uncompsize)
-            base = fileheader + sectheader + uncompdata
+            # Only the inflated image is needed from here on, so don't hold the file's mapping open
+            if isinstance(data, mmap.mmap):
+                data.close()
 
-        elif hdr.compression == SPFILE_COMPRESSION_NONE:
-            fp.seek(0)
-            base = fp.read()
+        elif compression == SPFILE_COMPRESSION_NONE:
+            base = data
 
         else:
             raise SourcePawnPluginError('Invalid compression type %d' %
-                                        hdr.compression)
+                                        compression)
 
         self.base = base
-
-        _sections = SPFileSection[hdr.sections].parse(base[_hdr_size:])
+        self.stringtab = stringtab
+        self.dataoffs = dataoffs
 
         sections = {}
-        for sect in _sections[:hdr.sections]:
-            name = c_char_p(self.base[self.stringtab + sect.nameoffs:]).value
-            name = name.decode('utf-8')
-            sections[name] = sect
+        records = unpack_records(
+            base, SPFILE_HDR_RECORD.size, num_sections * SPFILE_SECTION_RECORD.size, SPFILE_SECTION_RECORD)
+        for nameoffs, sect_dataoffs, size in records:
+            name = read_cstring(base, stringtab + nameoffs).decode('utf-8')
+            sections[name] = SPFileSection(nameoffs=nameoffs, dataoffs=sect_dataoffs, size=size)
+
+        self.load_image(sections)
+
+    def load_image(
+        self,
+        sections: Dict[str, SPFileSection],
+        *,
+        instruction_starts: Sequence[int] | None = None,
+        case_tables: Dict[int, CaseTable] | None = None,
+    ):
+        """Load the plug-in from its (uncompressed) image, already in `base`
+
+        :param sections:
+            Headers of the image's sections, by name
+
+        :param instruction_starts:
+            Cell indices at which instructions begin in the code section, if known
+            (e.g. from a cache). Otherwise, the code section is scanned for them.
+
+        :param case_tables:
+            The decoded case tables of the code section, if known
+
+        """
+        self.image_sections = sections
+        if self.code_only:
+            sections = {name: sect for name, sect in sections.items() if name in self.CODE_ONLY_SECTIONS}
+        self.sections = sections
 
         if '.names' in sections:
             sect = sections['.names']
@@ -335,54 +828,55 @@ class SourcePawnPlugin:
 
         if '.code' in sections:
             sect = sections['.code']
-            cod = SPFileCode.parse(self.base[sect.dataoffs:])
+            codesize, cellsize, codeversion, flags, main, code, features = \
+                SPFILE_CODE_RECORD.unpack_from(self.base, sect.dataoffs)
 
-            if cod.codeversion < SP_CODEVERS_MINIMUM:
+            if codeversion < SP_CODEVERS_MINIMUM:
                 raise SourcePawnPluginFormatError(
-                    "Code version %d is too old" % cod.codeversion)
-            elif cod.codeversion == SP_CODEVERS_ALWAYS_REJECT:
+                    "Code version %d is too old" % codeversion)
+            elif codeversion == SP_CODEVERS_ALWAYS_REJECT:
                 raise SourcePawnPluginFormatError(
-                    "Code version %d is not supported" % cod.codeversion)
-            elif cod.codeversion > SP_CODEVERS_CURRENT:
+                    "Code version %d is not supported" % codeversion)
+            elif codeversion > SP_CODEVERS_CURRENT:
                 raise SourcePawnPluginFormatError(
-                    "Code version %d is too new" % cod.codeversion)
+                    "Code version %d is too new" % codeversion)
+
+            self.features = SPCodeFeature(features)
 
-            self.features = cod.features
+            pcode = self.dataoffs + code
+            self.pcode = PCode(self, pcode, codesize, codeversion, flags)
 
-            pcode = hdr.dataoffs + cod.code
-            self.pcode = PCode(self, pcode, cod.codesize, cod.codeversion, cod.flags)
+            self.code_section = _readonly_view(self.base)[pcode:pcode + codesize]
+
+            # The code section never changes after load, so we decode it only once
+            self.decoded_code = decode_code(self.code_section, instruction_starts)
+            if case_tables is None:
+                case_tables = decode_case_tables(self.decoded_code, self.code_section)
+            self.case_tables = case_tables
         else:
             raise SourcePawnPluginFormatError('.code section not found!')
 
         if '.data' in sections:
             sect = sections['.data']
-            dat = SPFileData.parse(self.base[sect.dataoffs:])
-            self.data = sect.dataoffs + dat.data
-            self.datasize = dat.datasize
-            self.memsize = dat.memsize
+            datasize, memsize, data = SPFILE_DATA_RECORD.unpack_from(self.base, sect.dataoffs)
+            self.data = sect.dataoffs + data
+            self.datasize = datasize
+            self.memsize = memsize
+            self.data_section = _readonly_view(self.base)[self.data:self.data + self.datasize]
         else:
             raise SourcePawnPluginFormatError('.data section not found!')
 
-        if '.tags' in sections:
-            sect = sections['.tags']
-
-            self.num_tags = sect.size // SPFileTag.sizeof()
-            tags = SPFileTag[self.num_tags].parse(self.base[sect.dataoffs:])
-
-            for index, tag in enumerate(tags[:self.num_tags]):
-                self.tags[index] = Tag(self, tag.tag_id, tag.name)
-
         # Functions defined as public
         if '.publics' in sections:
             sect = sections['.publics']
 
-            self.num_publics = sect.size // SPFilePublics.sizeof()
-            publics = SPFilePublics[self.num_publics].parse(self.base[sect.dataoffs:])
+            self.num_publics = sect.size // SPFILE_PUBLICS_RECORD.size
+            records = unpack_records(self.base, sect.dataoffs, sect.size, SPFILE_PUBLICS_RECORD)
 
-            for i, pub in enumerate(publics[:self.num_publics]):
-                code_offs = pub.address
+            for i, (code_offs, name) in enumerate(records):
                 funcid = (i << 1) | 1
-                pub = Public(self, code_offs, funcid, pub.name)
+                pub = Public(self, code_offs, funcid, name)
+                self.publics.append(pub)
                 self.publics_by_id[pub.funcid] = pub
                 self.publics_by_name[pub.name] = pub
                 self.publics_by_offs[code_offs] = pub
@@ -394,12 +888,11 @@ class SourcePawnPlugin:
         if '.pubvars' in sections:
             sect = sections['.pubvars']
 
-            self.num_pubvars = sect.size // SPFilePubvars.sizeof()
-            pubvars = SPFilePubvars[self.num_pubvars].parse(self.base[sect.dataoffs:])
+            self.num_pubvars = sect.size // SPFILE_PUBVARS_RECORD.size
+            records = unpack_records(self.base, sect.dataoffs, sect.size, SPFILE_PUBVARS_RECORD)
 
-            for pubvar in pubvars[:self.num_pubvars]:
-                offs = self.data + pubvar.address
-                pubvar = Pubvar(self, offs, pubvar.name)
+            for address, name in records:
+                pubvar = Pubvar(self, self.data + address, name)
                 self.pubvars.append(pubvar)
 
                 if pubvar.name == 'myinfo':
@@ -409,240 +902,68 @@ class SourcePawnPlugin:
         if '.natives' in sections:
             sect = sections['.natives']
 
-            self.num_natives = sect.size // SPFileNatives.sizeof()
-            natives = SPFileNatives[self.num_natives].parse(self.base[sect.dataoffs:])
+            self.num_natives = sect.size // SPFILE_NATIVES_RECORD.size
+            records = unpack_records(self.base, sect.dataoffs, sect.size, SPFILE_NATIVES_RECORD)
 
-            for native in natives[:self.num_natives]:
-                native = Native(self, 0, _invalid_native, SP_NATIVE_UNBOUND, None, native.name)
+            for name, in records:
+                native = Native(self, 0, _invalid_native, SP_NATIVE_UNBOUND, None, name)
                 self.natives.append(native)
                 self.natives_by_name[native.name] = native
 
-        if '.dbg.info' in sections:
-            sect = sections['.dbg.info']
-            info = SPFdbgInfo.parse(self.base[sect.dataoffs:])
-            self.dbg_info = info
-
-        if '.dbg.natives' in sections:
-            sect = sections['.dbg.natives']
-
-            ntvtab = SPFdbgNtvTab.parse(self.base[sect.dataoffs:])
-            for native in ntvtab.natives:
-                self.dbg_natives.append(native)
-                self.dbg_natives_by_index[native.index] = native
-
-        if '.dbg.files' in sections:
-            sect = sections['.dbg.files']
-
-            num_dbg_files = sect.size // SPFdbgFile.sizeof()
-            files = SPFdbgFile[num_dbg_files].parse(self.base[sect.dataoffs:])
-
-            for dbg_file in files:
-                self.dbg_files.append(DbgFile(self, dbg_file.addr, dbg_file.name))
-
-        if '.dbg.lines' in sections:
-            sect = sections['.dbg.lines']
-
-            num_dbg_lines = sect.size // SPFdbgLine.sizeof()
-            lines = SPFdbgLine[num_dbg_lines].parse(self.base[sect.dataoffs:])
-
-            for line in lines:
-                self.dbg_lines.append(DbgLine(self, line.addr, line.line))
-
-        if '.dbg.symbols' in sections:
-            sect = sections['.dbg.symbols']
-
-            i = 0
-            while i < sect.size:
-                sym = SPFdbgSymbol.parse(self.base[sect.dataoffs + i:])
-                i += SPFdbgSymbol.sizeof()
-
-                self.dbg_symbols.append(DbgSymbol(
-                    plugin=self,
-                    addr=sym.addr,
-                    tagid=sym.tagid,
-                    codestart=sym.codestart,
-                    codeend=sym.codeend,
-                    ident=sym.ident,
-                    vclass=sym.vclass,
-                    dimcount=sym.dimcount,
-                    name=sym.name,
-                    arraydims=sym.dims,
-                ))
-
         if 'rtti.data' in sections:
             sect = sections['rtti.data']
             self.rtti_data = self.base[sect.dataoffs:sect.dataoffs + sect.size]
 
-        if 'rtti.enums' in sections:
-            sect = sections['rtti.enums']
-            enums_table = SmxRTTIEnumTable.parse(self.base[sect.dataoffs:])
-
-            for enum in enums_table.enums:
-                rtti_enum = RTTIEnum(plugin=self, name=enum.name)
-                self.rtti_enums.append(rtti_enum)
-                self.rtti_enums_by_name[rtti_enum.name] = rtti_enum
-
-        # TODO(zk): require rtti.methods and rtti.natives
-
-        if 'rtti.methods' in sections:
-            sect = sections['rtti.methods']
-            methods_table = SmxRTTIMethodTable.parse(self.base[sect.dataoffs:])
-
-            for entry in methods_table.methods:
-                rtti_method = RTTIMethod(
-                    plugin=self,
-                    name=entry.name,
-                    pcode_start=entry.pcode_start,
-                    pcode_end=entry.pcode_end,
-                    signature=entry.signature,
-                )
-                self.rtti_methods.append(rtti_method)
-                self.rtti_methods_by_name[rtti_method.name] = rtti_method
-                self.rtti_methods_by_addr[entry.pcode_start] = rtti_method
-                self.symbols_by_addr[entry.pcode_start].append(rtti_method)
-
-        if 'rtti.natives' in sections:
-            sect = sections['rtti.natives']
-            natives_table = SmxRTTINativeTable.parse(self.base[sect.dataoffs:])
-
-            for native in natives_table.natives:
-                rtti_native = RTTINative(
-                    plugin=self,
-                    name=native.name,
-                    signature=native.signature,
-                )
-                self.rtti_natives.append(rtti_native)
-                self.rtti_natives_by_name[rtti_native.name] = rtti_native
-
-        if 'rtti.typedefs' in sections:
-            sect = sections['rtti.typedefs']
-            typedefs_table = SmxRTTITypedefTable.parse(self.base[sect.dataoffs:])
-
-            for typedef in typedefs_table.typedefs:
-                rtti_typedef = RTTITypedef(
-                    plugin=self,
-                    name=typedef.name,
-                    type_id=typedef.type_id,
-                )
-                self.rtti_typedefs.append(rtti_typedef)
-                self.rtti_typedefs_by_name[rtti_typedef.name] = rtti_typedef
-
-        if 'rtti.typesets' in sections:
-            sect = sections['rtti.typesets']
-            typesets_table = SmxRTTITypesetTable.parse(self.base[sect.dataoffs:])
-
-            for typeset in typesets_table.typesets:
-                rtti_typeset = RTTITypeset(
-                    plugin=self,
-                    name=typeset.name,
-                    signature=typeset.signature,
-                )
-                self.rtti_typesets.append(rtti_typeset)
-                self.rtti_typesets_by_name[rtti_typeset.name] = rtti_typeset
-
-        if 'rtti.enumstructs' in sections:
-            if 'rtti.enumstruct_fields' not in sections:
-                raise SourcePawnPluginFormatError('rtti.enumstruct_fields section is missing, but required by rtti.enumstructs')
-
-            sect = sections['rtti.enumstruct_fields']
-            es_fields_table = SmxRTTIEnumStructFieldTable.parse(self.base[sect.dataoffs:])
-            for es_field in es_fields_table.fields:
-                rtti_es_field = RTTIEnumStructField(
-                    plugin=self,
-                    name=es_field.name,
-                    type_id=es_field.type_id,
-                    offset=es_field.offset,
-                )
-                self.rtti_enum_struct_fields.append(rtti_es_field)
-
-            sect = sections['rtti.enumstructs']
-            enumstructs_table = SmxRTTIEnumStructTable.parse(self.base[sect.dataoffs:])
-
-            last_fields = (
-                [e.first_field for e in enumstructs_table.enumstructs[1:]] + [len(self.rtti_enum_struct_fields)]
-            )
-            for enumstruct, last_field in zip(enumstructs_table.enumstructs, last_fields):
-                rtti_enum_struct = RTTIEnumStruct(
-                    plugin=self,
-                    name=enumstruct.name,
-                    fields=self.rtti_enum_struct_fields[enumstruct.first_field:last_field],
-                )
-                self.rtti_enum_structs.append(rtti_enum_struct)
-                self.rtti_enum_structs_by_name[rtti_enum_struct.name] = rtti_enum_struct
-
-        if 'rtti.classdef' in sections:
-            if 'rtti.fields' not in sections:
-                raise SourcePawnPluginFormatError('rtti.fields section is missing, but required by rtti.classdef')
-
-            sect = sections['rtti.fields']
-            fields_table = SmxRTTIFieldTable.parse(self.base[sect.dataoffs:])
-
-            for field in fields_table.fields:
-                rtti_field = RTTIField(
-                    plugin=self,
-                    name=field.name,
-                    flags=field.flags,
-                    type_id=field.type_id,
-                )
-                self.rtti_fields.append(rtti_field)
-
-            sect = sections['rtti.classdef']
-            classdef_table = SmxRTTIClassDefTable.parse(self.base[sect.dataoffs:])
-
-            last_fields = (
-                [c.first_field for c in classdef_table.classdefs[1:]] + [len(self.rtti_fields)]
-            )
-            for classdef, last_field in zip(classdef_table.classdefs, last_fields):
-                rtti_classdef = RTTIClassDef(
-                    plugin=self,
-                    name=classdef.name,
-                    flags=classdef.flags,
-                    fields=self.rtti_fields[classdef.first_field:last_field],
-                )
-                self.rtti_class_defs.append(rtti_classdef)
-                self.rtti_class_defs_by_name[rtti_classdef.name] = rtti_classdef
-
-        for dbg_var_sect_name in ('.dbg.globals', '.dbg.locals'):
-            if dbg_var_sect_name not in sections:
-                continue
-
-            sect = sections[dbg_var_sect_name]
-            vars_tab = SmxRTTIDebugVarTable.parse(self.base[sect.dataoffs:])
-
-            for var in vars_tab.vars:
-                rtti_var = RTTIDbgVar(
-                    plugin=self,
-                    address=var.address,
-                    vclass=var.vclass,
-                    name=var.name,
-                    code_start=var.code_start,
-                    code_end=var.code_end,
-                    type_id=var.type_id,
-                )
-
-                self.rtti_dbg_vars.append(rtti_var)
-                if rtti_var.is_global:
-                    self.rtti_globals.append(rtti_var)
-                else:
-                    self.rtti_locals.append(rtti_var)
-                self.symbols_by_addr[rtti_var.address].append(rtti_var)
-
-        if '.dbg.methods' in sections:
-            sect = sections['.dbg.methods']
-            debug_methods_table = SmxRTTIDebugMethodTable.parse(self.base[sect.dataoffs:])
-
-            last_locals = (
-                [m.first_local for m in debug_methods_table.methods[1:]] + [len(self.rtti_locals)]
-            )
-            for entry, last_local in zip(debug_methods_table.methods, last_locals):
-                rtti_method = self.rtti_methods[entry.method_index]
-                rtti_locals = self.rtti_locals[entry.first_local:last_local]
-                for rtti_var in rtti_locals:
-                    rtti_var.associated_method = rtti_method
-                    rtti_method.associated_locals[rtti_var.address] = rtti_var
-
         self.filled = True
 
 
 def _invalid_native():
     raise SourcePawnPluginNativeError("Invalid native")
+
+
+def _readonly_view(buf: bytes | bytearray | mmap.mmap) -> memoryview:
+    view = memoryview(buf)
+    # NOTE: the image of a compressed plug-in is a bytearray; as it's shared by all
+    #       runtimes, its views are made read-only where possible (py3.8+)
+    if hasattr(view, 'toreadonly'):
+        view = view.toreadonly()
+    return view
+
+
+def _map_plugin_file(fp: BinaryIO) -> bytes | mmap.mmap:
+    """Memory-map the plug-in file open in `fp`, or read it if it can't be mapped
+
+    Only regular files read from their start are mapped; in-memory buffers,
+    pipes, and the like are read as usual. The file must not be modified while
+    it's mapped (see SourcePawnPlugin.__init__).
+    """
+    try:
+        if fp.tell() == 0:
+            return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # NOTE: io.UnsupportedOperation (e.g. fileno() of a BytesIO) is an OSError,
+        #       and ValueError is raised when mapping an empty file
+        pass
+    return fp.read()
+
+
+#: Size of the chunks of compressed data fed to the decompressor by _inflate_into
+_INFLATE_CHUNK_SIZE = 1 << 16
+
+
+def _inflate_into(dest: bytearray, offset: int, compressed: memoryview):
+    """Decompress zlib data into `dest`, starting at `offset`, without concatenating chunks"""
+    decompressor = zlib.decompressobj(15)
+    view = memoryview(dest)
+    pos = offset
+
+    for start in range(0, len(compressed), _INFLATE_CHUNK_SIZE):
+        chunk = decompressor.decompress(compressed[start:start + _INFLATE_CHUNK_SIZE])
+        if pos + len(chunk) > len(dest):
+            raise SourcePawnPluginFormatError('Compressed image is larger than its declared size')
+        view[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
+
+    if pos < len(dest):
+        raise SourcePawnPluginFormatError(
+            f'Compressed image is {pos - offset} bytes, expected {len(dest) - offset}')
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import re
-from ctypes import c_char, c_char_p
-from typing import Any, Dict, List, Sequence, TYPE_CHECKING
+import struct
+import sys
+from array import array
+from dataclasses import fields
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, TYPE_CHECKING
 
 from smx import vm
+from smx.compat import cached_property
 from smx.definitions import (
     cell,
     Myinfo,
+    MYINFO_RECORD,
     RTTI_VAR_CLASS_ARG,
     RTTI_VAR_CLASS_GLOBAL,
     RTTI_VAR_CLASS_LOCAL,
@@ -31,17 +36,43 @@ RGX_INLINE_NAME = re.compile(r'^\.(\d+)\.(\w+)')
 
 
 def extract_stringtable(base: bytes, stringbase: int, size: int) -> Dict[int, str]:
+    """Decode the NUL-terminated strings of a string table, keyed by their offsets into it"""
     stringtable = {}
-    buf = base[stringbase:]
     offset = 0
-    while offset <= size:
-        s = c_char_p(buf[offset:]).value
+    for s in base[stringbase:stringbase + size].split(b'\0'):
         stringtable[offset] = s.decode('utf-8')
         offset += len(s) + 1
 
+    # The table ends with a NUL, leaving an empty string past its end
+    if size and base[stringbase + size - 1] == 0:
+        del stringtable[size]
+
     return stringtable
 
 
+def unpack_records(base: bytes, offset: int, size: int, record: struct.Struct) -> Iterator[Tuple[int, ...]]:
+    """Unpack each of the fixed-size records of a section, without copying it"""
+    size -= size % record.size
+    return record.iter_unpack(memoryview(base)[offset:offset + size])
+
+
+def read_cells(base: bytes, offset: int, size: int) -> array:
+    """Read a section of little-endian, unsigned 32-bit values into an array"""
+    cells = array('I')
+    cells.frombytes(memoryview(base)[offset:offset + size - size % cells.itemsize])
+    if sys.byteorder == 'big':
+        cells.byteswap()
+    return cells
+
+
+def read_cstring(base: bytes, offset: int) -> bytes:
+    """Read the NUL-terminated string at the given offset, without copying anything past it"""
+    end = base.find(b'\0', offset)
+    if end == -1:
+        end = len(base)
+    return base[offset:end]
+
+
 class _PluginChild:
     """A thing that receives a plug-in and other info, and does stuff with it"""
 
@@ -113,10 +144,10 @@ class Pubvar(StringtableName):
         # Special case for myinfo
         if self.name == 'myinfo':
             # FIXME: this attr dangling off pubvar sucks
-            myinfo_offs = Myinfo.parse(self.plugin.base[self.offs:])
+            myinfo_offs = MYINFO_RECORD.unpack_from(self.plugin.base, self.offs)
             self.myinfo = {
-                name: self.plugin._get_data_string(offs)
-                for name, offs in vars(myinfo_offs).items()
+                field.name: self.plugin._get_data_string(offs)
+                for field, offs in zip(fields(Myinfo), myinfo_offs)
             }
         else:
             self.myinfo = None
@@ -185,9 +216,17 @@ class RTTIMethod(RTTINamedTypedSymbol, StringtableName):
         self.pcode_end = pcode_end
         self.signature = signature
 
-        self.rtti = plugin.rtti_function_from_offset(signature)
+        self._associated_locals: Dict[int, RTTIDbgVar] = {}
 
-        self.associated_locals: Dict[int, RTTIDbgVar] = {}
+    @cached_property
+    def rtti(self) -> RTTI | None:
+        return self.plugin.rtti_function_from_offset(self.signature)
+
+    @property
+    def associated_locals(self) -> Dict[int, RTTIDbgVar]:
+        # Locals are associated with their methods as the debug vars are loaded
+        self.plugin._load_rtti_dbg_vars()
+        return self._associated_locals
 
 
 class RTTINative(RTTINamedTypedSymbol, StringtableName):
@@ -195,7 +234,10 @@ class RTTINative(RTTINamedTypedSymbol, StringtableName):
         super().__init__(plugin, name)
 
         self.signature = signature
-        self.rtti = plugin.rtti_function_from_offset(signature)
+
+    @cached_property
+    def rtti(self) -> RTTI | None:
+        return self.plugin.rtti_function_from_offset(self.signature)
 
 
 class RTTITypedef(RTTINamedTypedSymbol, StringtableName):
@@ -203,7 +245,10 @@ class RTTITypedef(RTTINamedTypedSymbol, StringtableName):
         super().__init__(plugin, name)
 
         self.type_id = type_id
-        self.rtti = plugin.rtti_from_type_id(type_id)
+
+    @cached_property
+    def rtti(self) -> RTTI | None:
+        return self.plugin.rtti_from_type_id(self.type_id)
 
 
 class RTTITypeset(RTTINamedTypedSymbol, StringtableName):
@@ -211,7 +256,10 @@ class RTTITypeset(RTTINamedTypedSymbol, StringtableName):
         super().__init__(plugin, name)
 
         self.signature = signature
-        self.rtti = plugin.rtti_from_type_id(signature)
+
+    @cached_property
+    def rtti(self) -> RTTI | None:
+        return self.plugin.rtti_from_type_id(self.signature)
 
 
 class RTTIEnumStruct(TypedSymbol, StringtableName):
@@ -227,7 +275,9 @@ class RTTIEnumStructField(RTTINamedTypedSymbol, StringtableName):
         self.type_id = type_id
         self.offset = offset
 
-        self.rtti = plugin.rtti_from_type_id(type_id)
+    @cached_property
+    def rtti(self) -> RTTI | None:
+        return self.plugin.rtti_from_type_id(self.type_id)
 
 
 class RTTIClassDef(TypedSymbol, StringtableName):
@@ -245,7 +295,9 @@ class RTTIField(RTTINamedTypedSymbol, StringtableName):
         self.flags = flags
         self.type_id = type_id
 
-        self.rtti = plugin.rtti_from_type_id(type_id)
+    @cached_property
+    def rtti(self) -> RTTI | None:
+        return self.plugin.rtti_from_type_id(self.type_id)
 
 
 class DbgFile(StringtableName):
@@ -325,12 +377,7 @@ class DbgSymbol(TypedSymbol, StringtableName):
         elif tag_name == 'bool':
             return bool(value)
         elif tag_name == 'String':
-            op, args, _, _ = amx._executed[-3]
-            assert op == 'stack'
-            assert len(args) == 1
-            size = int(args[0], 0x10)
-            rval = (c_char * size).from_buffer(amx.heap, value).value
-            return rval.decode('utf-8')
+            return amx._getheapstring(value)
 
     def __str__(self):
         tag = self.tag.name
@@ -371,10 +418,12 @@ class RTTIDbgVar(RTTINamedTypedSymbol, StringtableName):
         self.code_end = code_end
         self.type_id = type_id
 
-        self.rtti = self.plugin.rtti_from_type_id(self.type_id)
-
         self.associated_method: RTTIMethod | None = None
 
+    @cached_property
+    def rtti(self) -> RTTI | None:
+        return self.plugin.rtti_from_type_id(self.type_id)
+
     @property
     def is_global(self) -> bool:
         return self.vclass_kind == RTTI_VAR_CLASS_GLOBAL
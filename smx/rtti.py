@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
-from ctypes import c_char, c_uint8, sizeof
-from typing import Any, Tuple, TYPE_CHECKING
+import struct
+from ctypes import c_uint8, sizeof
+from typing import Any, Callable, Tuple, TYPE_CHECKING
 
+from smx.compat import cached_property
 from smx.definitions import (
     cell,
     RTTI_CB_INDEXED_TYPES,
@@ -152,7 +154,7 @@ class RTTI:
     ) -> Any | None:
         if self.type == RTTIControlByte.BOOL:
             return bool(value)
-        elif self.type in (RTTIControlByte.ANY, RTTIControlByte.INT32, RTTIControlByte.CHAR8):
+        elif self.type in (RTTIControlByte.ANY, RTTIControlByte.INT32, RTTIControlByte.CHAR8, RTTIControlByte.ENUM):
             return value
         elif self.type == RTTIControlByte.FLOAT32:
             # TODO(zk): less roundabout parsing?
@@ -165,10 +167,10 @@ class RTTI:
                 size = self.index
 
             if self.inner.type == RTTIControlByte.CHAR8:
-                buf = (c_char * size).from_buffer(amx.heap, value).value
+                buf = bytes(amx.mem[value:value + size]).split(b'\0', 1)[0]
                 return buf.decode('utf-8')
             else:
-                cells = (cell * size).from_buffer(amx.heap, value)
+                cells = amx.mem[value:value + size * sizeof(cell)].cast('i')
                 return [self.inner.interpret_value(c, amx) for c in cells]
         elif self.type == RTTIControlByte.FUNCTION:
             return self.inner.interpret_value(value, amx)
@@ -177,6 +179,47 @@ class RTTI:
         else:
             assert False, f'Unknown RTTI type {self.type}'
 
+    @cached_property
+    def converter(self) -> Callable[[int, SourcePawnAbstractMachine], Any]:
+        """Function interpreting values of this type, as `interpret_value()` does
+
+        It's specialized to the type, skipping interpret_value's dispatch when
+        interpreting many values, e.g. the results of `PluginFunction.map()`.
+        Arrays of unknown size can't be interpreted this way.
+        """
+        if self.type == RTTIControlByte.BOOL:
+            return _convert_bool
+        elif self.type in (RTTIControlByte.ANY, RTTIControlByte.INT32, RTTIControlByte.CHAR8, RTTIControlByte.ENUM):
+            return _convert_cell
+        elif self.type == RTTIControlByte.FLOAT32:
+            return _convert_float
+        elif self.type == RTTIControlByte.FUNCTION:
+            return self.inner.converter
+        elif self.type == RTTIControlByte.VOID:
+            return _convert_void
+        else:
+            return self.interpret_value
+
+
+_pack_ucell = struct.Struct('<I').pack
+_unpack_float = struct.Struct('<f').unpack
+
+
+def _convert_bool(value: int, amx: SourcePawnAbstractMachine) -> bool:
+    return bool(value)
+
+
+def _convert_cell(value: int, amx: SourcePawnAbstractMachine) -> int:
+    return value
+
+
+def _convert_float(value: int, amx: SourcePawnAbstractMachine) -> float:
+    return _unpack_float(_pack_ucell(value & 0xffffffff))[0]
+
+
+def _convert_void(value: int, amx: SourcePawnAbstractMachine) -> None:
+    return None
+
 
 class RTTIParser:
     """Class for parsing runtime type information."""
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import struct
 import sys
-from copy import deepcopy
+import weakref
 from ctypes import addressof, sizeof
 from datetime import datetime
 from pathlib import Path
 from random import Random
-from typing import Any, cast as typing_cast, Dict, Generic, List, Tuple, TYPE_CHECKING, TypeVar
+from typing import (
+    Any,
+    cast as typing_cast,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    TypeVar,
+)
 
 from smx.compat import ParamSpec
-from smx.definitions import cell, RTTIControlByte, SP_MAX_EXEC_PARAMS
+from smx.definitions import cell, RTTIControlByte, SP_MAX_EXEC_PARAMS, wrap_cell
 from smx.interfaces import (
     CallableReturnValue,
     ICallable,
@@ -19,9 +32,11 @@ from smx.interfaces import (
     ParamValueT,
 )
 from smx.rtti import RTTI
-from smx.vm import SourcePawnAbstractMachine
+from smx.tracing import SpewTracer, Tracer
+from smx.vm import ExecutionEngine, SourcePawnAbstractMachine
 
 if TYPE_CHECKING:
+    from smx.history import ExecutionHistory
     from smx.plugin import SourcePawnPlugin
 
 
@@ -36,6 +51,11 @@ class SourcePawnPluginRuntime:
         spew_stack: bool = False,
         root_path: str | Path | None = None,
         smsys_options: Dict[str, Any] | None = None,
+        engine: ExecutionEngine | str = ExecutionEngine.INTERPRETER,
+        jit_threshold: int = 100,
+        history: ExecutionHistory | None = None,
+        tracer: Tracer | None = None,
+        strict_natives: bool = False,
     ):
         """
         :param plugin:
@@ -54,12 +74,52 @@ class SourcePawnPluginRuntime:
         :param smsys_options:
             Options to pass when initializing the `SourceModSystem` instance used by the runtime.
 
+        :param engine:
+            Which engine executes the plug-in's code: "interpreter" (the default), or "threaded",
+            which compiles functions into closures ahead of execution. The threaded engine is
+            faster, but does not spew. "jit" interprets, but compiles hot functions into Python
+            source; it is fastest for code which runs many times, and only spews what it interprets.
+
+        :param jit_threshold:
+            With the "jit" engine, the number of times a function must be entered (by calls, or
+            iterations of its loops) before it's compiled.
+
+        :param history:
+            Where to record the instructions executed by the interpreter, e.g. the last N in a
+            `RingBufferHistory`, or all of them streamed to a file with `FileHistory` (see
+            smx.history). By default, no history is kept.
+
+            The runtime takes ownership of the history: it's closed (e.g. a `FileHistory`
+            closes the file, if it opened it) when the runtime is closed or garbage
+            collected, or when `runtime.history` is replaced. A history can only be attached
+            to one runtime at a time, so each runtime (e.g. from `plugin.new_runtime()`)
+            must be passed its own; attaching one still owned by another raises ValueError.
+
+        :param tracer:
+            A Tracer to receive callbacks as the interpreter executes instructions (see
+            smx.tracing). Use `SpewTracer` to write spew to a file or logger, instead of stdout.
+
+        :param strict_natives:
+            Whether to raise SourcePawnUnboundNativeError when the abstract machine is initialized,
+            if the plug-in uses any natives without an implementation, other than those it marks
+            optional (with MarkNativeAsOptional, e.g. in `__pl_*_SetNTVOptional`, which are called
+            on initialization). Otherwise, the error is only reported if such a native is called.
+            Either way, the unbound natives are listed in
+            `amx.unbound_natives` (or returned by `get_unbound_natives()`).
+
         """
         self.plugin = plugin
         self.spew = spew
         self.spew_stack = spew_stack
         self.root_path = Path(root_path or '.').resolve()
         self.smsys_options = smsys_options or {}
+        self.engine = ExecutionEngine(engine)
+        self.jit_threshold = jit_threshold
+        self._history: ExecutionHistory | None = None
+        self._history_finalizer: weakref.finalize | None = None
+        self.history = history
+        self.tracer = tracer
+        self.strict_natives = strict_natives
 
         self.amx = SourcePawnAbstractMachine(self, self.plugin)
 
@@ -75,6 +135,33 @@ class SourcePawnPluginRuntime:
         # Per-plugin random number generator
         self._rand: Random | None = None
 
+    @property
+    def history(self) -> ExecutionHistory | None:
+        return self._history
+
+    @history.setter
+    def history(self, history: ExecutionHistory | None) -> None:
+        if history is self._history:
+            return
+
+        if history is not None and history._runtime is not None and history._runtime() is not None:
+            raise ValueError(f'{history!r} is already attached to another runtime')
+
+        # Close the history being replaced
+        if self._history_finalizer is not None:
+            self._history_finalizer()
+            self._history._runtime = None
+
+        self._history = history
+        self._history_finalizer = None
+        if history is not None:
+            history._runtime = weakref.ref(self)
+            self._history_finalizer = weakref.finalize(self, history.close)
+
+    def close(self) -> None:
+        """Release the resources held by the runtime (i.e. close its execution history)"""
+        self.history = None
+
     @property
     def rand(self) -> Random:
         if self._rand is None:
@@ -86,6 +173,17 @@ class SourcePawnPluginRuntime:
         if self.console_redirect is not None:
             print(msg, file=self.console_redirect, end='')
 
+    def get_tracers(self) -> List[Tracer]:
+        """Return the tracers the interpreter must call: spew, the `tracer` option, and history"""
+        tracers: List[Tracer] = []
+        if self.spew:
+            tracers.append(SpewTracer(stack=self.spew_stack))
+        if self.tracer is not None:
+            tracers.append(self.tracer)
+        if self.history is not None:
+            tracers.append(self.history)
+        return tracers
+
     def get_console_output(self) -> str:
         return ''.join(msg for time, msg in self.console)
 
@@ -114,10 +212,13 @@ class SourcePawnPluginRuntime:
         if funcid in self.pubfuncs_by_id:
             return self.pubfuncs_by_id[funcid]
 
-        pub = self.plugin.publics_by_id.get(funcid)
-        if pub is None:
+        # Public function IDs encode the index of the public, with the low bit set
+        index = funcid >> 1
+        if not funcid & 1 or not 0 <= index < len(self.plugin.publics):
             return None
 
+        pub = self.plugin.publics[index]
+
         func = PluginFunction(self, pub.funcid, pub.code_offs)
         self.pubfuncs_by_id[funcid] = func
         self.pubfuncs_by_name[pub.name] = func
@@ -135,16 +236,18 @@ class SourcePawnPluginRuntime:
             raise ValueError(f'{funcid!r} is not a valid public function ID')
         return func(*args)
 
-    def call_function(self, pubindex, *args) -> None:
-        # CODE 0 always seems to be a HALT instruction.
-        return_addr = 0
-        self.amx._push(return_addr)
-
-        for arg in args:
-            self.amx._push(arg)
-        self.amx._push(len(args))
+    def call_function(self, funcid: int, *args: int) -> Any:
+        """Call the public function with the given ID, passing raw cells as its args"""
+        func = self.get_function_by_id(funcid)
+        if not func:
+            raise ValueError(f'{funcid!r} is not a valid public function ID')
+        return func._call(list(args))
 
-        self.amx._pubcall(pubindex)
+    def get_unbound_natives(self) -> List[str]:
+        """Return the names of the natives used by the plug-in which have no implementation"""
+        if not self.amx.initialized:
+            self.amx.init()
+        return [native.name for native in self.amx.unbound_natives]
 
     def run(self, main: str = 'OnPluginStart') -> Any:
         """Executes the plugin's main function"""
@@ -175,7 +278,7 @@ class SourcePawnPluginRuntime:
         # TODO(zk): check stack margin
 
         bounds_addr = self.amx.HEA
-        self.amx._writeheap(bounds_addr, cell(num_cells), is_heap=True)
+        self.amx._writeheap(bounds_addr, num_cells, is_heap=True)
         self.amx.HEA += sizeof(cell)
         local_addr = self.amx.HEA
         phys_addr = addressof(self.amx.heap) + self.amx.HEA
@@ -339,10 +442,11 @@ class PluginFunction(Generic[P, RV], ICallable[P, RV]):
         # TODO(zk): check runnable
         # TODO(zk): check error state
 
-        from smx.sourcemod.natives.base import convert_return_value, WritableString
+        from smx.sourcemod.natives.base import convert_return_value
 
-        # Copy params, allowing reentrancy (calls within calls, yo)
-        params = deepcopy(self._params)
+        # The params are left untouched, so they may be invoked again, or reentrantly
+        # (calls within calls, yo); where they're allocated lives only in this frame.
+        params = list(self._params)
 
         return_type = self.rtti_method.rtti.inner if self.rtti_method else None
         if return_type and return_type.type == RTTIControlByte.FIXED_ARRAY:
@@ -357,53 +461,157 @@ class PluginFunction(Generic[P, RV], ICallable[P, RV]):
             params.append(rval_param)
 
         args: List[int] = []
+        # Local addr of the memory allocated for each param (-1 for those passed by value)
+        local_addrs: List[int] = []
         for param in params:
             # Is this marked as an array?
             if param.marked:
-                if not param.is_string:
-                    # Allocate a normal/generic array
-                    param.local_addr, param.phys_addr = self.runtime.heap_alloc(param.size)
-                    if param.value is not None:
-                        values = [convert_return_value(v) for v in param.value]
-                        array = (cell * len(values))(*values)
-                        self.runtime.amx._writeheap(param.local_addr, array)
-
-                else:  # is_string
-                    num_cells = (param.size + sizeof(cell) - 1) // sizeof(cell)
-                    param.local_addr, param.phys_addr = self.runtime.heap_alloc(num_cells)
-
-                    if param.string_flags & ParamStringFlag.COPY and param.value is not None:
-                        # TODO(zk): forego these flags for PluginFunction
-                        if param.string_flags & ParamStringFlag.UTF8:
-                            assert isinstance(param.value, str)
-                            value = param.value.encode('utf-8')
-                        elif param.string_flags & ParamStringFlag.BINARY:
-                            assert isinstance(param.value, bytes)
-                            value = param.value
-                        else:
-                            assert isinstance(param.value, str)
-                            value = param.value.encode('latin-1')
-                        buf = WritableString(self.runtime.amx, param.local_addr, param.size)
-                        buf.write(value, null_terminate=True)
+                local_addr, _ = self.runtime.heap_alloc(self._param_num_cells(param))
+                local_addrs.append(local_addr)
+                self._write_param(param, local_addr)
 
                 if param.is_rval_buffer:
                     # Push the rval buf addr before all other args (in essence, the last arg),
                     # but don't include it in `args`, so `self._call` won't include it in the
                     # number of args passed to the function.
-                    self.runtime.amx._push(param.local_addr)
+                    self.runtime.amx._push(local_addr)
                 else:
-                    args.append(param.local_addr)
+                    args.append(local_addr)
 
             else:  # not array
+                local_addrs.append(-1)
                 args.append(convert_return_value(param.value))
 
         # TODO(zk): handle exception states
         rval = self._call(args)
 
-        out_args_rev: List[ParamValueT | None] = []
-        for i, param in reversed(tuple(enumerate(params))):
+        out_args = self._copy_back_params(params, local_addrs, return_type)
+        for local_addr in reversed(local_addrs):
+            if local_addr != -1:
+                self.runtime.heap_pop(local_addr)
+
+        call_rval = CallableReturnValue(rval, out_args)
+        return call_rval, True
+
+    def map(self, arg_tuples: Iterable[Sequence[Any]]) -> Iterator[CallableReturnValue[RV]]:
+        """Call the function with each sequence of args, yielding the result of each call in turn
+
+        This is equivalent to `(self.call(*args)[0] for args in arg_tuples)`, but cheaper
+        per call: array and string args are all written into
+        a single heap block, allocated once and reused by every call, and return values
+        are interpreted by a converter looked up once (see `RTTI.converter`).
+
+        :param arg_tuples:
+            Args of each call, as they'd be passed to `call()`. This may be a lazy iterable.
+
+        """
+        if not self.rtti_method:
+            raise TypeError(
+                'Method has no type information. '
+                'Arguments must be specified manually using push_xyz methods.'
+            )
+        return self._map(arg_tuples)
+
+    def _map(self, arg_tuples: Iterable[Sequence[Any]]) -> Iterator[CallableReturnValue[RV]]:
+        from smx.sourcemod.natives.base import convert_return_value
+
+        amx = self.runtime.amx
+        if not amx.initialized:
+            amx.init()
+
+        return_type = self.rtti_method.rtti.inner
+        if return_type.type == RTTIControlByte.FIXED_ARRAY:
+            # NOTE: array return buffers are pushed outside of the args, so these calls
+            #       are left to invoke()
+            for args in arg_tuples:
+                call_rval, _ = self.call(*args)
+                yield call_rval
+            return
+
+        convert_rval = self.rtti_method.rtti.converter
+
+        # Local address and size of the heap block holding the array and string args
+        block_addr = None
+        block_cells = 0
+        try:
+            for args in arg_tuples:
+                self._params = []
+                self.push_params(*args)
+                params = self._params
+
+                num_cells = sum(self._param_num_cells(param) for param in params if param.marked)
+                if num_cells > block_cells:
+                    if block_addr is not None:
+                        self.runtime.heap_pop(block_addr)
+                    block_addr, _ = self.runtime.heap_alloc(num_cells)
+                    block_cells = num_cells
+
+                call_args: List[int] = []
+                local_addrs: List[int] = []
+                addr = block_addr
+                for param in params:
+                    if param.marked:
+                        self._write_param(param, addr)
+                        call_args.append(addr)
+                        local_addrs.append(addr)
+                        addr += self._param_num_cells(param) * sizeof(cell)
+                    else:
+                        call_args.append(convert_return_value(param.value))
+                        local_addrs.append(-1)
+
+                rval = convert_rval(self._call(call_args, interpret=False), amx)
+                yield CallableReturnValue(rval, self._copy_back_params(params, local_addrs, return_type))
+
+        finally:
+            # NOTE: if the generator is abandoned after the heap has been reset (e.g. by
+            #       restoring a snapshot), the block is already gone
+            if block_addr is not None and amx.HEA == block_addr + block_cells * sizeof(cell):
+                self.runtime.heap_pop(block_addr)
+
+    @staticmethod
+    def _param_num_cells(param: ParamInfo) -> int:
+        if param.is_string:
+            return (param.size + sizeof(cell) - 1) // sizeof(cell)
+        return param.size
+
+    def _write_param(self, param: ParamInfo, local_addr: int) -> None:
+        """Write the value of an array or string param to its memory on the heap, at `local_addr`"""
+        from smx.sourcemod.natives.base import convert_return_value, WritableString
+
+        if not param.is_string:
+            if param.value is not None:
+                values = [wrap_cell(convert_return_value(v)) for v in param.value]
+                array = struct.pack(f'<{len(values)}i', *values)
+                self.runtime.amx._writeheapbytes(local_addr, array)
+
+        elif param.string_flags & ParamStringFlag.COPY and param.value is not None:
+            # TODO(zk): forego these flags for PluginFunction
+            if param.string_flags & ParamStringFlag.UTF8:
+                assert isinstance(param.value, str)
+                value = param.value.encode('utf-8')
+            elif param.string_flags & ParamStringFlag.BINARY:
+                assert isinstance(param.value, bytes)
+                value = param.value
+            else:
+                assert isinstance(param.value, str)
+                value = param.value.encode('latin-1')
+            buf = WritableString(self.runtime.amx, local_addr, param.size)
+            buf.write(value, null_terminate=True)
+
+    def _copy_back_params(
+        self,
+        params: List[ParamInfo],
+        local_addrs: List[int],
+        return_type: RTTI | None,
+    ) -> List[ParamValueT | None]:
+        """Return the values of unmarked params, and of marked params copied back after the call"""
+        out_args: List[ParamValueT | None] = []
+        for i, (param, local_addr) in enumerate(zip(params, local_addrs)):
             if not param.marked:
-                out_args_rev.append(param.value)
+                out_args.append(param.value)
+                continue
+
+            if not param.flags & ParamCopyFlag.COPYBACK:
                 continue
 
             if param.is_rval_buffer:
@@ -416,23 +624,22 @@ class PluginFunction(Generic[P, RV], ICallable[P, RV]):
                 # Default cell type
                 rtti_arg = RTTI(self.runtime.plugin, type=RTTIControlByte.ANY)
 
-            if param.flags & ParamCopyFlag.COPYBACK:
-                if param.is_string:
-                    out_args_rev.append(rtti_arg.interpret_value(param.local_addr, self.runtime.amx, size=param.size))
-                elif param.is_scalar:
-                    val = self.runtime.amx._getheapcell(param.local_addr)
-                    out_args_rev.append(rtti_arg.interpret_value(val, self.runtime.amx))
-                else:
-                    cells = self.runtime.amx._getheap(param.local_addr, (cell * param.size))
-                    values = [rtti_arg.interpret_value(c.value, self.runtime.amx) for c in cells]
-                    out_args_rev.append(values)
-
-            self.runtime.heap_pop(param.local_addr)
+            if param.is_string:
+                out_args.append(rtti_arg.interpret_value(local_addr, self.runtime.amx, size=param.size))
+            elif param.is_scalar:
+                val = self.runtime.amx._getheapcell(local_addr)
+                out_args.append(rtti_arg.converter(val, self.runtime.amx))
+            else:
+                start = local_addr >> 2
+                cells = self.runtime.amx.mem_cells[start:start + param.size]
+                if rtti_arg.type in (RTTIControlByte.FIXED_ARRAY, RTTIControlByte.ARRAY):
+                    rtti_arg = rtti_arg.inner
+                convert = rtti_arg.converter
+                out_args.append([convert(c, self.runtime.amx) for c in cells])
 
-        call_rval = CallableReturnValue(rval, out_args_rev[::-1])
-        return call_rval, True
+        return out_args
 
-    def _call(self, args: List[int]) -> Any:
+    def _call(self, args: List[int], *, interpret: bool = True) -> Any:
         if not self.runtime.amx.initialized:
             self.runtime.amx.init()
 
@@ -457,11 +664,10 @@ class PluginFunction(Generic[P, RV], ICallable[P, RV]):
 
         try:
             # Execute the function body
-            return self.runtime.amx._execute(self.code_offs)
+            return self.runtime.amx._execute(self.code_offs, interpret=interpret)
         finally:
             # Restore the previous runtime state
             self.runtime.amx.STK = prev_stk
-            self.runtime.amx._filter_stack(prev_stk)
             self.runtime.amx.HEA = prev_hea
             self.runtime.amx.FRM = prev_frm
             self.runtime.amx._hp_scope = prev_hp_scope
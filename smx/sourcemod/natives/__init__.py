@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TYPE_CHECKING
 
 from smx.sourcemod.natives.admin import AdminNatives
 from smx.sourcemod.natives.adminmenu import AdminmenuNatives
@@ -10,7 +10,7 @@ from smx.sourcemod.natives.adt_array import AdtArrayNatives
 from smx.sourcemod.natives.adt_stack import AdtStackNatives
 from smx.sourcemod.natives.adt_trie import AdtTrieNatives
 from smx.sourcemod.natives.banning import BanningNatives
-from smx.sourcemod.natives.base import MethodMap
+from smx.sourcemod.natives.base import MethodMap, unbound_native
 from smx.sourcemod.natives.basecomm import BasecommNatives
 from smx.sourcemod.natives.bitbuffer import BitbufferNatives
 from smx.sourcemod.natives.clientprefs import ClientprefsNatives
@@ -69,6 +69,7 @@ from smx.sourcemod.natives.usermessages import UsermessagesNatives
 from smx.sourcemod.natives.vector import VectorNatives
 
 if TYPE_CHECKING:
+    from smx.reader import Native
     from smx.runtime import SourcePawnPluginRuntime
     from smx.sourcemod.system import SourceModSystem
 
@@ -93,7 +94,7 @@ class BaseSourceModNatives:
         """
         self.sys = sys
         self.amx = self.sys.amx
-        self.runtime: SourcePawnPluginRuntime = self.amx.plugin.runtime
+        self.runtime: SourcePawnPluginRuntime = self.amx.runtime
 
     def get_native(self, qn: str) -> Callable[..., Any] | None:
         parts = qn.split('.', maxsplit=1)
@@ -103,6 +104,8 @@ class BaseSourceModNatives:
             if not isinstance(methodmap, MethodMap):
                 return None
 
+            # Property accessors (e.g. "ArrayList.Length.get") are implemented as Length_get
+            func_name = func_name.replace('.', '_')
             root = methodmap
         else:
             func_name = qn
@@ -112,6 +115,20 @@ class BaseSourceModNatives:
         if callable(func) and getattr(func, 'is_native', False):
             return func
 
+    def bind_natives(self, natives: Sequence[Native]) -> List[Callable[[Sequence[int]], int]]:
+        """Resolve each of a plug-in's natives to its implementation, in the same order
+
+        Natives without an implementation — including generated stubs, declared with
+        `@native(stub=True)` — are bound to `unbound_native`.
+        """
+        bound = []
+        for native in natives:
+            func = self.get_native(native.name)
+            if func is None or getattr(func, 'is_stub', False):
+                func = unbound_native
+            bound.append(func)
+        return bound
+
     @classmethod
     def _get_all_natives(cls) -> Dict[str, Callable[..., Any]]:
         natives = {}
@@ -71,123 +71,123 @@ class AdminCachePart(IntEnum):
 
 
 class AdminNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def DumpAdminCache(self, part: AdminCachePart, rebuild: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddCommandOverride(self, cmd: str, type_: OverrideType, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCommandOverride(self, cmd: str, type_: OverrideType, flags: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def UnsetCommandOverride(self, cmd: str, type_: OverrideType) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateAdmGroup(self, group_name: str) -> GroupId:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindAdmGroup(self, group_name: str) -> GroupId:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAdmGroupAddFlag(self, id: GroupId, flag: AdminFlag, enabled: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdmGroupAddFlag(self, id: GroupId, flag: AdminFlag) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdmGroupAddFlags(self, id: GroupId) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAdmGroupImmunity(self, id: GroupId, type_: ImmunityType, enabled: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdmGroupImmunity(self, id: GroupId, type_: ImmunityType) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAdmGroupImmuneFrom(self, id: GroupId, other_id: GroupId) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdmGroupImmuneCount(self, id: GroupId) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdmGroupImmuneFrom(self, id: GroupId, number: int) -> GroupId:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddAdmGroupCmdOverride(self, id: GroupId, name: str, type_: OverrideType, rule: OverrideRule) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdmGroupCmdOverride(self, id: GroupId, name: str, type_: OverrideType, rule: Pointer[OverrideRule]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RegisterAuthIdentType(self, name: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateAdmin(self, name: str) -> AdminId:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdminUsername(self, id: AdminId, name: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BindAdminIdentity(self, id: AdminId, auth: str, ident: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAdminFlag(self, id: AdminId, flag: AdminFlag, enabled: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdminFlag(self, id: AdminId, flag: AdminFlag, mode: AdmAccessMode) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdminFlags(self, id: AdminId, mode: AdmAccessMode) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AdminInheritGroup(self, id: AdminId, gid: GroupId) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdminGroupCount(self, id: AdminId) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdminGroup(self, id: AdminId, index: int, name: WritableString) -> GroupId:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAdminPassword(self, id: AdminId, password: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdminPassword(self, id: AdminId, buffer: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindAdminByIdentity(self, auth: str, identity: str) -> AdminId:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveAdmin(self, id: AdminId) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -205,50 +205,50 @@ class AdminNatives(SourceModNativesMixin):
             bits |= array[i] << i
         return bits & 0xFFFFFFFF
 
-    @native
+    @native(stub=True)
     def FlagArrayToBits(self, array: Array[AdminFlag], num_flags: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FlagBitsToArray(self, bits: int, array: Array[AdminFlag], max_size: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindFlagByName(self, name: str, flag: Pointer[AdminFlag]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindFlagByChar(self, c: int, flag: Pointer[AdminFlag]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindFlagChar(self, flag: AdminFlag, c: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFlagString(self, flags: str, numchars: Pointer[int]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CanAdminTarget(self, admin: AdminId, target: AdminId) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateAuthMethod(self, method: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAdmGroupImmunityLevel(self, gid: GroupId, level: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdmGroupImmunityLevel(self, gid: GroupId) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAdminImmunityLevel(self, id: AdminId, level: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAdminImmunityLevel(self, id: AdminId) -> int:
         raise SourcePawnUnboundNativeError
@@ -7,14 +7,14 @@ from smx.sourcemod.natives.topmenus import TopMenu
 
 
 class AdminmenuNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GetAdminTopMenu(self) -> SourceModHandle[SourceModHandle[TopMenu]]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddTargetsToMenu(self, menu: SourceModHandle, source_client: int, in_game_only: bool, alive_only: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddTargetsToMenu2(self, menu: SourceModHandle, source_client: int, flags: int) -> int:
         raise SourcePawnUnboundNativeError
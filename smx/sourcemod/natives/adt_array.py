@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from smx.exceptions import SourcePawnUnboundNativeError
+from array import array
+from functools import cmp_to_key
+from random import Random
+from typing import Dict, List, Sequence, TYPE_CHECKING
+
 from smx.sourcemod.handles import SourceModHandle
 from smx.sourcemod.natives.base import (
     Array,
@@ -9,170 +13,547 @@ from smx.sourcemod.natives.base import (
     WritableString,
     native,
 )
-from smx.sourcemod.natives.sorting import SortFuncADTArray, SortOrder, SortType
+from smx.sourcemod.natives.sorting import SortOrder, SortType
+
+if TYPE_CHECKING:
+    from smx.runtime import PluginFunction
 
 
 class ArrayList:
-    pass
+    """Dynamic array of blocks of `blocksize` cells each
+
+    All blocks are stored inline, one after the other, in a single array('i'), so
+    copies of whole blocks to and from the AMX's memory are plain slice copies.
+
+    Lists of at least INDEX_MIN_LENGTH blocks index their values as they're searched
+    (by block), and their strings, so repeated lookups don't scan the whole list.
+    """
+
+    #: Minimum number of blocks before value/string indexes are built
+    INDEX_MIN_LENGTH = 64
+
+    def __init__(self, blocksize: int = 1, startsize: int = 0):
+        self.blocksize = blocksize
+        self.cells = array('i', bytes(blocksize * startsize * 4))
+
+        #: Index of the first block holding each value, by block (cell offset into the blocks)
+        self._value_indexes: Dict[int, Dict[int, int]] = {}
+        #: Index of the first block holding each string
+        self._string_index: Dict[bytes, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.cells) // self.blocksize
+
+    def __repr__(self) -> str:
+        return f'<ArrayList blocksize={self.blocksize} length={len(self)}>'
+
+    def clone(self) -> ArrayList:
+        clone = ArrayList(self.blocksize)
+        clone.cells = array('i', self.cells)
+        return clone
+
+    def clear(self) -> None:
+        del self.cells[:]
+        self._invalidate()
+
+    def resize(self, length: int) -> None:
+        num_cells = length * self.blocksize
+        if num_cells == len(self.cells):
+            return
+
+        if num_cells < len(self.cells):
+            del self.cells[num_cells:]
+            self._invalidate()
+        else:
+            self._extend(bytes((num_cells - len(self.cells)) * 4))
+
+    def push(self, value: int) -> int:
+        return self._extend(array('i', (value,)).tobytes() + bytes((self.blocksize - 1) * 4))
+
+    def push_string(self, value: bytes) -> int:
+        return self._extend(self._pack_string(value))
+
+    def push_array(self, values: memoryview) -> int:
+        """Push a block copied from the given cells (truncated or zero-padded to the block size)"""
+        values = values[:self.blocksize]
+        if len(values) < self.blocksize:
+            return self._extend(values.tobytes() + bytes((self.blocksize - len(values)) * 4))
+        return self._extend(values.cast('B'))
+
+    def get(self, index: int, block: int = 0) -> int:
+        return self.cells[index * self.blocksize + block]
+
+    def get_char(self, index: int, offset: int) -> int:
+        with memoryview(self.cells) as cells, cells.cast('b') as chars:
+            return chars[index * self.blocksize * 4 + offset]
+
+    def get_string(self, index: int) -> bytes:
+        with memoryview(self.cells) as cells:
+            data = cells[index * self.blocksize:(index + 1) * self.blocksize].tobytes()
+        return data.split(b'\0', 1)[0]
+
+    def get_array(self, index: int, dest: memoryview) -> int:
+        """Copy (up to) a block into the given cells, returning the number of cells copied"""
+        num_cells = min(len(dest), self.blocksize)
+        start = index * self.blocksize
+        with memoryview(self.cells) as cells:
+            dest[:num_cells] = cells[start:start + num_cells]
+        return num_cells
+
+    def set(self, index: int, value: int, block: int = 0) -> None:
+        pos = index * self.blocksize + block
+        old_value = self.cells[pos]
+        self.cells[pos] = value
+        if old_value == value:
+            return
+
+        self._string_index = None
+
+        value_index = self._value_indexes.get(block)
+        if value_index is not None:
+            if value_index.get(old_value) == index:
+                # Find the next block holding the old value, if any
+                try:
+                    next_index = index + 1 + self.cells[pos + self.blocksize::self.blocksize].index(old_value)
+                except ValueError:
+                    del value_index[old_value]
+                else:
+                    value_index[old_value] = next_index
+
+            if value_index.get(value, index) >= index:
+                value_index[value] = index
+
+    def set_char(self, index: int, offset: int, value: int) -> None:
+        with memoryview(self.cells) as cells, cells.cast('B') as chars:
+            chars[index * self.blocksize * 4 + offset] = value & 0xFF
+        self._invalidate()
+
+    def set_string(self, index: int, value: bytes) -> int:
+        """Store a string in a block, returning the number of bytes written (sans null terminator)"""
+        value = value[:self.blocksize * 4 - 1] + b'\0'
+        with memoryview(self.cells) as cells, cells.cast('B') as chars:
+            start = index * self.blocksize * 4
+            chars[start:start + len(value)] = value
+        self._invalidate()
+        return len(value) - 1
+
+    def set_array(self, index: int, values: memoryview) -> int:
+        """Copy (up to) a block from the given cells, returning the number of cells copied"""
+        num_cells = min(len(values), self.blocksize)
+        start = index * self.blocksize
+        with memoryview(self.cells) as cells:
+            cells[start:start + num_cells] = values[:num_cells]
+        self._invalidate()
+        return num_cells
+
+    def shift_up(self, index: int) -> None:
+        """Make room for a block at `index`, shifting it and all blocks after it up by one
+
+        As in SourceMod, the block at `index` is left as it was (i.e. duplicated).
+        """
+        start = index * self.blocksize
+        self.cells[start:start] = self.cells[start:start + self.blocksize]
+        self._invalidate()
+
+    def erase(self, index: int) -> None:
+        del self.cells[index * self.blocksize:(index + 1) * self.blocksize]
+        self._invalidate()
+
+    def swap(self, index1: int, index2: int) -> None:
+        bs = self.blocksize
+        start1, start2 = index1 * bs, index2 * bs
+        self.cells[start1:start1 + bs], self.cells[start2:start2 + bs] = \
+            self.cells[start2:start2 + bs], self.cells[start1:start1 + bs]
+        self._invalidate()
+
+    def find_value(self, value: int, block: int = 0) -> int:
+        value_index = self._value_indexes.get(block)
+        if value_index is None:
+            column = self.cells[block::self.blocksize] if self.blocksize > 1 else self.cells
+            if len(column) < self.INDEX_MIN_LENGTH:
+                try:
+                    return column.index(value)
+                except ValueError:
+                    return -1
+
+            # NOTE: iterating in reverse leaves the first index of each value in the index
+            value_index = self._value_indexes[block] = dict(zip(reversed(column), range(len(column) - 1, -1, -1)))
+
+        return value_index.get(value, -1)
+
+    def find_string(self, value: bytes) -> int:
+        if self._string_index is None:
+            strings = self._strings()
+            if len(strings) < self.INDEX_MIN_LENGTH:
+                try:
+                    return strings.index(value)
+                except ValueError:
+                    return -1
+
+            self._string_index = dict(zip(reversed(strings), range(len(strings) - 1, -1, -1)))
+
+        return self._string_index.get(value, -1)
+
+    def sort(self, order: SortOrder, type_: SortType, rand: Random) -> None:
+        """Sort the blocks by their first cell (as an int or float), or their strings"""
+        if order == SortOrder.Sort_Random:
+            indices = list(range(len(self)))
+            rand.shuffle(indices)
+            self.reorder(indices)
+            return
+
+        reverse = order == SortOrder.Sort_Descending
+        if type_ == SortType.Sort_String:
+            keys = self._strings()
+        else:
+            keys = self.cells[::self.blocksize] if self.blocksize > 1 else self.cells
+            if type_ == SortType.Sort_Float:
+                keys = array('f', keys.tobytes())
+
+        if self.blocksize == 1 and type_ == SortType.Sort_Integer:
+            self.cells = array('i', sorted(self.cells, reverse=reverse))
+            self._invalidate()
+        else:
+            self.reorder(sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse))
+
+    def reorder(self, order: Sequence[int]) -> None:
+        """Rearrange the blocks, so the block at each index is the block at order[index]"""
+        bs = self.blocksize
+        if bs == 1:
+            cells = array('i', map(self.cells.__getitem__, order))
+        else:
+            cells = array('i')
+            for index in order:
+                cells.extend(self.cells[index * bs:(index + 1) * bs])
+
+        self.cells = cells
+        self._invalidate()
+
+    def _extend(self, data) -> int:
+        """Append blocks from their raw bytes, returning the index of the first"""
+        index = len(self)
+        self.cells.frombytes(data)
+
+        appended = range(index, len(self))
+        for block, value_index in self._value_indexes.items():
+            for i in appended:
+                value_index.setdefault(self.cells[i * self.blocksize + block], i)
+        if self._string_index is not None:
+            for i in appended:
+                self._string_index.setdefault(self.get_string(i), i)
+
+        return index
+
+    def _pack_string(self, value: bytes) -> bytes:
+        value = value[:self.blocksize * 4 - 1]
+        return value + bytes(self.blocksize * 4 - len(value))
+
+    def _strings(self) -> List[bytes]:
+        data = self.cells.tobytes()
+        block_size = self.blocksize * 4
+        return [
+            data[start:start + block_size].split(b'\0', 1)[0]
+            for start in range(0, len(data), block_size)
+        ]
+
+    def _invalidate(self) -> None:
+        self._value_indexes.clear()
+        self._string_index = None
+
+
+class _ArrayListNatives(SourceModNativesMixin):
+    """Implementations shared by the ArrayList methodmap and the older, function-style natives"""
+
+    def _get_array_list(self, handle: SourceModHandle | None) -> ArrayList:
+        if handle is None or not isinstance(handle.obj, ArrayList):
+            self.amx.report_error('Invalid Handle')
+        return handle.obj
+
+    def _get_indexed_array_list(self, handle: SourceModHandle | None, index: int) -> ArrayList:
+        array_list = self._get_array_list(handle)
+        if not 0 <= index < len(array_list):
+            self.amx.report_error(f'Invalid index {index} (count: {len(array_list)})')
+        return array_list
+
+    def _check_array_list_block(self, array_list: ArrayList, block: int, as_char: bool) -> None:
+        limit = array_list.blocksize * 4 if as_char else array_list.blocksize
+        if not 0 <= block < limit:
+            self.amx.report_error(f'Invalid block {block} (blocksize: {array_list.blocksize})')
+
+    @staticmethod
+    def _array_list_num_cells(array_list: ArrayList, size: int) -> int:
+        return size if 0 <= size <= array_list.blocksize else array_list.blocksize
+
+    def _list_create(self, blocksize: int, startsize: int) -> int:
+        if blocksize < 1:
+            self.amx.report_error('Invalid block size (must be > 0)')
+        if startsize < 0:
+            self.amx.report_error('Invalid array size (must be >= 0)')
+        return self.sys.handles.new_handle(ArrayList(blocksize, startsize))
+
+    def _list_clear(self, handle: SourceModHandle | None) -> None:
+        self._get_array_list(handle).clear()
+
+    def _list_clone(self, handle: SourceModHandle | None) -> int:
+        return self.sys.handles.new_handle(self._get_array_list(handle).clone())
+
+    def _list_resize(self, handle: SourceModHandle | None, newsize: int) -> None:
+        array_list = self._get_array_list(handle)
+        if newsize < 0:
+            self.amx.report_error(f'Invalid array size: {newsize}')
+        array_list.resize(newsize)
+
+    def _list_push(self, handle: SourceModHandle | None, value: int) -> int:
+        return self._get_array_list(handle).push(value)
+
+    def _list_push_string(self, handle: SourceModHandle | None, value: str) -> int:
+        return self._get_array_list(handle).push_string(value.encode('utf8'))
+
+    def _list_push_array(self, handle: SourceModHandle | None, values: Array[int], size: int) -> int:
+        array_list = self._get_array_list(handle)
+        return array_list.push_array(values.view[:self._array_list_num_cells(array_list, size)])
+
+    def _list_get(self, handle: SourceModHandle | None, index: int, block: int, as_char: bool) -> int:
+        array_list = self._get_indexed_array_list(handle, index)
+        self._check_array_list_block(array_list, block, as_char)
+        if as_char:
+            return array_list.get_char(index, block)
+        return array_list.get(index, block)
+
+    def _list_get_string(self, handle: SourceModHandle | None, index: int, buffer: WritableString) -> int:
+        return buffer.write(self._get_indexed_array_list(handle, index).get_string(index), null_terminate=True)
+
+    def _list_get_array(self, handle: SourceModHandle | None, index: int, buffer: Array[int], size: int) -> int:
+        array_list = self._get_indexed_array_list(handle, index)
+        return array_list.get_array(index, buffer.view[:self._array_list_num_cells(array_list, size)])
+
+    def _list_set(self, handle: SourceModHandle | None, index: int, value: int, block: int, as_char: bool) -> None:
+        array_list = self._get_indexed_array_list(handle, index)
+        self._check_array_list_block(array_list, block, as_char)
+        if as_char:
+            array_list.set_char(index, block, value)
+        else:
+            array_list.set(index, value, block)
+
+    def _list_set_string(self, handle: SourceModHandle | None, index: int, value: str) -> int:
+        return self._get_indexed_array_list(handle, index).set_string(index, value.encode('utf8'))
+
+    def _list_set_array(self, handle: SourceModHandle | None, index: int, values: Array[int], size: int) -> int:
+        array_list = self._get_indexed_array_list(handle, index)
+        return array_list.set_array(index, values.view[:self._array_list_num_cells(array_list, size)])
+
+    def _list_shift_up(self, handle: SourceModHandle | None, index: int) -> None:
+        self._get_indexed_array_list(handle, index).shift_up(index)
+
+    def _list_erase(self, handle: SourceModHandle | None, index: int) -> None:
+        self._get_indexed_array_list(handle, index).erase(index)
+
+    def _list_swap(self, handle: SourceModHandle | None, index1: int, index2: int) -> None:
+        self._get_indexed_array_list(handle, index1)
+        self._get_indexed_array_list(handle, index2).swap(index1, index2)
+
+    def _list_find_string(self, handle: SourceModHandle | None, item: str) -> int:
+        return self._get_array_list(handle).find_string(item.encode('utf8'))
+
+    def _list_find_value(self, handle: SourceModHandle | None, item: int, block: int) -> int:
+        array_list = self._get_array_list(handle)
+        self._check_array_list_block(array_list, block, False)
+        return array_list.find_value(item, block)
 
+    def _list_sort(self, handle: SourceModHandle | None, order: SortOrder, type_: SortType) -> None:
+        self._get_array_list(handle).sort(order, type_, self.runtime.rand)
+
+    def _list_sort_custom(self, handle: SourceModHandle | None, sortfunc: PluginFunction | None, hndl: SourceModHandle | None) -> None:
+        array_list = self._get_array_list(handle)
+        if sortfunc is None:
+            self.amx.report_error('Invalid function id')
+
+        # NOTE: as in SourceMod, the comparator is passed indices into the list as it
+        #       was before sorting, which is left untouched until all blocks are compared
+        args = [0, 0, handle.id, hndl.id if hndl else 0]
+
+        def compare(index1: int, index2: int) -> int:
+            args[0], args[1] = index1, index2
+            return sortfunc._call(args, interpret=False)
+
+        array_list.reorder(sorted(range(len(array_list)), key=cmp_to_key(compare)))
+
+    def _list_length(self, handle: SourceModHandle | None) -> int:
+        return len(self._get_array_list(handle))
+
+    def _list_block_size(self, handle: SourceModHandle | None) -> int:
+        return self._get_array_list(handle).blocksize
+
+
+class ArrayListMethodMap(MethodMap, _ArrayListNatives):
+    @native
+    def ArrayList(self, blocksize: int, startsize: int) -> SourceModHandle[ArrayList]:
+        return self._list_create(blocksize, startsize)
 
-class ArrayListMethodMap(MethodMap):
     @native
     def Clear(self, this: SourceModHandle[ArrayList]) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_clear(this)
 
     @native
     def Clone(self, this: SourceModHandle[ArrayList]) -> SourceModHandle[ArrayList]:
-        raise SourcePawnUnboundNativeError
+        return self._list_clone(this)
 
     @native
     def Resize(self, this: SourceModHandle[ArrayList], newsize: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_resize(this, newsize)
 
     @native
     def Push(self, this: SourceModHandle[ArrayList], value: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_push(this, value)
 
     @native
     def PushString(self, this: SourceModHandle[ArrayList], value: str) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_push_string(this, value)
 
     @native
     def PushArray(self, this: SourceModHandle[ArrayList], values: Array[int], size: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_push_array(this, values, size)
 
     @native
     def Get(self, this: SourceModHandle[ArrayList], index: int, block: int, as_char: bool) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_get(this, index, block, as_char)
 
     @native
     def GetString(self, this: SourceModHandle[ArrayList], index: int, buffer: WritableString) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_get_string(this, index, buffer)
 
     @native
     def GetArray(self, this: SourceModHandle[ArrayList], index: int, buffer: Array[int], size: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_get_array(this, index, buffer, size)
 
     @native
     def Set(self, this: SourceModHandle[ArrayList], index: int, value: int, block: int, as_char: bool) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_set(this, index, value, block, as_char)
 
     @native
     def SetString(self, this: SourceModHandle[ArrayList], index: int, value: str) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_set_string(this, index, value)
 
     @native
     def SetArray(self, this: SourceModHandle[ArrayList], index: int, values: Array[int], size: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_set_array(this, index, values, size)
 
     @native
     def ShiftUp(self, this: SourceModHandle[ArrayList], index: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_shift_up(this, index)
 
     @native
     def Erase(self, this: SourceModHandle[ArrayList], index: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_erase(this, index)
 
     @native
     def SwapAt(self, this: SourceModHandle[ArrayList], index1: int, index2: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_swap(this, index1, index2)
 
     @native
     def FindString(self, this: SourceModHandle[ArrayList], item: str) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_find_string(this, item)
 
     @native
     def FindValue(self, this: SourceModHandle[ArrayList], item: int, block: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_find_value(this, item, block)
 
     @native
     def Sort(self, this: SourceModHandle[ArrayList], order: SortOrder, type_: SortType) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_sort(this, order, type_)
+
+    @native
+    def SortCustom(self, this: SourceModHandle[ArrayList], sortfunc: PluginFunction, hndl: SourceModHandle) -> None:
+        self._list_sort_custom(this, sortfunc, hndl)
+
+    @native
+    def Length_get(self, this: SourceModHandle[ArrayList]) -> int:
+        return self._list_length(this)
 
     @native
-    def SortCustom(self, this: SourceModHandle[ArrayList], sortfunc: SortFuncADTArray, hndl: SourceModHandle) -> None:
-        raise SourcePawnUnboundNativeError
+    def BlockSize_get(self, this: SourceModHandle[ArrayList]) -> int:
+        return self._list_block_size(this)
 
 
-class AdtArrayNatives(SourceModNativesMixin):
+class AdtArrayNatives(_ArrayListNatives):
     ArrayList = ArrayListMethodMap()
 
     @native
     def CreateArray(self, blocksize: int, startsize: int) -> SourceModHandle[ArrayList]:
-        raise SourcePawnUnboundNativeError
+        return self._list_create(blocksize, startsize)
 
     @native
     def ClearArray(self, array: SourceModHandle) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_clear(array)
 
     @native
     def CloneArray(self, array: SourceModHandle) -> SourceModHandle:
-        raise SourcePawnUnboundNativeError
+        return self._list_clone(array)
 
     @native
     def ResizeArray(self, array: SourceModHandle, newsize: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_resize(array, newsize)
 
     @native
     def GetArraySize(self, array: SourceModHandle) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_length(array)
 
     @native
     def PushArrayCell(self, array: SourceModHandle, value: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_push(array, value)
 
     @native
     def PushArrayString(self, array: SourceModHandle, value: str) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_push_string(array, value)
 
     @native
     def PushArrayArray(self, array: SourceModHandle, values: Array[int], size: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_push_array(array, values, size)
 
     @native
     def GetArrayCell(self, array: SourceModHandle, index: int, block: int, as_char: bool) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_get(array, index, block, as_char)
 
     @native
     def GetArrayString(self, array: SourceModHandle, index: int, buffer: WritableString) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_get_string(array, index, buffer)
 
     @native
     def GetArrayArray(self, array: SourceModHandle, index: int, buffer: Array[int], size: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_get_array(array, index, buffer, size)
 
     @native
     def SetArrayCell(self, array: SourceModHandle, index: int, value: int, block: int, as_char: bool) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_set(array, index, value, block, as_char)
 
     @native
     def SetArrayString(self, array: SourceModHandle, index: int, value: str) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_set_string(array, index, value)
 
     @native
     def SetArrayArray(self, array: SourceModHandle, index: int, values: Array[int], size: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_set_array(array, index, values, size)
 
     @native
     def ShiftArrayUp(self, array: SourceModHandle, index: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_shift_up(array, index)
 
     @native
     def RemoveFromArray(self, array: SourceModHandle, index: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_erase(array, index)
 
     @native
     def SwapArrayItems(self, array: SourceModHandle, index1: int, index2: int) -> None:
-        raise SourcePawnUnboundNativeError
+        self._list_swap(array, index1, index2)
 
     @native
     def FindStringInArray(self, array: SourceModHandle, item: str) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_find_string(array, item)
 
     @native
     def FindValueInArray(self, array: SourceModHandle, item: int, block: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_find_value(array, item, block)
 
     @native
     def GetArrayBlockSize(self, array: SourceModHandle) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._list_block_size(array)
@@ -17,35 +17,35 @@ class ArrayStack:
 
 
 class ArrayStackMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Clear(self, this: SourceModHandle[ArrayStack]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Clone(self, this: SourceModHandle[ArrayStack]) -> SourceModHandle[ArrayStack]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Push(self, this: SourceModHandle[ArrayStack], value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PushString(self, this: SourceModHandle[ArrayStack], value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PushArray(self, this: SourceModHandle[ArrayStack], values: Array[int], size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Pop(self, this: SourceModHandle[ArrayStack], block: int, as_char: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PopString(self, this: SourceModHandle[ArrayStack], buffer: WritableString, written: Pointer[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PopArray(self, this: SourceModHandle[ArrayStack], buffer: Array[int], size: int) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -53,38 +53,38 @@ class ArrayStackMethodMap(MethodMap):
 class AdtStackNatives(SourceModNativesMixin):
     ArrayStack = ArrayStackMethodMap()
 
-    @native
+    @native(stub=True)
     def CreateStack(self, blocksize: int) -> SourceModHandle[ArrayStack]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PushStackCell(self, stack: SourceModHandle, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PushStackString(self, stack: SourceModHandle, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PushStackArray(self, stack: SourceModHandle, values: Array[int], size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PopStackCell(self, stack: SourceModHandle, value: Pointer[int], block: int, as_char: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PopStackString(self, stack: SourceModHandle, buffer: WritableString, written: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PopStackArray(self, stack: SourceModHandle, buffer: Array[int], size: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsStackEmpty(self, stack: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetStackBlockSize(self, stack: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from smx.exceptions import SourcePawnUnboundNativeError
+from array import array
+from typing import Dict, Tuple, Union
+from weakref import WeakSet
+
 from smx.sourcemod.handles import SourceModHandle
 from smx.sourcemod.natives.base import (
     Array,
@@ -11,127 +14,343 @@ from smx.sourcemod.natives.base import (
     native,
 )
 
+#: A StringMap entry's value, tagged by its type: a cell, an array of cells, or a string
+StringMapValue = Union[int, array, bytes]
+
 
 class StringMap:
-    pass
+    """Hash map of (UTF-8 encoded) keys to cells, arrays of cells, or strings"""
+
+    def __init__(self, entries: Dict[bytes, StringMapValue] | None = None):
+        self.entries: Dict[bytes, StringMapValue] = entries if entries is not None else {}
+
+        #: The keys in order, built when a snapshot first reads one by index, and shared
+        #: by all snapshots until the keys change
+        self._keys: Tuple[bytes, ...] | None = None
+        #: Snapshots still sharing the map's keys, which must be handed them before they change
+        self._snapshots: WeakSet[StringMapSnapshot] = WeakSet()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f'<StringMap size={len(self.entries)}>'
+
+    def clone(self) -> StringMap:
+        # NOTE: stored arrays are never modified in place (SetArray replaces them), so they can be shared
+        return StringMap(dict(self.entries))
+
+    def set(self, key: bytes, value: StringMapValue, replace: bool = True) -> bool:
+        """Store a value, returning False if the key is taken and `replace` is False"""
+        entries = self.entries
+        if key not in entries:
+            self._keys_changed()
+        elif not replace:
+            return False
+
+        entries[key] = value
+        return True
+
+    def remove(self, key: bytes) -> bool:
+        if key not in self.entries:
+            return False
+
+        self._keys_changed()
+        del self.entries[key]
+        return True
+
+    def clear(self) -> None:
+        self._keys_changed()
+        self.entries.clear()
+
+    def snapshot(self) -> StringMapSnapshot:
+        snapshot = StringMapSnapshot(self)
+        self._snapshots.add(snapshot)
+        return snapshot
+
+    def ordered_keys(self) -> Tuple[bytes, ...]:
+        """The keys in order, built only once for all snapshots between changes of the keys"""
+        if self._keys is None:
+            self._keys = tuple(self.entries)
+        return self._keys
+
+    def _keys_changed(self) -> None:
+        # Hand the snapshots sharing the keys a single copy of them, before they change
+        if self._snapshots:
+            for snapshot in list(self._snapshots):
+                snapshot.materialize()
+        self._keys = None
+
+    def __deepcopy__(self, memo):
+        # Copied snapshots detach from their maps on their own; see StringMapSnapshot.__deepcopy__
+        clone = self.clone()
+        memo[id(self)] = clone
+        return clone
 
 
 class StringMapSnapshot:
-    pass
+    """Keys of a StringMap, as they were when the snapshot was taken
+
+    Snapshots don't copy the keys when taken: until the map's keys change, they
+    read the map's own dict. The first key requested by index (i.e. by GetKey or
+    KeyBufferSize) is read from a tuple of the keys kept on the map, built once
+    and shared by all its snapshots. Adding or removing keys hands the snapshots
+    still tracking the map that same tuple, and the map starts a new one.
+    """
+
+    def __init__(self, string_map: StringMap):
+        self._map: StringMap | None = string_map
+        self._keys: Tuple[bytes, ...] | None = None
+
+    def __len__(self) -> int:
+        if self._keys is None:
+            return len(self._map.entries)
+        return len(self._keys)
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.materialize()[index]
+
+    def materialize(self) -> Tuple[bytes, ...]:
+        """Take the map's (shared) tuple of keys, if not already done, and stop tracking its changes"""
+        if self._keys is None:
+            self._keys = self._map.ordered_keys()
+            self._map._snapshots.discard(self)
+            self._map = None
+        return self._keys
+
+    def close(self) -> None:
+        """Stop tracking the map's changes, discarding the keys (called when the snapshot's handle is closed)"""
+        if self._keys is None:
+            self._map._snapshots.discard(self)
+            self._map = None
+        self._keys = ()
+
+    def __deepcopy__(self, memo):
+        clone = StringMapSnapshot.__new__(StringMapSnapshot)
+        clone._map = None
+        clone._keys = self.materialize()
+        memo[id(self)] = clone
+        return clone
+
+
+class _StringMapNatives(SourceModNativesMixin):
+    """Implementations shared by the StringMap methodmaps and the older, function-style natives"""
+
+    def _get_string_map(self, handle: SourceModHandle | None) -> StringMap:
+        if handle is None or not isinstance(handle.obj, StringMap):
+            self.amx.report_error('Invalid Handle')
+        return handle.obj
+
+    def _get_map_snapshot(self, handle: SourceModHandle | None, index: int | None = None) -> StringMapSnapshot:
+        if handle is None or not isinstance(handle.obj, StringMapSnapshot):
+            self.amx.report_error('Invalid Handle')
+
+        snapshot = handle.obj
+        if index is not None and not 0 <= index < len(snapshot):
+            self.amx.report_error(f'Invalid index {index}')
+        return snapshot
+
+    def _map_create(self) -> int:
+        return self.sys.handles.new_handle(StringMap())
+
+    def _map_clone(self, handle: SourceModHandle | None) -> int:
+        return self.sys.handles.new_handle(self._get_string_map(handle).clone())
+
+    def _map_set_value(self, handle: SourceModHandle | None, key: str, value: int, replace: bool) -> bool:
+        return self._get_string_map(handle).set(key.encode('utf8'), value, replace)
+
+    def _map_set_array(self, handle: SourceModHandle | None, key: str, values: Array[int], num_items: int, replace: bool) -> bool:
+        string_map = self._get_string_map(handle)
+        if num_items < 0:
+            self.amx.report_error(f'Invalid array size: {num_items}')
+
+        stored = array('i')
+        stored.frombytes(values.view[:num_items].cast('B'))
+        return string_map.set(key.encode('utf8'), stored, replace)
+
+    def _map_set_string(self, handle: SourceModHandle | None, key: str, value: str, replace: bool) -> bool:
+        return self._get_string_map(handle).set(key.encode('utf8'), value.encode('utf8'), replace)
+
+    def _map_get_value(self, handle: SourceModHandle | None, key: str, value: Pointer[int]) -> bool:
+        stored = self._get_string_map(handle).entries.get(key.encode('utf8'))
+        if stored.__class__ is not int:
+            return False
+
+        value.set(stored)
+        return True
+
+    def _map_get_array(self, handle: SourceModHandle | None, key: str, values: Array[int], max_size: int, size: Pointer[int]) -> bool:
+        stored = self._get_string_map(handle).entries.get(key.encode('utf8'))
+        if stored is None or isinstance(stored, bytes):
+            return False
+        if isinstance(stored, int):
+            # Cells are read back as arrays of one
+            stored = array('i', (stored,))
 
+        num_items = max(min(max_size, len(stored)), 0)
+        with memoryview(stored) as view:
+            values.view[:num_items] = view[:num_items]
+        size.set(num_items)
+        return True
+
+    def _map_get_string(self, handle: SourceModHandle | None, key: str, value: WritableString, size: Pointer[int]) -> bool:
+        stored = self._get_string_map(handle).entries.get(key.encode('utf8'))
+        if not isinstance(stored, bytes):
+            return False
+
+        size.set(value.write(stored, null_terminate=True))
+        return True
+
+    def _map_contains_key(self, handle: SourceModHandle | None, key: str) -> bool:
+        return key.encode('utf8') in self._get_string_map(handle).entries
+
+    def _map_remove(self, handle: SourceModHandle | None, key: str) -> bool:
+        return self._get_string_map(handle).remove(key.encode('utf8'))
+
+    def _map_clear(self, handle: SourceModHandle | None) -> None:
+        self._get_string_map(handle).clear()
+
+    def _map_size(self, handle: SourceModHandle | None) -> int:
+        return len(self._get_string_map(handle))
+
+    def _map_snapshot(self, handle: SourceModHandle | None) -> int:
+        snapshot = self._get_string_map(handle).snapshot()
+        return self.sys.handles.new_handle(snapshot, on_close=snapshot.close)
+
+    def _map_snapshot_length(self, handle: SourceModHandle | None) -> int:
+        return len(self._get_map_snapshot(handle))
+
+    def _map_snapshot_key_buffer_size(self, handle: SourceModHandle | None, index: int) -> int:
+        return len(self._get_map_snapshot(handle, index)[index]) + 1
+
+    def _map_snapshot_get_key(self, handle: SourceModHandle | None, index: int, buffer: WritableString) -> int:
+        return buffer.write(self._get_map_snapshot(handle, index)[index], null_terminate=True)
+
+
+class StringMapMethodMap(MethodMap, _StringMapNatives):
+    @native
+    def StringMap(self) -> SourceModHandle[StringMap]:
+        return self._map_create()
 
-class StringMapMethodMap(MethodMap):
     @native
     def Clone(self, this: SourceModHandle[StringMap]) -> SourceModHandle[StringMap]:
-        raise SourcePawnUnboundNativeError
+        return self._map_clone(this)
 
     @native
     def SetValue(self, this: SourceModHandle[StringMap], key: str, value: int, replace: bool) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_set_value(this, key, value, replace)
 
     @native
     def SetArray(self, this: SourceModHandle[StringMap], key: str, array: Array[int], num_items: int, replace: bool) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_set_array(this, key, array, num_items, replace)
 
     @native
     def SetString(self, this: SourceModHandle[StringMap], key: str, value: str, replace: bool) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_set_string(this, key, value, replace)
 
     @native
     def GetValue(self, this: SourceModHandle[StringMap], key: str, value: Pointer[int]) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_get_value(this, key, value)
 
     @native
     def GetArray(self, this: SourceModHandle[StringMap], key: str, array: Array[int], max_size: int, size: Pointer[int]) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_get_array(this, key, array, max_size, size)
 
     @native
-    def GetString(self, this: SourceModHandle[StringMap], key: str, value: str, max_size: int, size: Pointer[int]) -> bool:
-        raise SourcePawnUnboundNativeError
+    def GetString(self, this: SourceModHandle[StringMap], key: str, value: WritableString, size: Pointer[int]) -> bool:
+        return self._map_get_string(this, key, value, size)
 
     @native
     def ContainsKey(self, this: SourceModHandle[StringMap], key: str) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_contains_key(this, key)
 
     @native
     def Remove(self, this: SourceModHandle[StringMap], key: str) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_remove(this, key)
 
     @native
     def Clear(self, this: SourceModHandle[StringMap]) -> None:
-        raise SourcePawnUnboundNativeError
+        self._map_clear(this)
 
     @native
     def Snapshot(self, this: SourceModHandle[StringMap]) -> SourceModHandle[StringMapSnapshot]:
-        raise SourcePawnUnboundNativeError
+        return self._map_snapshot(this)
+
+    @native
+    def Size_get(self, this: SourceModHandle[StringMap]) -> int:
+        return self._map_size(this)
 
 
-class StringMapSnapshotMethodMap(MethodMap):
+class StringMapSnapshotMethodMap(MethodMap, _StringMapNatives):
     @native
     def KeyBufferSize(self, this: SourceModHandle[StringMapSnapshot], index: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._map_snapshot_key_buffer_size(this, index)
 
     @native
     def GetKey(self, this: SourceModHandle[StringMapSnapshot], index: int, buffer: WritableString) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._map_snapshot_get_key(this, index, buffer)
+
+    @native
+    def Length_get(self, this: SourceModHandle[StringMapSnapshot]) -> int:
+        return self._map_snapshot_length(this)
 
 
-class AdtTrieNatives(SourceModNativesMixin):
+class AdtTrieNatives(_StringMapNatives):
     StringMap = StringMapMethodMap()
     StringMapSnapshot = StringMapSnapshotMethodMap()
 
     @native
     def CreateTrie(self) -> SourceModHandle[StringMap]:
-        raise SourcePawnUnboundNativeError
+        return self._map_create()
 
     @native
     def SetTrieValue(self, map_: SourceModHandle, key: str, value: int, replace: bool) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_set_value(map_, key, value, replace)
 
     @native
     def SetTrieArray(self, map_: SourceModHandle, key: str, array: Array[int], num_items: int, replace: bool) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_set_array(map_, key, array, num_items, replace)
 
     @native
     def SetTrieString(self, map_: SourceModHandle, key: str, value: str, replace: bool) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_set_string(map_, key, value, replace)
 
     @native
     def GetTrieValue(self, map_: SourceModHandle, key: str, value: Pointer[int]) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_get_value(map_, key, value)
 
     @native
     def GetTrieArray(self, map_: SourceModHandle, key: str, array: Array[int], max_size: int, size: Pointer[int]) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_get_array(map_, key, array, max_size, size)
 
     @native
-    def GetTrieString(self, map_: SourceModHandle, key: str, value: str, max_size: int, size: Pointer[int]) -> bool:
-        raise SourcePawnUnboundNativeError
+    def GetTrieString(self, map_: SourceModHandle, key: str, value: WritableString, size: Pointer[int]) -> bool:
+        return self._map_get_string(map_, key, value, size)
 
     @native
     def RemoveFromTrie(self, map_: SourceModHandle, key: str) -> bool:
-        raise SourcePawnUnboundNativeError
+        return self._map_remove(map_, key)
 
     @native
     def ClearTrie(self, map_: SourceModHandle) -> None:
-        raise SourcePawnUnboundNativeError
+        self._map_clear(map_)
 
     @native
     def GetTrieSize(self, map_: SourceModHandle) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._map_size(map_)
 
     @native
     def CreateTrieSnapshot(self, map_: SourceModHandle) -> SourceModHandle:
-        raise SourcePawnUnboundNativeError
+        return self._map_snapshot(map_)
 
     @native
     def TrieSnapshotLength(self, snapshot: SourceModHandle) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._map_snapshot_length(snapshot)
 
     @native
     def TrieSnapshotKeyBufferSize(self, snapshot: SourceModHandle, index: int) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._map_snapshot_key_buffer_size(snapshot, index)
 
     @native
     def GetTrieSnapshotKey(self, snapshot: SourceModHandle, index: int, buffer: WritableString) -> int:
-        raise SourcePawnUnboundNativeError
+        return self._map_snapshot_get_key(snapshot, index, buffer)
@@ -5,14 +5,14 @@ from smx.sourcemod.natives.base import SourceModNativesMixin, native
 
 
 class BanningNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def BanClient(self, client: int, time: int, flags: int, reason: str, kick_message: str, command: str, source: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BanIdentity(self, identity: str, time: int, flags: int, reason: str, command: str, source: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveBan(self, identity: str, flags: int, command: str, source: int) -> bool:
         raise SourcePawnUnboundNativeError
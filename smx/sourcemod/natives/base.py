@@ -5,7 +5,7 @@ import inspect
 import struct
 import typing
 from ctypes import c_float, c_long, pointer
-from functools import wraps
+from functools import partial, wraps
 from typing import (
     Any,
     Callable,
@@ -23,11 +23,14 @@ from typing import (
 )
 
 from smx.compat import get_annotations, NoneType, StrEnum
-from smx.definitions import cell, PyCSimpleType, ucell
+from smx.definitions import cell, PyCSimpleType, ucell, wrap_cell
+from smx.exceptions import SourcePawnUnboundNativeError
 from smx.sourcemod.handles import SourceModHandle
 from smx.struct import cast_value
 
 if TYPE_CHECKING:
+    from typing import NoReturn
+
     from smx.sourcemod.natives import SourceModNatives
     from smx.sourcemod.system import SourceModSystem
     from smx.vm import SourcePawnAbstractMachine
@@ -40,6 +43,10 @@ def sp_ctof(value: int):
     return cast_value(c_float, cf)
 
 
+_unpack_float = struct.Struct('<f').unpack
+_pack_ucell = struct.Struct('<I').pack
+
+
 def sp_ftoc(value: float) -> int:
     return struct.unpack('<L', struct.pack('<f', value))[0]
 
@@ -77,6 +84,14 @@ def convert_return_value(rval: NativeReturnType) -> int:
         raise TypeError(f'Unsupported return value {rval!r}')
 
 
+_AMX_PARAM_TYPES = frozenset({
+    NativeParamType.STRING,
+    NativeParamType.WRITABLE_STRING,
+    NativeParamType.ARRAY,
+    NativeParamType.POINTER,
+})
+
+
 class NativeImpl:
     is_native = True
 
@@ -86,66 +101,127 @@ class NativeImpl:
 
     _annotation_ns: ClassVar[Dict[str, Any]] | None = None
 
-    def __init__(self, impl: Callable[..., float | int | bool | None]):
+    #: Marshaller factories, keyed by the shape of the natives' signatures
+    _marshaller_factories: ClassVar[Dict[Tuple[Tuple[NativeParamType, bool], ...], Callable[..., Callable]]] = {}
+
+    def __init__(self, impl: Callable[..., float | int | bool | None], *, stub: bool = False):
         self.impl = impl
+        #: Whether the native is a generated stub, which only raises SourcePawnUnboundNativeError
+        self.is_stub = stub
         self.native_func = None
         self.param_types = None
 
+    def __set_name__(self, owner, name):
+        # Generate the marshalling function as soon as the natives class is defined.
+        # Natives with unsupported signatures only raise once they're actually bound.
+        try:
+            self._compile()
+        except TypeError:
+            self.param_types = None
+
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
-        if self.param_types is None:
-            self._init_params()
-
         if self.native_func is None:
-            @wraps(self.impl)
-            def _native(natives: SourceModNatives, params: Sequence[int]):
-                return self(natives, params)
-
-            _native.is_native = True
-            self.native_func = _native
+            self._compile()
 
         return self.native_func.__get__(instance, owner)
 
     def __call__(self, natives: SourceModNatives, params: Sequence[int]):
-        num_params = params[0]
-        args = params[1:1 + num_params]
+        if self.native_func is None:
+            self._compile()
+        return self.native_func(natives, params)
 
-        interpreted_args = []
+    def _compile(self):
+        """Generate a function marshalling VM params into the impl's args, specialized to its signature"""
+        if self.native_func is not None:
+            return
+
+        if self.param_types is None:
+            self._init_params()
+
+        # Plain ints, floats, and strs need no coercion
+        shape = tuple(
+            (param_type, coerce not in (int, float, str))
+            for param_type, coerce in self.param_types
+        )
+        make_native = self._marshaller_factories.get(shape)
+        if make_native is None:
+            make_native = self._marshaller_factories[shape] = self._generate_marshaller(shape)
+
+        native_func = wraps(self.impl)(make_native(self.impl, *(coerce for _, coerce in self.param_types)))
+        native_func.is_native = True
+        native_func.is_stub = self.is_stub
+        self.native_func = native_func
+
+    @staticmethod
+    def _generate_marshaller(shape: Tuple[Tuple[NativeParamType, bool], ...]) -> Callable[..., Callable]:
+        """Generate a factory for natives accepting params of the given types
+
+        The factory accepts the impl and one coercer per param, and returns a
+        function converting the VM's params (where params[0] is the number of
+        args) and passing them to the impl.
+        """
+        args = []
         i = 0
-        for param_type, coerce in self.param_types:
+        for idx, (param_type, needs_coerce) in enumerate(shape):
             if param_type == NativeParamType.VARARGS:
-                interpreted_args.extend(args[i:])
+                args.append(f'*params[{i + 1}:num_params + 1]')
                 break
 
-            arg = args[i]
-            if param_type == NativeParamType.CELL:
-                interpreted_args.append(coerce(arg))
-            elif param_type == NativeParamType.BOOL:
-                interpreted_args.append(coerce(arg))
+            arg = f'params[{i + 1}]'
+            if param_type in (NativeParamType.CELL, NativeParamType.BOOL):
+                expr = arg
             elif param_type == NativeParamType.FLOAT:
-                interpreted_args.append(coerce(sp_ctof(arg)))
+                expr = f'unpack_float(pack_ucell({arg} & 0xFFFFFFFF))[0]'
             elif param_type == NativeParamType.STRING:
-                interpreted_args.append(coerce(natives.amx._getheapstring(arg)))
+                expr = f'amx._getheapstring({arg})'
             elif param_type == NativeParamType.WRITABLE_STRING:
-                s = arg
                 i += 1
-                maxlen = args[i]
-                interpreted_args.append(WritableString(natives.amx, s, maxlen))
+                expr = f'WritableString(amx, {arg}, params[{i + 1}])'
+                needs_coerce = False
             elif param_type in (NativeParamType.ARRAY, NativeParamType.POINTER):
-                interpreted_args.append(coerce(natives.amx, arg))
+                expr = f'coerce_{idx}(amx, {arg})'
+                needs_coerce = False
             elif param_type == NativeParamType.HANDLE:
-                interpreted_args.append(natives.sys.handles.get_raw(arg))
+                expr = f'natives.sys.handles.get_raw({arg})'
+                needs_coerce = False
             elif param_type == NativeParamType.FUNCTION:
-                interpreted_args.append(natives.runtime.get_function_by_id(arg))
+                expr = f'natives.runtime.get_function_by_id({arg})'
+                needs_coerce = False
             else:
                 raise ValueError('Unsupported param type %s' % param_type)
 
+            if needs_coerce:
+                expr = f'coerce_{idx}({expr})'
+
+            args.append(expr)
             i += 1
 
-        rval = self.impl(natives, *interpreted_args)
-        return convert_return_value(rval)
+        lines = [
+            f'def make_native(impl, {"".join(f"coerce_{idx}, " for idx in range(len(shape)))}):',
+            '    def _native(natives, params):',
+            '        num_params = params[0]',
+        ]
+        if i:
+            # Passing too few params fails, same as indexing past the end of the params would
+            lines.append(f'        if num_params < {i}: raise IndexError("Expected {i} params, got %d" % num_params)')
+        if any(param_type in _AMX_PARAM_TYPES for param_type, _ in shape):
+            lines.append('        amx = natives.amx')
+        lines += [
+            f'        return convert_return_value(impl(natives, {", ".join(args)}))',
+            '    return _native',
+        ]
+
+        namespace = {
+            'convert_return_value': convert_return_value,
+            'unpack_float': _unpack_float,
+            'pack_ucell': _pack_ucell,
+            'WritableString': WritableString,
+        }
+        exec(compile('\n'.join(lines), '<native marshaller>', 'exec'), namespace)
+        return namespace['make_native']
 
     def _init_params(self):
         from smx.runtime import PluginFunction
@@ -220,8 +296,19 @@ class NativeImpl:
         return cls._annotation_ns
 
 
-def native(impl: Callable) -> NativeImpl:
-    return NativeImpl(impl)
+def native(impl: Callable | None = None, *, stub: bool = False) -> NativeImpl | Callable[[Callable], NativeImpl]:
+    """Declare a native implementation, with its param types read from its annotations
+
+    Use `@native(stub=True)` for generated stubs, which are bound as if unimplemented.
+    """
+    if impl is None:
+        return partial(native, stub=stub)
+    return NativeImpl(impl, stub=stub)
+
+
+def unbound_native(params: Sequence[int]) -> NoReturn:
+    """Stands in for natives without an implementation"""
+    raise SourcePawnUnboundNativeError
 
 
 class SourceModNativesMixin:
@@ -290,7 +377,7 @@ class WritableString:
             s += b'\0'
             num_bytes = min(len(s), self.max_length)
 
-        self.amx._writeheap(self.string_offs, ctypes.create_string_buffer(s, num_bytes))
+        self.amx._writeheapbytes(self.string_offs, s[:num_bytes])
         return num_bytes_written
 
 
@@ -312,14 +399,25 @@ def get_c_type(py_type: Type[V]) -> PyCSimpleType:
         raise TypeError(f'Unsupported type {py_type!r}')
 
 
+#: memoryview formats of the C types references may be cast to
+VIEW_FORMATS: Dict[PyCSimpleType, str] = {
+    cell: 'i',
+    ctypes.c_float: 'f',
+    ctypes.c_bool: '?',
+    ctypes.c_char: 'c',
+    ctypes.c_ubyte: 'B',
+}
+
+
 class BaseReference(Generic[V]):
     amx: SourcePawnAbstractMachine
     offs: int
-    c_ptr: ctypes.POINTER
+    #: View of the abstract machine's memory, starting at offs, cast to c_type
+    view: memoryview
 
     py_type: ClassVar[Type]
     c_type: ClassVar[PyCSimpleType]
-    _c_ptr_type: ClassVar[Type[ctypes.POINTER]]
+    _view_format: ClassVar[str]
 
     def __class_getitem__(cls, py_type: Type[V]) -> Type[BaseReference[V]]:
         if isinstance(py_type, TypeVar):
@@ -333,7 +431,7 @@ class BaseReference(Generic[V]):
         attrs = {
             'py_type': py_type,
             'c_type': c_type,
-            '_c_ptr_type': ctypes.POINTER(c_type),
+            '_view_format': VIEW_FORMATS[c_type],
         }
         return typing.cast(Type[BaseReference], type(cls_name, (cls,), attrs))
 
@@ -346,38 +444,48 @@ class BaseReference(Generic[V]):
         self.amx = amx
         self.offs = offs
 
-        # The actual pointer to the data, which can be dereferenced to individual items
-        self.c_ptr = self._c_ptr_type(self.amx.heap)
+        self.amx._throw_if_bad_addr(self.offs)
+
+        # NOTE: memoryviews may only be cast from whole multiples of the item size
+        mem = self.amx.mem
+        end = len(mem) - (len(mem) - offs) % ctypes.sizeof(self.c_type)
+        self.view = mem[offs:end].cast(self._view_format)
 
-        # Pointer to the pointer's address, allowing us to modify that address to point where we wish
-        c_ptr_addr = ctypes.cast(ctypes.pointer(self.c_ptr), ctypes.POINTER(ctypes.c_void_p))
-        c_ptr_addr.contents.value = self.amx._throw_if_bad_addr(self.offs)
+    def _store(self, index: int, value: V) -> None:
+        try:
+            self.view[index] = value
+        except ValueError:
+            if self._view_format != 'i':
+                raise
+            # Wrap overflowing ints, as a C store would
+            self.view[index] = wrap_cell(value)
 
 
 class Array(BaseReference[V]):
     def __getitem__(self, item: int | slice) -> V | List[V]:
-        return self.c_ptr[item]
+        if isinstance(item, slice):
+            return self.view[item].tolist()
+        return self.view[item]
 
     def __setitem__(self, item: int | slice, value: V | List[V]) -> None:
         if isinstance(item, slice):
             indices = range(*item.indices(len(self)))
             for i, v in zip(indices, value):
-                self.c_ptr[i] = v
+                self._store(i, v)
         else:
-            self.c_ptr[item] = value
+            self._store(item, value)
 
     def __len__(self) -> int:
         # TODO(zk): allow config of static size
-        return self.amx.plugin.memsize - self.offs
+        return len(self.view)
 
     def __iter__(self) -> Iterator[V]:
-        for i in range(len(self)):
-            yield self[i]
+        return iter(self.view)
 
 
 class Pointer(BaseReference[V]):
     def get(self) -> V:
-        return self.c_ptr[0]
+        return self.view[0]
 
     def set(self, value: V) -> None:
-        self.c_ptr[0] = value
+        self._store(0, value)
@@ -5,18 +5,18 @@ from smx.sourcemod.natives.base import SourceModNativesMixin, native
 
 
 class BasecommNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def BaseComm_IsClientGagged(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BaseComm_IsClientMuted(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BaseComm_SetClientGag(self, client: int, gag_state: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BaseComm_SetClientMute(self, client: int, mute_state: bool) -> bool:
         raise SourcePawnUnboundNativeError
@@ -20,117 +20,117 @@ class BfRead:
 
 
 class BfWriteMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def WriteBool(self, this: SourceModHandle[BfWrite], bit: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteByte(self, this: SourceModHandle[BfWrite], byte: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteChar(self, this: SourceModHandle[BfWrite], chr_: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteShort(self, this: SourceModHandle[BfWrite], num: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteWord(self, this: SourceModHandle[BfWrite], num: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteNum(self, this: SourceModHandle[BfWrite], num: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteFloat(self, this: SourceModHandle[BfWrite], num: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteString(self, this: SourceModHandle[BfWrite], string: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteEntity(self, this: SourceModHandle[BfWrite], ent: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteAngle(self, this: SourceModHandle[BfWrite], angle: float, num_bits: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteCoord(self, this: SourceModHandle[BfWrite], coord: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteVecCoord(self, this: SourceModHandle[BfWrite], coord: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteVecNormal(self, this: SourceModHandle[BfWrite], vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteAngles(self, this: SourceModHandle[BfWrite], angles: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
 
 class BfReadMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def ReadBool(self, this: SourceModHandle[BfRead]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadByte(self, this: SourceModHandle[BfRead]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadChar(self, this: SourceModHandle[BfRead]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadShort(self, this: SourceModHandle[BfRead]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadWord(self, this: SourceModHandle[BfRead]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadNum(self, this: SourceModHandle[BfRead]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFloat(self, this: SourceModHandle[BfRead]) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadString(self, this: SourceModHandle[BfRead], buffer: WritableString, line: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadEntity(self, this: SourceModHandle[BfRead]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadAngle(self, this: SourceModHandle[BfRead], num_bits: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadCoord(self, this: SourceModHandle[BfRead]) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadVecCoord(self, this: SourceModHandle[BfRead], coord: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadVecNormal(self, this: SourceModHandle[BfRead], vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadAngles(self, this: SourceModHandle[BfRead], angles: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -139,118 +139,118 @@ class BitbufferNatives(SourceModNativesMixin):
     BfWrite = BfWriteMethodMap()
     BfRead = BfReadMethodMap()
 
-    @native
+    @native(stub=True)
     def BfWriteBool(self, bf: SourceModHandle, bit: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteByte(self, bf: SourceModHandle, byte: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteChar(self, bf: SourceModHandle, chr_: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteShort(self, bf: SourceModHandle, num: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteWord(self, bf: SourceModHandle, num: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteNum(self, bf: SourceModHandle, num: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteFloat(self, bf: SourceModHandle, num: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteString(self, bf: SourceModHandle, string: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteEntity(self, bf: SourceModHandle, ent: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteAngle(self, bf: SourceModHandle, angle: float, num_bits: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteCoord(self, bf: SourceModHandle, coord: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteVecCoord(self, bf: SourceModHandle, coord: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteVecNormal(self, bf: SourceModHandle, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfWriteAngles(self, bf: SourceModHandle, angles: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadBool(self, bf: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadByte(self, bf: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadChar(self, bf: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadShort(self, bf: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadWord(self, bf: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadNum(self, bf: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadFloat(self, bf: SourceModHandle) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadString(self, bf: SourceModHandle, buffer: WritableString, line: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadEntity(self, bf: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadAngle(self, bf: SourceModHandle, num_bits: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadCoord(self, bf: SourceModHandle) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadVecCoord(self, bf: SourceModHandle, coord: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadVecNormal(self, bf: SourceModHandle, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfReadAngles(self, bf: SourceModHandle, angles: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def BfGetNumBytesLeft(self, bf: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
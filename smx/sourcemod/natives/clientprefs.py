@@ -39,27 +39,27 @@ class Cookie:
 
 
 class CookieMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Find(self, name: str) -> SourceModHandle[Cookie]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Set(self, this: SourceModHandle[Cookie], client: int, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Get(self, this: SourceModHandle[Cookie], client: int, buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetByAuthId(self, this: SourceModHandle[Cookie], auth_id: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetPrefabMenu(self, this: SourceModHandle[Cookie], type_: CookieMenu, display: str, handler: CookieMenuHandler, info: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientTime(self, this: SourceModHandle[Cookie], client: int) -> int:
         raise SourcePawnUnboundNativeError
 
@@ -67,54 +67,54 @@ class CookieMethodMap(MethodMap):
 class ClientprefsNatives(SourceModNativesMixin):
     Cookie = CookieMethodMap()
 
-    @native
+    @native(stub=True)
     def RegClientCookie(self, name: str, description: str, access: CookieAccess) -> SourceModHandle[Cookie]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindClientCookie(self, name: str) -> SourceModHandle[Cookie]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetClientCookie(self, client: int, cookie: SourceModHandle, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientCookie(self, client: int, cookie: SourceModHandle, buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAuthIdCookie(self, auth_id: str, cookie: SourceModHandle, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AreClientCookiesCached(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetCookiePrefabMenu(self, cookie: SourceModHandle, type_: CookieMenu, display: str, handler: CookieMenuHandler, info: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetCookieMenuItem(self, handler: CookieMenuHandler, info: int, display: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShowCookieMenu(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCookieIterator(self) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadCookieIterator(self, iter_: SourceModHandle, name: str, name_len: int, access: Pointer[CookieAccess], desc: str, desc_len: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCookieAccess(self, cookie: SourceModHandle) -> CookieAccess:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientCookieTime(self, client: int, cookie: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
@@ -21,226 +21,226 @@ class AuthIdType(IntEnum):
 
 
 class ClientsNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GetMaxClients(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMaxHumanPlayers(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientCount(self, in_game_only: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientName(self, client: int, name: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientIP(self, client: int, ip: str, maxlen: int, remport: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAuthString(self, client: int, auth: str, maxlen: int, validate: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAuthId(self, client: int, auth_type: AuthIdType, auth: str, maxlen: int, validate: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetSteamAccountID(self, client: int, validate: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientUserId(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientConnected(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientInGame(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientInKickQueue(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientAuthorized(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsFakeClient(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientSourceTV(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientReplay(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientObserver(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsPlayerAlive(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientInfo(self, client: int, key: str, value: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientTeam(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetUserAdmin(self, client: int, id: AdminId, temp: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetUserAdmin(self, client: int) -> AdminId:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddUserFlags(self, client: int, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveUserFlags(self, client: int, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetUserFlagBits(self, client: int, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetUserFlagBits(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CanUserTarget(self, client: int, target: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RunAdminCacheChecks(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def NotifyPostAdminCheck(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateFakeClient(self, name: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetFakeClientConVar(self, client: int, cvar: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientHealth(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientModel(self, client: int, model: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientWeapon(self, client: int, weapon: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientMaxs(self, client: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientMins(self, client: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAbsAngles(self, client: int, ang: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAbsOrigin(self, client: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientArmor(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientDeaths(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientFrags(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientDataRate(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientTimingOut(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientTime(self, client: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientLatency(self, client: int, flow: NetFlow) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAvgLatency(self, client: int, flow: NetFlow) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAvgLoss(self, client: int, flow: NetFlow) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAvgChoke(self, client: int, flow: NetFlow) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAvgData(self, client: int, flow: NetFlow) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAvgPackets(self, client: int, flow: NetFlow) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientOfUserId(self, userid: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KickClient(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KickClientEx(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ChangeClientTeam(self, client: int, team: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientSerial(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientFromSerial(self, serial: int) -> int:
         raise SourcePawnUnboundNativeError
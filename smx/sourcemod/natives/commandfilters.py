@@ -15,14 +15,14 @@ MultiTargetFilter = Callable
 
 
 class CommandfiltersNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def ProcessTargetString(self, pattern: str, admin: int, targets: Array[int], max_targets: int, filter_flags: int, target_name: str, tn_maxlength: int, tn_is_ml: Pointer[bool]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddMultiTargetFilter(self, pattern: str, filter_: MultiTargetFilter, phrase: str, phrase_is_ml: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveMultiTargetFilter(self, pattern: str, filter_: MultiTargetFilter) -> None:
         raise SourcePawnUnboundNativeError
@@ -5,22 +5,22 @@ from smx.sourcemod.natives.base import SourceModNativesMixin, native
 
 
 class CommandlineNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GetCommandLine(self, command_line: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCommandLineParam(self, param: str, value: str, maxlen: int, def_value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCommandLineParamInt(self, param: str, def_value: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCommandLineParamFloat(self, param: str, def_value: float) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindCommandLineParam(self, param: str) -> bool:
         raise SourcePawnUnboundNativeError
@@ -29,15 +29,15 @@ class CommandIterator:
 
 
 class CommandIteratorMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Next(self, this: SourceModHandle[CommandIterator]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetDescription(self, this: SourceModHandle[CommandIterator], buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetName(self, this: SourceModHandle[CommandIterator], buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -45,35 +45,35 @@ class CommandIteratorMethodMap(MethodMap):
 class ConsoleNatives(SourceModNativesMixin):
     CommandIterator = CommandIteratorMethodMap()
 
-    @native
+    @native(stub=True)
     def ServerCommand(self, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ServerCommandEx(self, buffer: str, maxlen: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def InsertServerCommand(self, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ServerExecute(self) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ClientCommand(self, client: int, fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FakeClientCommand(self, client: int, fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FakeClientCommandEx(self, client: int, fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FakeClientCommandKeyValues(self, client: int, kv: SourceModHandle[SourceModHandle[KeyValues]]) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -82,110 +82,110 @@ class ConsoleNatives(SourceModNativesMixin):
         out = atcprintf(self.amx, fmt, args)
         self.runtime.printf(out)
 
-    @native
+    @native(stub=True)
     def PrintToConsole(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReplyToCommand(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCmdReplySource(self) -> ReplySource:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetCmdReplySource(self, source: ReplySource) -> ReplySource:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsChatTrigger(self) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShowActivity2(self, client: int, tag: str, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShowActivity(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShowActivityEx(self, client: int, tag: str, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FormatActivitySource(self, client: int, target: int, namebuf: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RegServerCmd(self, cmd: str, callback: SrvCmd, description: str, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RegConsoleCmd(self, cmd: str, callback: ConCmd, description: str, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RegAdminCmd(self, cmd: str, callback: ConCmd, adminflags: int, description: str, group: str, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCmdArgs(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCmdArg(self, argnum: int, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCmdArgString(self, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCommandIterator(self) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadCommandIterator(self, iter_: SourceModHandle, name: str, name_len: int, eflags: Pointer[int], desc: str, desc_len: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CheckCommandAccess(self, client: int, command: str, flags: int, override_only: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CheckAccess(self, id: AdminId, command: str, flags: int, override_only: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCommandFlags(self, name: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetCommandFlags(self, name: str, flags: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindFirstConCommand(self, buffer: str, max_size: int, is_command: Pointer[bool], flags: Pointer[int], description: str, descrmax_size: int) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindNextConCommand(self, search: SourceModHandle, buffer: str, max_size: int, is_command: Pointer[bool], flags: Pointer[int], description: str, descrmax_size: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddServerTag(self, tag: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveServerTag(self, tag: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddCommandListener(self, callback: CommandListener, command: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveCommandListener(self, callback: CommandListener, command: str) -> None:
         raise SourcePawnUnboundNativeError
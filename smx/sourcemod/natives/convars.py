@@ -57,59 +57,59 @@ class ConVar:
 
 
 class ConVarMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def SetBool(self, this: SourceModHandle[ConVar], value: bool, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetInt(self, this: SourceModHandle[ConVar], value: int, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetFloat(self, this: SourceModHandle[ConVar], value: float, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetString(self, this: SourceModHandle[ConVar], value: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetString(self, this: SourceModHandle[ConVar], value: str, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RestoreDefault(self, this: SourceModHandle[ConVar], replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetDefault(self, this: SourceModHandle[ConVar], value: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetBounds(self, this: SourceModHandle[ConVar], type_: ConVarBounds, value: Pointer[float]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetBounds(self, this: SourceModHandle[ConVar], type_: ConVarBounds, set_: bool, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetName(self, this: SourceModHandle[ConVar], name: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetDescription(self, this: SourceModHandle[ConVar], buffer: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReplicateToClient(self, this: SourceModHandle[ConVar], client: int, value: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddChangeHook(self, this: SourceModHandle[ConVar], callback: ConVarChanged) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveChangeHook(self, this: SourceModHandle[ConVar], callback: ConVarChanged) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -140,23 +140,23 @@ class ConvarsNatives(SourceModNativesMixin):
         self.sys.convars[name] = cvar
         return self.sys.handles.new_handle(cvar)
 
-    @native
+    @native(stub=True)
     def FindConVar(self, name: str) -> SourceModHandle[ConVar]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HookConVarChange(self, convar: SourceModHandle, callback: ConVarChanged) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def UnhookConVarChange(self, convar: SourceModHandle, callback: ConVarChanged) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetConVarBool(self, convar: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetConVarBool(self, convar: SourceModHandle, value: bool, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -164,7 +164,7 @@ class ConvarsNatives(SourceModNativesMixin):
     def GetConVarInt(self, handle: SourceModHandle[ConVar]) -> int:
         return int(handle.obj.value)
 
-    @native
+    @native(stub=True)
     def SetConVarInt(self, convar: SourceModHandle, value: int, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -172,7 +172,7 @@ class ConvarsNatives(SourceModNativesMixin):
     def GetConVarFloat(self, handle: SourceModHandle[ConVar]) -> float:
         return float(handle.obj.value)
 
-    @native
+    @native(stub=True)
     def SetConVarFloat(self, convar: SourceModHandle, value: float, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -180,42 +180,42 @@ class ConvarsNatives(SourceModNativesMixin):
     def GetConVarString(self, handle: SourceModHandle[ConVar], buf: WritableString):
         return buf.write(handle.obj.value, null_terminate=True)
 
-    @native
+    @native(stub=True)
     def SetConVarString(self, convar: SourceModHandle, value: str, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ResetConVar(self, convar: SourceModHandle, replicate: bool, notify: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetConVarDefault(self, convar: SourceModHandle, value: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetConVarFlags(self, convar: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetConVarFlags(self, convar: SourceModHandle, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetConVarBounds(self, convar: SourceModHandle, type_: ConVarBounds, value: Pointer[float]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetConVarBounds(self, convar: SourceModHandle, type_: ConVarBounds, set_: bool, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetConVarName(self, convar: SourceModHandle, name: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SendConVarValue(self, client: int, convar: SourceModHandle, value: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def QueryClientConVar(self, client: int, cvar_name: str, callback: ConVarQueryFinished, value: int) -> QueryCookie:
         raise SourcePawnUnboundNativeError
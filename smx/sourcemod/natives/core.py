@@ -40,18 +40,19 @@ class PluginInfo(IntEnum):
 
 
 class CoreNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def IsNullVector(self, vec: Array[float]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsNullString(self, str_: str) -> bool:
         raise SourcePawnUnboundNativeError
 
     @native
     def VerifyCoreVersion(self) -> int:
-        raise SourcePawnUnboundNativeError
+        # NOTE: the value returned by SourceMod's core (smn_core.cpp)
+        return 4
 
     @native
     def MarkNativeAsOptional(self, name: str) -> None:
-        raise SourcePawnUnboundNativeError
+        self.amx.optional_natives.add(name)
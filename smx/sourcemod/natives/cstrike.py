@@ -131,90 +131,90 @@ class CSWeaponID(IntEnum):
 
 
 class CstrikeNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def CS_RespawnPlayer(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_SwitchTeam(self, client: int, team: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_DropWeapon(self, client: int, weapon_index: int, toss: bool, blockhook: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_TerminateRound(self, delay: float, reason: CSRoundEndReason, blockhook: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_GetTranslatedWeaponAlias(self, alias: str, weapon: str, size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_GetWeaponPrice(self, client: int, id: CSWeaponID, defaultprice: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_GetClientClanTag(self, client: int, buffer: str, size: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_SetClientClanTag(self, client: int, tag: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_GetTeamScore(self, team: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_SetTeamScore(self, team: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_GetMVPCount(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_SetMVPCount(self, client: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_GetClientContributionScore(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_SetClientContributionScore(self, client: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_GetClientAssists(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_SetClientAssists(self, client: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_AliasToWeaponID(self, alias: str) -> CSWeaponID:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_WeaponIDToAlias(self, weapon_id: CSWeaponID, destination: str, len_: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_IsValidWeaponID(self, id: CSWeaponID) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_UpdateClientModel(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_ItemDefIndexToID(self, i_def_index: int) -> CSWeaponID:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CS_WeaponIDToItemDefIndex(self, id: CSWeaponID) -> int:
         raise SourcePawnUnboundNativeError
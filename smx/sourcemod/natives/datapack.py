@@ -22,59 +22,59 @@ class DataPack:
 
 
 class DataPackMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def WriteCell(self, this: SourceModHandle[DataPack], cell: int, insert: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteFloat(self, this: SourceModHandle[DataPack], val: float, insert: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteString(self, this: SourceModHandle[DataPack], str_: str, insert: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteFunction(self, this: SourceModHandle[DataPack], fktptr: PluginFunction, insert: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteCellArray(self, this: SourceModHandle[DataPack], array: Array[int], count: int, insert: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteFloatArray(self, this: SourceModHandle[DataPack], array: Array[float], count: int, insert: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadCell(self, this: SourceModHandle[DataPack]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFloat(self, this: SourceModHandle[DataPack]) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadString(self, this: SourceModHandle[DataPack], buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFunction(self, this: SourceModHandle[DataPack]) -> PluginFunction:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadCellArray(self, this: SourceModHandle[DataPack], buffer: Array[int], count: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFloatArray(self, this: SourceModHandle[DataPack], buffer: Array[float], count: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Reset(self, this: SourceModHandle[DataPack], clear: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsReadable(self, this: SourceModHandle[DataPack], unused: int) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -82,54 +82,54 @@ class DataPackMethodMap(MethodMap):
 class DatapackNatives(SourceModNativesMixin):
     DataPack = DataPackMethodMap()
 
-    @native
+    @native(stub=True)
     def CreateDataPack(self) -> SourceModHandle[DataPack]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WritePackCell(self, pack: SourceModHandle, cell: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WritePackFloat(self, pack: SourceModHandle, val: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WritePackString(self, pack: SourceModHandle, str_: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WritePackFunction(self, pack: SourceModHandle, fktptr: PluginFunction) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadPackCell(self, pack: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadPackFloat(self, pack: SourceModHandle) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadPackString(self, pack: SourceModHandle, buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadPackFunction(self, pack: SourceModHandle) -> PluginFunction:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ResetPack(self, pack: SourceModHandle, clear: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPackPosition(self, pack: SourceModHandle) -> DataPackPos:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetPackPosition(self, pack: SourceModHandle, position: DataPackPos) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsPackReadable(self, pack: SourceModHandle, bytes_: int) -> bool:
         raise SourcePawnUnboundNativeError
@@ -162,119 +162,119 @@ class DynamicDetour(DHookSetup):
 
 
 class DHookParamMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Get(self, this: SourceModHandle[DHookParam], num: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetVector(self, this: SourceModHandle[DHookParam], num: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetString(self, this: SourceModHandle[DHookParam], num: int, buffer: str, size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Set(self, this: SourceModHandle[DHookParam], num: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVector(self, this: SourceModHandle[DHookParam], num: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetString(self, this: SourceModHandle[DHookParam], num: int, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetObjectVar(self, this: SourceModHandle[DHookParam], num: int, offset: int, type_: ObjectValueType) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetObjectVarVector(self, this: SourceModHandle[DHookParam], num: int, offset: int, type_: ObjectValueType, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetObjectVarString(self, this: SourceModHandle[DHookParam], num: int, offset: int, type_: ObjectValueType, buffer: str, size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetObjectVar(self, this: SourceModHandle[DHookParam], num: int, offset: int, type_: ObjectValueType, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetObjectVarVector(self, this: SourceModHandle[DHookParam], num: int, offset: int, type_: ObjectValueType, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsNull(self, this: SourceModHandle[DHookParam], num: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAddress(self, this: SourceModHandle[DHookParam], num: int) -> Address:
         raise SourcePawnUnboundNativeError
 
 
 class DHookReturnMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def GetVector(self, this: SourceModHandle[DHookReturn], vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetString(self, this: SourceModHandle[DHookReturn], buffer: str, size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVector(self, this: SourceModHandle[DHookReturn], vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetString(self, this: SourceModHandle[DHookReturn], buffer: str) -> None:
         raise SourcePawnUnboundNativeError
 
 
 class DHookSetupMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def SetFromConf(self, this: SourceModHandle[DHookSetup], gameconf: SourceModHandle, source: SDKFuncConfSource, name: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddParam(self, this: SourceModHandle[DHookSetup], type_: HookParamType, size: int, flag: DHookPassFlag, custom_register: DHookRegister) -> None:
         raise SourcePawnUnboundNativeError
 
 
 class DynamicHookMethodMap(DHookSetupMethodMap):
-    @native
+    @native(stub=True)
     def FromConf(self, gameconf: SourceModHandle, name: str) -> SourceModHandle[DynamicHook]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HookEntity(self, this: SourceModHandle[DynamicHook], mode: HookMode, entity: int, callback: DHookCallback, removalcb: DHookRemovalCB) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HookGamerules(self, this: SourceModHandle[DynamicHook], mode: HookMode, callback: DHookCallback, removalcb: DHookRemovalCB) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HookRaw(self, this: SourceModHandle[DynamicHook], mode: HookMode, addr: Address, callback: DHookCallback) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveHook(self, hookid: int) -> bool:
         raise SourcePawnUnboundNativeError
 
 
 class DynamicDetourMethodMap(DHookSetupMethodMap):
-    @native
+    @native(stub=True)
     def FromConf(self, gameconf: SourceModHandle, name: str) -> SourceModHandle[DynamicDetour]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Enable(self, this: SourceModHandle[DynamicDetour], mode: HookMode, callback: DHookCallback) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Disable(self, this: SourceModHandle[DynamicDetour], mode: HookMode, callback: DHookCallback) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -286,130 +286,130 @@ class DhooksNatives(SourceModNativesMixin):
     DynamicHook = DynamicHookMethodMap()
     DynamicDetour = DynamicDetourMethodMap()
 
-    @native
+    @native(stub=True)
     def DHookAddEntityListener(self, type_: ListenType, callback: ListenCB) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookRemoveEntityListener(self, type_: ListenType, callback: ListenCB) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookCreate(self, offset: int, hooktype: HookType, returntype: ReturnType, thistype: ThisPointerType, callback: DHookCallback) -> SourceModHandle[DynamicHook]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookCreateDetour(self, funcaddr: Address, call_conv: CallingConvention, returntype: ReturnType, this_type: ThisPointerType) -> SourceModHandle[DynamicDetour]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookCreateFromConf(self, gameconf: SourceModHandle, name: str) -> SourceModHandle[DHookSetup]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetFromConf(self, setup: SourceModHandle, gameconf: SourceModHandle, source: SDKFuncConfSource, name: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookEnableDetour(self, setup: SourceModHandle, post: bool, callback: DHookCallback) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookDisableDetour(self, setup: SourceModHandle, post: bool, callback: DHookCallback) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookAddParam(self, setup: SourceModHandle, type_: HookParamType, size: int, flag: DHookPassFlag, custom_register: DHookRegister) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookEntity(self, setup: SourceModHandle, post: bool, entity: int, removalcb: DHookRemovalCB, callback: DHookCallback) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGamerules(self, setup: SourceModHandle, post: bool, removalcb: DHookRemovalCB, callback: DHookCallback) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookRaw(self, setup: SourceModHandle, post: bool, addr: Address, removalcb: DHookRemovalCB, callback: DHookCallback) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookRemoveHookID(self, hookid: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetParam(self, h_params: SourceModHandle, num: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetParamVector(self, h_params: SourceModHandle, num: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetParamString(self, h_params: SourceModHandle, num: int, buffer: str, size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetParam(self, h_params: SourceModHandle, num: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetParamVector(self, h_params: SourceModHandle, num: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetParamString(self, h_params: SourceModHandle, num: int, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetReturn(self, h_return: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetReturnVector(self, h_return: SourceModHandle, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetReturnString(self, h_return: SourceModHandle, buffer: str, size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetReturn(self, h_return: SourceModHandle, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetReturnVector(self, h_return: SourceModHandle, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetReturnString(self, h_return: SourceModHandle, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetParamObjectPtrVar(self, h_params: SourceModHandle, num: int, offset: int, type_: ObjectValueType) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetParamObjectPtrVar(self, h_params: SourceModHandle, num: int, offset: int, type_: ObjectValueType, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetParamObjectPtrVarVector(self, h_params: SourceModHandle, num: int, offset: int, type_: ObjectValueType, buffer: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookSetParamObjectPtrVarVector(self, h_params: SourceModHandle, num: int, offset: int, type_: ObjectValueType, value: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetParamObjectPtrString(self, h_params: SourceModHandle, num: int, offset: int, type_: ObjectValueType, buffer: str, size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookIsNullParam(self, h_params: SourceModHandle, num: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DHookGetParamAddress(self, h_params: SourceModHandle, num: int) -> Address:
         raise SourcePawnUnboundNativeError
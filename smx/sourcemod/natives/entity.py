@@ -29,154 +29,154 @@ class PropFieldType(IntEnum):
 
 
 class EntityNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GetMaxEntities(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntityCount(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsValidEntity(self, entity: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsValidEdict(self, edict: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsEntNetworkable(self, entity: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateEdict(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveEdict(self, edict: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveEntity(self, entity: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEdictFlags(self, edict: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEdictFlags(self, edict: int, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEdictClassname(self, edict: int, clsname: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntityNetClass(self, edict: int, clsname: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ChangeEdictState(self, edict: int, offset: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntData(self, entity: int, offset: int, size: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntData(self, entity: int, offset: int, value: int, size: int, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntDataFloat(self, entity: int, offset: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntDataFloat(self, entity: int, offset: int, value: float, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntDataEnt(self, entity: int, offset: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntDataEnt(self, entity: int, offset: int, other: int, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntDataEnt2(self, entity: int, offset: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntDataEnt2(self, entity: int, offset: int, other: int, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntDataVector(self, entity: int, offset: int, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntDataVector(self, entity: int, offset: int, vec: Array[float], change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntDataString(self, entity: int, offset: int, buffer: str, maxlen: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntDataString(self, entity: int, offset: int, buffer: str, maxlen: int, change_state: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindSendPropOffs(self, cls: str, prop: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntProp(self, entity: int, type_: PropType, prop: str, size: int, element: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntProp(self, entity: int, type_: PropType, prop: str, value: int, size: int, element: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntPropFloat(self, entity: int, type_: PropType, prop: str, element: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntPropFloat(self, entity: int, type_: PropType, prop: str, value: float, element: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntPropEnt(self, entity: int, type_: PropType, prop: str, element: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntPropEnt(self, entity: int, type_: PropType, prop: str, other: int, element: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntPropVector(self, entity: int, type_: PropType, prop: str, vec: Array[float], element: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntPropVector(self, entity: int, type_: PropType, prop: str, vec: Array[float], element: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntPropString(self, entity: int, type_: PropType, prop: str, buffer: str, maxlen: int, element: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntPropString(self, entity: int, type_: PropType, prop: str, buffer: str, element: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntPropArraySize(self, entity: int, type_: PropType, prop: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntityAddress(self, entity: int) -> Address:
         raise SourcePawnUnboundNativeError
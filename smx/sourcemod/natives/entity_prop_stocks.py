@@ -65,10 +65,10 @@ class RenderFx(IntEnum):
 
 
 class EntityPropStocksNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GetEntityFlags(self, entity: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntityFlags(self, entity: int, flags: int) -> None:
         raise SourcePawnUnboundNativeError
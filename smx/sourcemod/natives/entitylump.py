@@ -10,27 +10,27 @@ class EntityLumpEntry:
 
 
 class EntityLumpEntryMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Get(self, this: SourceModHandle[EntityLumpEntry], index: int, keybuf: str, keylen: int, valbuf: str, vallen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Update(self, this: SourceModHandle[EntityLumpEntry], index: int, key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Insert(self, this: SourceModHandle[EntityLumpEntry], index: int, key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Erase(self, this: SourceModHandle[EntityLumpEntry], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Append(self, this: SourceModHandle[EntityLumpEntry], key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindKey(self, this: SourceModHandle[EntityLumpEntry], key: str, start: int) -> int:
         raise SourcePawnUnboundNativeError
 
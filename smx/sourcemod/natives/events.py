@@ -27,51 +27,51 @@ class Event:
 
 
 class EventMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Fire(self, this: SourceModHandle[Event], dont_broadcast: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FireToClient(self, this: SourceModHandle[Event], client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Cancel(self, this: SourceModHandle[Event]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetBool(self, this: SourceModHandle[Event], key: str, def_value: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetBool(self, this: SourceModHandle[Event], key: str, value: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetInt(self, this: SourceModHandle[Event], key: str, def_value: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetInt(self, this: SourceModHandle[Event], key: str, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetFloat(self, this: SourceModHandle[Event], key: str, def_value: float) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetFloat(self, this: SourceModHandle[Event], key: str, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetString(self, this: SourceModHandle[Event], key: str, value: WritableString, defvalue: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetString(self, this: SourceModHandle[Event], key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetName(self, this: SourceModHandle[Event], name: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -79,66 +79,66 @@ class EventMethodMap(MethodMap):
 class EventsNatives(SourceModNativesMixin):
     Event = EventMethodMap()
 
-    @native
+    @native(stub=True)
     def HookEvent(self, name: str, callback: EventHook, mode: EventHookMode) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HookEventEx(self, name: str, callback: EventHook, mode: EventHookMode) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def UnhookEvent(self, name: str, callback: EventHook, mode: EventHookMode) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateEvent(self, name: str, force: bool) -> SourceModHandle[Event]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FireEvent(self, event: SourceModHandle, dont_broadcast: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CancelCreatedEvent(self, event: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEventBool(self, event: SourceModHandle, key: str, def_value: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEventBool(self, event: SourceModHandle, key: str, value: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEventInt(self, event: SourceModHandle, key: str, def_value: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEventInt(self, event: SourceModHandle, key: str, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEventFloat(self, event: SourceModHandle, key: str, def_value: float) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEventFloat(self, event: SourceModHandle, key: str, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEventString(self, event: SourceModHandle, key: str, value: WritableString, defvalue: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEventString(self, event: SourceModHandle, key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEventName(self, event: SourceModHandle, name: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEventBroadcast(self, event: SourceModHandle, dont_broadcast: bool) -> None:
         raise SourcePawnUnboundNativeError
@@ -48,7 +48,7 @@ class File:
 
 
 class DirectoryListingMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def GetNext(self, this: SourceModHandle[DirectoryListing], buffer: WritableString, type_: Pointer[FileType]) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -72,51 +72,51 @@ class FileMethodMap(MethodMap):
         items[:len(data)] = data
         return items_read
 
-    @native
+    @native(stub=True)
     def ReadString(self, this: SourceModHandle[File], buffer: str, max_size: int, read_count: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Write(self, this: SourceModHandle[File], items: Array[int], num_items: int, size: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteString(self, this: SourceModHandle[File], buffer: str, term: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteLine(self, this: SourceModHandle[File], format_: str, *args) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadInt8(self, this: SourceModHandle[File], data: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadUint8(self, this: SourceModHandle[File], data: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadInt16(self, this: SourceModHandle[File], data: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadUint16(self, this: SourceModHandle[File], data: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadInt32(self, this: SourceModHandle[File], data: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteInt8(self, this: SourceModHandle[File], data: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteInt16(self, this: SourceModHandle[File], data: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteInt32(self, this: SourceModHandle[File], data: int) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -124,11 +124,11 @@ class FileMethodMap(MethodMap):
     def EndOfFile(self, handle: SourceModHandle[File]):
         return handle.obj.is_eof()
 
-    @native
+    @native(stub=True)
     def Seek(self, this: SourceModHandle[File], position: int, where: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Flush(self, this: SourceModHandle[File]) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -146,11 +146,11 @@ class FilesNatives(SourceModNativesMixin):
         path = str(self.runtime.root_path / suffix)
         return buffer.write(path, null_terminate=True)
 
-    @native
+    @native(stub=True)
     def OpenDirectory(self, path: str, use_valve_fs: bool, valve_path_id: str) -> SourceModHandle[DirectoryListing]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadDirEntry(self, dir_: SourceModHandle, buffer: WritableString, type_: Pointer[FileType]) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -163,87 +163,87 @@ class FilesNatives(SourceModNativesMixin):
         fp = open(file, mode)
         return self.sys.handles.new_handle(File(fp), on_close=fp.close)
 
-    @native
+    @native(stub=True)
     def DeleteFile(self, path: str, use_valve_fs: bool, valve_path_id: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFileLine(self, hndl: SourceModHandle, buffer: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFile(self, hndl: SourceModHandle, items: Array[int], num_items: int, size: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFileString(self, hndl: SourceModHandle, buffer: str, max_size: int, read_count: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteFile(self, hndl: SourceModHandle, items: Array[int], num_items: int, size: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteFileString(self, hndl: SourceModHandle, buffer: str, term: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def WriteFileLine(self, hndl: SourceModHandle, format_: str, *args) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsEndOfFile(self, file: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FileSeek(self, file: SourceModHandle, position: int, where: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FilePosition(self, file: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FileExists(self, path: str, use_valve_fs: bool, valve_path_id: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RenameFile(self, newpath: str, oldpath: str, use_valve_fs: bool, valve_path_id: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DirExists(self, path: str, use_valve_fs: bool, valve_path_id: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FileSize(self, path: str, use_valve_fs: bool, valve_path_id: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FlushFile(self, file: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveDir(self, path: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateDirectory(self, path: str, mode: int, use_valve_fs: bool, valve_path_id: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetFilePermissions(self, path: str, mode: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetFileTime(self, file: str, tmode: FileTimeMode) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LogToOpenFile(self, hndl: SourceModHandle, message: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LogToOpenFileEx(self, hndl: SourceModHandle, message: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
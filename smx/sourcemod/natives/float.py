@@ -1,7 +1,5 @@
-import ctypes
 import math
 
-from smx.definitions import cell
 from smx.sourcemod.natives.base import Array, native, SourceModNativesMixin
 
 
@@ -132,9 +130,8 @@ class FloatNatives(SourceModNativesMixin):
 
     @native
     def SetURandomSeed(self, seeds: Array[int], num_seeds: int) -> None:
-        # XXX(zk): can this be done with better DX? casting an Array? built-in Array size?
-        seed_bytes = ctypes.cast(seeds.c_ptr, ctypes.POINTER(ctypes.c_byte))
-        seed_array = bytearray(seed_bytes[:num_seeds*ctypes.sizeof(cell)])
+        # XXX(zk): can this be done with better DX? built-in Array size?
+        seed_array = bytearray(seeds.view[:num_seeds].cast('B'))
         self.runtime.rand.seed(seed_array)
 
     @native
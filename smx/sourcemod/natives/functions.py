@@ -51,15 +51,15 @@ class GlobalForwardMethodMap(MethodMap):
 
 
 class PrivateForwardMethodMap(GlobalForwardMethodMap):
-    @native
+    @native(stub=True)
     def AddFunction(self, this: SourceModHandle[PrivateForward], plugin: SourceModHandle, func: PluginFunction) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveFunction(self, this: SourceModHandle[PrivateForward], plugin: SourceModHandle, func: PluginFunction) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveAllFunctions(self, this: SourceModHandle[PrivateForward], plugin: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
@@ -68,146 +68,146 @@ class FunctionsNatives(SourceModNativesMixin):
     GlobalForward = GlobalForwardMethodMap()
     PrivateForward = PrivateForwardMethodMap()
 
-    @native
+    @native(stub=True)
     def GetFunctionByName(self, plugin: SourceModHandle, name: str) -> PluginFunction:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateGlobalForward(self, name: str, type_: ExecType, *args) -> SourceModHandle[GlobalForward]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateForward(self, type_: ExecType, *args) -> SourceModHandle[PrivateForward]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetForwardFunctionCount(self, fwd: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddToForward(self, fwd: SourceModHandle, plugin: SourceModHandle, func: PluginFunction) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveFromForward(self, fwd: SourceModHandle, plugin: SourceModHandle, func: PluginFunction) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveAllFromForward(self, fwd: SourceModHandle, plugin: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_StartForward(self, fwd: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_StartFunction(self, plugin: SourceModHandle, func: PluginFunction) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushCell(self, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushCellRef(self, value: Pointer[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushFloat(self, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushFloatRef(self, value: Pointer[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushArray(self, value: Array[int], size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushArrayEx(self, value: Array[int], size: int, cpflags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushNullVector(self) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushString(self, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushStringEx(self, value: str, length: int, szflags: int, cpflags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_PushNullString(self) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_Finish(self, result: Pointer[int]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Call_Cancel(self) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateNative(self, name: str, func: NativeCall) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ThrowNativeError(self, error: int, fmt: str, *args) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNativeStringLength(self, param: int, length: Pointer[int]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNativeString(self, param: int, buffer: WritableString, bytes_: Pointer[int]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetNativeString(self, param: int, source: WritableString, utf8: bool, bytes_: Pointer[int]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNativeCell(self, param: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNativeFunction(self, param: int) -> PluginFunction:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNativeCellRef(self, param: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetNativeCellRef(self, param: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNativeArray(self, param: int, local: Array[int], size: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetNativeArray(self, param: int, local: Array[int], size: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsNativeParamNullVector(self, param: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsNativeParamNullString(self, param: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FormatNativeString(self, out_param: int, fmt_param: int, vararg_param: int, out_len: int, written: Pointer[int], out_string: str, fmt_string: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RequestFrame(self, function: RequestFrameCallback, data: int) -> None:
         raise SourcePawnUnboundNativeError
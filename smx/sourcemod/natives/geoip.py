@@ -22,54 +22,54 @@ class Continent(IntEnum):
 
 
 class GeoipNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GeoipCode2(self, ip: str, ccode: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipCode3(self, ip: str, ccode: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipRegionCode(self, ip: str, ccode: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipContinentCode(self, ip: str, ccode: str) -> Continent:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipCountry(self, ip: str, name: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipCountryEx(self, ip: str, name: WritableString, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipContinent(self, ip: str, name: WritableString, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipRegion(self, ip: str, name: WritableString, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipCity(self, ip: str, name: WritableString, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipTimezone(self, ip: str, name: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipLatitude(self, ip: str) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipLongitude(self, ip: str) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GeoipDistance(self, lat1: float, lon1: float, lat2: float, lon2: float, system: int) -> float:
         raise SourcePawnUnboundNativeError
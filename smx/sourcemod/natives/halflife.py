@@ -62,174 +62,174 @@ class ClientRangeType(IntEnum):
 
 
 class HalflifeNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def LogToGame(self, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetRandomSeed(self, seed: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetRandomFloat(self, f_min: float, f_max: float) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetRandomInt(self, nmin: int, nmax: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsMapValid(self, map_: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindMap(self, map_: str, foundmap: str, maxlen: int) -> FindMapResult:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMapDisplayName(self, map_: str, display_name: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsDedicatedServer(self) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEngineTime(self) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetGameTime(self) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetGameTickCount(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetGameFrameTime(self) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetGameDescription(self, buffer: WritableString, original: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetGameFolderName(self, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCurrentMap(self, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrecacheModel(self, model: str, preload: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrecacheSentenceFile(self, file: str, preload: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrecacheDecal(self, decal: str, preload: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrecacheGeneric(self, generic: str, preload: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsModelPrecached(self, model: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsDecalPrecached(self, decal: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsGenericPrecached(self, generic: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrecacheSound(self, sound: str, preload: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsSoundPrecached(self, sound: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateDialog(self, client: int, kv: SourceModHandle, type_: DialogType) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GuessSDKVersion(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEngineVersion(self) -> EngineVersion:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrintToChat(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrintCenterText(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrintHintText(self, client: int, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShowVGUIPanel(self, client: int, name: str, kv: SourceModHandle, show: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateHudSynchronizer(self) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetHudTextParams(self, x: float, y: float, hold_time: float, r: int, g: int, b: int, a: int, effect: int, fx_time: float, fade_in: float, fade_out: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetHudTextParamsEx(self, x: float, y: float, hold_time: float, color1: Array[int], color2: Array[int], effect: int, fx_time: float, fade_in: float, fade_out: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShowSyncHudText(self, client: int, sync: SourceModHandle, message: str, *args) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ClearSyncHud(self, client: int, sync: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShowHudText(self, client: int, channel: int, message: str, *args) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EntIndexToEntRef(self, entity: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EntRefToEntIndex(self, ref: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MakeCompatEntRef(self, ref: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientsInRange(self, origin: Array[float], range_type: ClientRangeType, clients: Array[int], size: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetServerAuthId(self, auth_type: AuthIdType, auth: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetServerSteamAccountId(self) -> int:
         raise SourcePawnUnboundNativeError
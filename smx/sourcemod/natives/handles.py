@@ -9,7 +9,7 @@ class HandlesNatives(SourceModNativesMixin):
         # TODO(zk): run time error if handle is invalid
         self.sys.handles.close_handle(handle_id)
 
-    @native
+    @native(stub=True)
     def CloneHandle(self, hndl: SourceModHandle, plugin: SourceModHandle) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
@@ -31,139 +31,139 @@ class KeyValues:
 
 
 class KeyValuesMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def ExportToFile(self, this: SourceModHandle[KeyValues], file: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ExportToString(self, this: SourceModHandle[KeyValues], buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ImportFromFile(self, this: SourceModHandle[KeyValues], file: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ImportFromString(self, this: SourceModHandle[KeyValues], buffer: str, resource_name: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Import(self, this: SourceModHandle[KeyValues], other: SourceModHandle[KeyValues]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetString(self, this: SourceModHandle[KeyValues], key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetNum(self, this: SourceModHandle[KeyValues], key: str, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetUInt64(self, this: SourceModHandle[KeyValues], key: str, value: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetFloat(self, this: SourceModHandle[KeyValues], key: str, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetColor(self, this: SourceModHandle[KeyValues], key: str, r: int, g: int, b: int, a: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVector(self, this: SourceModHandle[KeyValues], key: str, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetString(self, this: SourceModHandle[KeyValues], key: str, value: WritableString, defvalue: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNum(self, this: SourceModHandle[KeyValues], key: str, defvalue: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetFloat(self, this: SourceModHandle[KeyValues], key: str, defvalue: float) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetColor(self, this: SourceModHandle[KeyValues], key: str, r: Pointer[int], g: Pointer[int], b: Pointer[int], a: Pointer[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetUInt64(self, this: SourceModHandle[KeyValues], key: str, value: Array[int], defvalue: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetVector(self, this: SourceModHandle[KeyValues], key: str, vec: Array[float], defvalue: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def JumpToKey(self, this: SourceModHandle[KeyValues], key: str, create: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def JumpToKeySymbol(self, this: SourceModHandle[KeyValues], id: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GotoFirstSubKey(self, this: SourceModHandle[KeyValues], key_only: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GotoNextKey(self, this: SourceModHandle[KeyValues], key_only: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SavePosition(self, this: SourceModHandle[KeyValues]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GoBack(self, this: SourceModHandle[KeyValues]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DeleteKey(self, this: SourceModHandle[KeyValues], key: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DeleteThis(self, this: SourceModHandle[KeyValues]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Rewind(self, this: SourceModHandle[KeyValues]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetSectionName(self, this: SourceModHandle[KeyValues], section: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetSectionName(self, this: SourceModHandle[KeyValues], section: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetDataType(self, this: SourceModHandle[KeyValues], key: str) -> KvDataTypes:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEscapeSequences(self, this: SourceModHandle[KeyValues], use_escapes: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def NodesInStack(self, this: SourceModHandle[KeyValues]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindKeyById(self, this: SourceModHandle[KeyValues], id: int, name: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNameSymbol(self, this: SourceModHandle[KeyValues], key: str, id: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetSectionSymbol(self, this: SourceModHandle[KeyValues], id: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -171,138 +171,138 @@ class KeyValuesMethodMap(MethodMap):
 class KeyvaluesNatives(SourceModNativesMixin):
     KeyValues = KeyValuesMethodMap()
 
-    @native
+    @native(stub=True)
     def CreateKeyValues(self, name: str, first_key: str, first_value: str) -> SourceModHandle[KeyValues]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetString(self, kv: SourceModHandle, key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetNum(self, kv: SourceModHandle, key: str, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetUInt64(self, kv: SourceModHandle, key: str, value: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetFloat(self, kv: SourceModHandle, key: str, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetColor(self, kv: SourceModHandle, key: str, r: int, g: int, b: int, a: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetVector(self, kv: SourceModHandle, key: str, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetString(self, kv: SourceModHandle, key: str, value: WritableString, defvalue: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetNum(self, kv: SourceModHandle, key: str, defvalue: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetFloat(self, kv: SourceModHandle, key: str, defvalue: float) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetColor(self, kv: SourceModHandle, key: str, r: Pointer[int], g: Pointer[int], b: Pointer[int], a: Pointer[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetUInt64(self, kv: SourceModHandle, key: str, value: Array[int], defvalue: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetVector(self, kv: SourceModHandle, key: str, vec: Array[float], defvalue: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvJumpToKey(self, kv: SourceModHandle, key: str, create: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvJumpToKeySymbol(self, kv: SourceModHandle, id: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGotoFirstSubKey(self, kv: SourceModHandle, key_only: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGotoNextKey(self, kv: SourceModHandle, key_only: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSavePosition(self, kv: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvDeleteKey(self, kv: SourceModHandle, key: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvDeleteThis(self, kv: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGoBack(self, kv: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvRewind(self, kv: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetSectionName(self, kv: SourceModHandle, section: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetSectionName(self, kv: SourceModHandle, section: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetDataType(self, kv: SourceModHandle, key: str) -> KvDataTypes:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KeyValuesToFile(self, kv: SourceModHandle, file: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FileToKeyValues(self, kv: SourceModHandle, file: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StringToKeyValues(self, kv: SourceModHandle, buffer: str, resource_name: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvSetEscapeSequences(self, kv: SourceModHandle, use_escapes: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvNodesInStack(self, kv: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvCopySubkeys(self, origin: SourceModHandle, dest: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvFindKeyById(self, kv: SourceModHandle, id: int, name: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetNameSymbol(self, kv: SourceModHandle, key: str, id: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def KvGetSectionSymbol(self, kv: SourceModHandle, id: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
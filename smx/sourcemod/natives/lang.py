@@ -5,46 +5,46 @@ from smx.sourcemod.natives.base import SourceModNativesMixin, native
 
 
 class LangNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def LoadTranslations(self, file: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetGlobalTransTarget(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientLanguage(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetServerLanguage(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetLanguageCount(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetLanguageInfo(self, language: int, code: str, code_len: int, name: str, name_len: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetClientLanguage(self, client: int, language: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetLanguageByCode(self, code: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetLanguageByName(self, name: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TranslationPhraseExists(self, phrase: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsTranslatedForLanguage(self, phrase: str, language: int) -> bool:
         raise SourcePawnUnboundNativeError
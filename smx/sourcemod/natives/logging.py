@@ -10,30 +10,30 @@ GameLogHook = Callable
 
 
 class LoggingNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def LogMessage(self, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LogToFile(self, file: str, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LogToFileEx(self, file: str, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LogAction(self, client: int, target: int, message: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LogError(self, format_: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddGameLogHook(self, hook: GameLogHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveGameLogHook(self, hook: GameLogHook) -> None:
         raise SourcePawnUnboundNativeError
@@ -23,38 +23,38 @@ class MapChange(IntEnum):
 
 
 class MapchooserNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def NominateMap(self, map_: str, force: bool, owner: int) -> NominateResult:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveNominationByMap(self, map_: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveNominationByOwner(self, owner: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetExcludeMapList(self, array: SourceModHandle[SourceModHandle[ArrayList]]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNominatedMapList(self, maparray: SourceModHandle[SourceModHandle[ArrayList]], ownerarray: SourceModHandle[SourceModHandle[ArrayList]]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CanMapChooserStartVote(self) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def InitiateMapChooserVote(self, when: MapChange, inputarray: SourceModHandle[SourceModHandle[ArrayList]]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HasEndOfMapVoteFinished(self) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EndOfMapVoteEnabled(self) -> bool:
         raise SourcePawnUnboundNativeError
@@ -54,73 +54,73 @@ class Menu:
 
 
 class PanelMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def SetTitle(self, this: SourceModHandle[Panel], text: str, only_if_empty: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DrawText(self, this: SourceModHandle[Panel], text: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CanDrawFlags(self, this: SourceModHandle[Panel], style: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetKeys(self, this: SourceModHandle[Panel], keys: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Send(self, this: SourceModHandle[Panel], client: int, handler: MenuHandler, time: int) -> bool:
         raise SourcePawnUnboundNativeError
 
 
 class MenuMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Display(self, this: SourceModHandle[Menu], client: int, time: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DisplayAt(self, this: SourceModHandle[Menu], client: int, first_item: int, time: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveItem(self, this: SourceModHandle[Menu], position: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveAllItems(self, this: SourceModHandle[Menu]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetItem(self, this: SourceModHandle[Menu], position: int, info_buf: str, info_buf_len: int, style: Pointer[int], disp_buf: str, disp_buf_len: int, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ShufflePerClient(self, this: SourceModHandle[Menu], start: int, stop: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetClientMapping(self, this: SourceModHandle[Menu], client: int, array: Array[int], length: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetTitle(self, this: SourceModHandle[Menu], fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTitle(self, this: SourceModHandle[Menu], buffer: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ToPanel(self, this: SourceModHandle[Menu]) -> SourceModHandle[Panel]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Cancel(self, this: SourceModHandle[Menu]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DisplayVote(self, this: SourceModHandle[Menu], clients: Array[int], num_clients: int, time: int, flags: int) -> bool:
         raise SourcePawnUnboundNativeError
 
@@ -129,194 +129,194 @@ class MenusNatives(SourceModNativesMixin):
     Panel = PanelMethodMap()
     Menu = MenuMethodMap()
 
-    @native
+    @native(stub=True)
     def CreateMenu(self, handler: MenuHandler, actions: MenuAction) -> SourceModHandle[Menu]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DisplayMenu(self, menu: SourceModHandle, client: int, time: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DisplayMenuAtItem(self, menu: SourceModHandle, client: int, first_item: int, time: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveMenuItem(self, menu: SourceModHandle, position: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveAllMenuItems(self, menu: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuItem(self, menu: SourceModHandle, position: int, info_buf: str, info_buf_len: int, style: Pointer[int], disp_buf: str, disp_buf_len: int, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MenuShufflePerClient(self, menu: SourceModHandle, start: int, stop: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MenuSetClientMapping(self, menu: SourceModHandle, client: int, array: Array[int], length: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuSelectionPosition(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuItemCount(self, menu: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetMenuPagination(self, menu: SourceModHandle, items_per_page: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuPagination(self, menu: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuStyle(self, menu: SourceModHandle) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetMenuTitle(self, menu: SourceModHandle, fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuTitle(self, menu: SourceModHandle, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreatePanelFromMenu(self, menu: SourceModHandle) -> SourceModHandle[Panel]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuExitButton(self, menu: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetMenuExitButton(self, menu: SourceModHandle, button: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuExitBackButton(self, menu: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetMenuExitBackButton(self, menu: SourceModHandle, button: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetMenuNoVoteButton(self, menu: SourceModHandle, button: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CancelMenu(self, menu: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuOptionFlags(self, menu: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetMenuOptionFlags(self, menu: SourceModHandle, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsVoteInProgress(self, menu: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CancelVote(self) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def VoteMenu(self, menu: SourceModHandle, clients: Array[int], num_clients: int, time: int, flags: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVoteResultCallback(self, menu: SourceModHandle, callback: VoteHandler) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CheckVoteDelay(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientInVotePool(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RedrawClientVoteMenu(self, client: int, revotes: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMenuStyleHandle(self, style: MenuStyle) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreatePanel(self, h_style: SourceModHandle) -> SourceModHandle[Panel]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateMenuEx(self, h_style: SourceModHandle, handler: MenuHandler, actions: MenuAction) -> SourceModHandle[Menu]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientMenu(self, client: int, h_style: SourceModHandle) -> MenuSource:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CancelClientMenu(self, client: int, auto_ignore: bool, h_style: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMaxPageItems(self, h_style: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPanelStyle(self, panel: SourceModHandle) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetPanelTitle(self, panel: SourceModHandle, text: str, only_if_empty: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DrawPanelText(self, panel: SourceModHandle, text: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CanPanelDrawFlags(self, panel: SourceModHandle, style: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetPanelKeys(self, panel: SourceModHandle, keys: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SendPanelToClient(self, panel: SourceModHandle, client: int, handler: MenuHandler, time: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPanelTextRemaining(self, panel: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPanelCurrentKey(self, panel: SourceModHandle) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetPanelCurrentKey(self, panel: SourceModHandle, key: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RedrawMenuItem(self, text: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def InternalShowMenu(self, client: int, str_: str, time: int, keys: int, handler: MenuHandler) -> bool:
         raise SourcePawnUnboundNativeError
@@ -5,22 +5,22 @@ from smx.sourcemod.natives.base import Pointer, SourceModNativesMixin, native
 
 
 class NextmapNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def SetNextMap(self, map_: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNextMap(self, map_: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ForceChangeLevel(self, map_: str, reason: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMapHistorySize(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMapHistory(self, item: int, map_: str, map_len: int, reason: str, reason_len: int, start_time: Pointer[int]) -> None:
         raise SourcePawnUnboundNativeError
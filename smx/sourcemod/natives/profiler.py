@@ -10,11 +10,11 @@ class Profiler:
 
 
 class ProfilerMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Start(self, this: SourceModHandle[Profiler]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Stop(self, this: SourceModHandle[Profiler]) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -22,30 +22,30 @@ class ProfilerMethodMap(MethodMap):
 class ProfilerNatives(SourceModNativesMixin):
     Profiler = ProfilerMethodMap()
 
-    @native
+    @native(stub=True)
     def CreateProfiler(self) -> SourceModHandle[Profiler]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StartProfiling(self, prof: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StopProfiling(self, prof: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetProfilerTime(self, prof: SourceModHandle) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EnterProfilingEvent(self, group: str, name: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LeaveProfilingEvent(self) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsProfilingActive(self) -> bool:
         raise SourcePawnUnboundNativeError
@@ -16,135 +16,135 @@ class Protobuf:
 
 
 class ProtobufMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def ReadInt(self, this: SourceModHandle[Protobuf], field: str, index: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadInt64(self, this: SourceModHandle[Protobuf], field: str, value: Array[int], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadFloat(self, this: SourceModHandle[Protobuf], field: str, index: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadBool(self, this: SourceModHandle[Protobuf], field: str, index: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadString(self, this: SourceModHandle[Protobuf], field: str, buffer: WritableString, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadColor(self, this: SourceModHandle[Protobuf], field: str, buffer: Array[int], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadAngle(self, this: SourceModHandle[Protobuf], field: str, buffer: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadVector(self, this: SourceModHandle[Protobuf], field: str, buffer: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadVector2D(self, this: SourceModHandle[Protobuf], field: str, buffer: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetRepeatedFieldCount(self, this: SourceModHandle[Protobuf], field: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HasField(self, this: SourceModHandle[Protobuf], field: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetInt(self, this: SourceModHandle[Protobuf], field: str, value: int, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetInt64(self, this: SourceModHandle[Protobuf], field: str, value: Array[int], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetFloat(self, this: SourceModHandle[Protobuf], field: str, value: float, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetBool(self, this: SourceModHandle[Protobuf], field: str, value: bool, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetString(self, this: SourceModHandle[Protobuf], field: str, value: str, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetColor(self, this: SourceModHandle[Protobuf], field: str, color: Array[int], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetAngle(self, this: SourceModHandle[Protobuf], field: str, angle: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVector(self, this: SourceModHandle[Protobuf], field: str, vec: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVector2D(self, this: SourceModHandle[Protobuf], field: str, vec: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddInt(self, this: SourceModHandle[Protobuf], field: str, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddInt64(self, this: SourceModHandle[Protobuf], field: str, value: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddFloat(self, this: SourceModHandle[Protobuf], field: str, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddBool(self, this: SourceModHandle[Protobuf], field: str, value: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddString(self, this: SourceModHandle[Protobuf], field: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddColor(self, this: SourceModHandle[Protobuf], field: str, color: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddAngle(self, this: SourceModHandle[Protobuf], field: str, angle: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddVector(self, this: SourceModHandle[Protobuf], field: str, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddVector2D(self, this: SourceModHandle[Protobuf], field: str, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveRepeatedFieldValue(self, this: SourceModHandle[Protobuf], field: str, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadMessage(self, this: SourceModHandle[Protobuf], field: str) -> SourceModHandle[Protobuf]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadRepeatedMessage(self, this: SourceModHandle[Protobuf], field: str, index: int) -> SourceModHandle[Protobuf]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddMessage(self, this: SourceModHandle[Protobuf], field: str) -> SourceModHandle[Protobuf]:
         raise SourcePawnUnboundNativeError
 
@@ -152,118 +152,118 @@ class ProtobufMethodMap(MethodMap):
 class ProtobufNatives(SourceModNativesMixin):
     Protobuf = ProtobufMethodMap()
 
-    @native
+    @native(stub=True)
     def PbReadInt(self, pb: SourceModHandle, field: str, index: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadFloat(self, pb: SourceModHandle, field: str, index: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadBool(self, pb: SourceModHandle, field: str, index: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadString(self, pb: SourceModHandle, field: str, buffer: WritableString, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadColor(self, pb: SourceModHandle, field: str, buffer: Array[int], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadAngle(self, pb: SourceModHandle, field: str, buffer: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadVector(self, pb: SourceModHandle, field: str, buffer: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadVector2D(self, pb: SourceModHandle, field: str, buffer: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbGetRepeatedFieldCount(self, pb: SourceModHandle, field: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetInt(self, pb: SourceModHandle, field: str, value: int, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetFloat(self, pb: SourceModHandle, field: str, value: float, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetBool(self, pb: SourceModHandle, field: str, value: bool, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetString(self, pb: SourceModHandle, field: str, value: str, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetColor(self, pb: SourceModHandle, field: str, color: Array[int], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetAngle(self, pb: SourceModHandle, field: str, angle: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetVector(self, pb: SourceModHandle, field: str, vec: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbSetVector2D(self, pb: SourceModHandle, field: str, vec: Array[float], index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddInt(self, pb: SourceModHandle, field: str, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddFloat(self, pb: SourceModHandle, field: str, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddBool(self, pb: SourceModHandle, field: str, value: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddString(self, pb: SourceModHandle, field: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddColor(self, pb: SourceModHandle, field: str, color: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddAngle(self, pb: SourceModHandle, field: str, angle: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddVector(self, pb: SourceModHandle, field: str, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddVector2D(self, pb: SourceModHandle, field: str, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbRemoveRepeatedFieldValue(self, pb: SourceModHandle, field: str, index: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadMessage(self, pb: SourceModHandle, field: str) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbReadRepeatedMessage(self, pb: SourceModHandle, field: str, index: int) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PbAddMessage(self, pb: SourceModHandle, field: str) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
@@ -69,27 +69,27 @@ class Regex:
 
 
 class RegexMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Match(self, this: SourceModHandle[Regex], str_: str, ret: Pointer[RegexError], offset: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MatchAll(self, this: SourceModHandle[Regex], str_: str, ret: Pointer[RegexError]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetSubString(self, this: SourceModHandle[Regex], str_id: int, buffer: str, maxlen: int, match: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MatchCount(self, this: SourceModHandle[Regex]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CaptureCount(self, this: SourceModHandle[Regex], match: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MatchOffset(self, this: SourceModHandle[Regex], match: int) -> int:
         raise SourcePawnUnboundNativeError
 
@@ -97,14 +97,14 @@ class RegexMethodMap(MethodMap):
 class RegexNatives(SourceModNativesMixin):
     Regex = RegexMethodMap()
 
-    @native
+    @native(stub=True)
     def CompileRegex(self, pattern: str, flags: int, error: str, max_len: int, errcode: Pointer[RegexError]) -> SourceModHandle[Regex]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MatchRegex(self, regex: SourceModHandle, str_: str, ret: Pointer[RegexError], offset: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetRegexSubString(self, regex: SourceModHandle, str_id: int, buffer: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
@@ -65,22 +65,22 @@ class UseType(IntEnum):
 
 
 class SdkhooksNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def SDKHook(self, entity: int, type_: SDKHookType, callback: SDKHookCB) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SDKHookEx(self, entity: int, type_: SDKHookType, callback: SDKHookCB) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SDKUnhook(self, entity: int, type_: SDKHookType, callback: SDKHookCB) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SDKHooks_TakeDamage(self, entity: int, inflictor: int, attacker: int, damage: float, damage_type: int, weapon: int, damage_force: Array[float], damage_position: Array[float], bypass_hooks: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SDKHooks_DropWeapon(self, client: int, weapon: int, vec_target: Array[float], vec_velocity: Array[float], bypass_hooks: bool) -> None:
         raise SourcePawnUnboundNativeError
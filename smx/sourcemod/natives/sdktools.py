@@ -49,42 +49,42 @@ class SDKPassMethod(IntEnum):
 
 
 class SdktoolsNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def StartPrepSDKCall(self, type_: SDKCallType) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrepSDKCall_SetVirtual(self, vtblidx: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrepSDKCall_SetSignature(self, lib: SDKLibrary, signature: str, bytes_: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrepSDKCall_SetAddress(self, addr: Address) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrepSDKCall_SetFromConf(self, gameconf: SourceModHandle, source: SDKFuncConfSource, name: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrepSDKCall_SetReturnInfo(self, type_: SDKType, pass_: SDKPassMethod, decflags: int, encflags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrepSDKCall_AddParameter(self, type_: SDKType, pass_: SDKPassMethod, decflags: int, encflags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EndPrepSDKCall(self) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SDKCall(self, call: SourceModHandle, *args) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPlayerResourceEntity(self) -> int:
         raise SourcePawnUnboundNativeError
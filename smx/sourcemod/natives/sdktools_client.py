@@ -5,10 +5,10 @@ from smx.sourcemod.natives.base import SourceModNativesMixin, native
 
 
 class SdktoolsClientNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def InactivateClient(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReconnectClient(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
@@ -5,14 +5,14 @@ from smx.sourcemod.natives.base import Array, SourceModNativesMixin, native
 
 
 class SdktoolsEngineNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def SetClientViewEntity(self, client: int, entity: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetLightStyle(self, style: int, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientEyePosition(self, client: int, pos: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
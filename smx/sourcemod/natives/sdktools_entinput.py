@@ -5,6 +5,6 @@ from smx.sourcemod.natives.base import SourceModNativesMixin, native
 
 
 class SdktoolsEntinputNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def AcceptEntityInput(self, dest: int, input: str, activator: int, caller: int, outputid: int) -> bool:
         raise SourcePawnUnboundNativeError
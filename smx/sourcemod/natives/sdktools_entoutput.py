@@ -10,22 +10,22 @@ EntityOutput = Callable
 
 
 class SdktoolsEntoutputNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def HookEntityOutput(self, classname: str, output: str, callback: EntityOutput) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def UnhookEntityOutput(self, classname: str, output: str, callback: EntityOutput) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HookSingleEntityOutput(self, entity: int, output: str, callback: EntityOutput, once: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def UnhookSingleEntityOutput(self, entity: int, output: str, callback: EntityOutput) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FireEntityOutput(self, caller: int, output: str, activator: int, delay: float) -> None:
         raise SourcePawnUnboundNativeError
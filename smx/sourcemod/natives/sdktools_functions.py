@@ -11,146 +11,146 @@ from smx.sourcemod.natives.base import (
 
 
 class SdktoolsFunctionsNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def RemovePlayerItem(self, client: int, item: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GivePlayerItem(self, client: int, item: str, i_sub_type: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPlayerWeaponSlot(self, client: int, slot: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IgniteEntity(self, entity: int, time: float, npc: bool, size: float, level: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ExtinguishEntity(self, entity: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TeleportEntity(self, entity: int, origin: Array[float], angles: Array[float], velocity: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ForcePlayerSuicide(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SlapPlayer(self, client: int, health: int, sound: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindEntityByClassname(self, start_ent: int, classname: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientEyeAngles(self, client: int, ang: Array[float]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def CreateEntityByName(self, classname: str, force_edict_index: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DispatchSpawn(self, entity: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DispatchKeyValue(self, entity: int, key_name: str, value: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DispatchKeyValueFloat(self, entity: int, key_name: str, value: float) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DispatchKeyValueVector(self, entity: int, key_name: str, vec: Array[float]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientAimTarget(self, client: int, only_clients: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTeamCount(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTeamName(self, index: int, name: WritableString) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTeamScore(self, index: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetTeamScore(self, index: int, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTeamClientCount(self, index: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTeamEntity(self, team_index: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntityModel(self, entity: int, model: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPlayerDecalFile(self, client: int, hex: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetPlayerJingleFile(self, client: int, hex: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetServerNetStats(self, in_amount: Pointer[float], out_amout: Pointer[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EquipPlayerWeapon(self, client: int, weapon: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ActivateEntity(self, entity: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetClientInfo(self, client: int, key: str, value: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetClientName(self, client: int, name: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GivePlayerAmmo(self, client: int, amount: int, ammotype: int, suppress_sound: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntityCollisionGroup(self, entity: int, collision_group: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EntityCollisionRulesChanged(self, entity: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetEntityOwner(self, entity: int, owner: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LookupEntityAttachment(self, entity: int, name: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetEntityAttachment(self, entity: int, attachment: int, origin: Array[float], angles: Array[float]) -> bool:
         raise SourcePawnUnboundNativeError
@@ -21,42 +21,42 @@ class RoundState(IntEnum):
 
 
 class SdktoolsGamerulesNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GameRules_GetProp(self, prop: str, size: int, element: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_SetProp(self, prop: str, value: int, size: int, element: int, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_GetPropFloat(self, prop: str, element: int) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_SetPropFloat(self, prop: str, value: float, element: int, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_GetPropEnt(self, prop: str, element: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_SetPropEnt(self, prop: str, other: int, element: int, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_GetPropVector(self, prop: str, vec: Array[float], element: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_SetPropVector(self, prop: str, vec: Array[float], element: int, change_state: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_GetPropString(self, prop: str, buffer: str, maxlen: int, element: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameRules_SetPropString(self, prop: str, buffer: str, change_state: bool, element: int) -> int:
         raise SourcePawnUnboundNativeError
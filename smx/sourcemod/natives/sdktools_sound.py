@@ -17,62 +17,62 @@ AmbientSHook = Callable
 
 
 class SdktoolsSoundNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def PrefetchSound(self, name: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetSoundDuration(self, name: str) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EmitAmbientSound(self, name: str, pos: Array[float], entity: int, level: int, flags: int, vol: float, pitch: int, delay: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FadeClientVolume(self, client: int, percent: float, outtime: float, holdtime: float, intime: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StopSound(self, entity: int, channel: int, name: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EmitSound(self, clients: Array[int], num_clients: int, sample: str, entity: int, channel: int, level: int, flags: int, volume: float, pitch: int, speakerentity: int, origin: Array[float], dir_: Array[float], update_pos: bool, soundtime: float, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EmitSoundEntry(self, clients: Array[int], num_clients: int, sound_entry: str, sample: str, entity: int, channel: int, level: int, seed: int, flags: int, volume: float, pitch: int, speakerentity: int, origin: Array[float], dir_: Array[float], update_pos: bool, soundtime: float, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EmitSentence(self, clients: Array[int], num_clients: int, sentence: int, entity: int, channel: int, level: int, flags: int, volume: float, pitch: int, speakerentity: int, origin: Array[float], dir_: Array[float], update_pos: bool, soundtime: float, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetDistGainFromSoundLevel(self, soundlevel: int, distance: float) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddAmbientSoundHook(self, hook: AmbientSHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddNormalSoundHook(self, hook: NormalSHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveAmbientSoundHook(self, hook: AmbientSHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveNormalSoundHook(self, hook: NormalSHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetGameSoundParams(self, game_sound: str, channel: Pointer[int], sound_level: Pointer[int], volume: Pointer[float], pitch: Pointer[int], sample: WritableString, entity: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def PrecacheScriptSound(self, soundname: str) -> bool:
         raise SourcePawnUnboundNativeError
@@ -9,50 +9,50 @@ from smx.sourcemod.natives.base import (
 
 
 class SdktoolsStringtablesNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def FindStringTable(self, name: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetNumStringTables(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetStringTableNumStrings(self, tableidx: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetStringTableMaxStrings(self, tableidx: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetStringTableName(self, tableidx: int, name: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindStringIndex(self, tableidx: int, str_: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadStringTable(self, tableidx: int, stringidx: int, str: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetStringTableDataLength(self, tableidx: int, stringidx: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetStringTableData(self, tableidx: int, stringidx: int, userdata: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetStringTableData(self, tableidx: int, stringidx: int, userdata: str, length: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddToStringTable(self, tableidx: int, str_: str, userdata: str, length: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LockStringTables(self, lock: bool) -> bool:
         raise SourcePawnUnboundNativeError
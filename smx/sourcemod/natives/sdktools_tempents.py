@@ -10,54 +10,54 @@ TEHook = Callable
 
 
 class SdktoolsTempentsNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def AddTempEntHook(self, te_name: str, hook: TEHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveTempEntHook(self, te_name: str, hook: TEHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_Start(self, te_name: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_IsValidProp(self, prop: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_WriteNum(self, prop: str, value: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_ReadNum(self, prop: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_WriteFloat(self, prop: str, value: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_ReadFloat(self, prop: str) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_WriteVector(self, prop: str, vector: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_ReadVector(self, prop: str, vector: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_WriteAngles(self, prop: str, angles: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_WriteFloatArray(self, prop: str, array: Array[float], array_size: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TE_Send(self, clients: Array[int], num_clients: int, delay: float) -> None:
         raise SourcePawnUnboundNativeError
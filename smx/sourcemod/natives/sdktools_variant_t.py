@@ -5,34 +5,34 @@ from smx.sourcemod.natives.base import Array, SourceModNativesMixin, native
 
 
 class SdktoolsVariantTNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def SetVariantBool(self, val: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVariantString(self, str_: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVariantInt(self, val: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVariantFloat(self, val: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVariantVector3D(self, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVariantPosVector3D(self, vec: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVariantColor(self, color: Array[int]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetVariantEntity(self, entity: int) -> None:
         raise SourcePawnUnboundNativeError
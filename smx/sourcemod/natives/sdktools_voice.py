@@ -13,30 +13,30 @@ class ListenOverride(IntEnum):
 
 
 class SdktoolsVoiceNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def SetClientListeningFlags(self, client: int, flags: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientListeningFlags(self, client: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetClientListening(self, i_receiver: int, i_sender: int, b_listen: bool) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetClientListening(self, i_receiver: int, i_sender: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetListenOverride(self, i_receiver: int, i_sender: int, override: ListenOverride) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetListenOverride(self, i_receiver: int, i_sender: int) -> ListenOverride:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsClientMuted(self, i_muter: int, i_mutee: int) -> bool:
         raise SourcePawnUnboundNativeError
@@ -26,30 +26,30 @@ class SortType(IntEnum):
 
 
 class SortingNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def SortIntegers(self, array: Array[int], array_size: int, order: SortOrder) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SortFloats(self, array: Array[float], array_size: int, order: SortOrder) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SortStrings(self, array: str, array_size: int, order: SortOrder) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SortCustom1D(self, array: Array[int], array_size: int, sortfunc: SortFunc1D, hndl: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SortCustom2D(self, array: Array[Array[int]], array_size: int, sortfunc: SortFunc2D, hndl: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SortADTArray(self, array: SourceModHandle, order: SortOrder, type_: SortType) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SortADTArrayCustom(self, array: SourceModHandle, sortfunc: SortFuncADTArray, hndl: SourceModHandle) -> None:
         raise SourcePawnUnboundNativeError
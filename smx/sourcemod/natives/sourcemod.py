@@ -72,43 +72,43 @@ class FrameIterator:
 
 
 class GameDataMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def GetOffset(self, this: SourceModHandle[GameData], key: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetKeyValue(self, this: SourceModHandle[GameData], key: str, buffer: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAddress(self, this: SourceModHandle[GameData], name: str) -> Address:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMemSig(self, this: SourceModHandle[GameData], name: str) -> Address:
         raise SourcePawnUnboundNativeError
 
 
 class PluginIteratorMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Next(self, this: SourceModHandle[PluginIterator]) -> bool:
         raise SourcePawnUnboundNativeError
 
 
 class FrameIteratorMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def Next(self, this: SourceModHandle[FrameIterator]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Reset(self, this: SourceModHandle[FrameIterator]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetFunctionName(self, this: SourceModHandle[FrameIterator], buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetFilePath(self, this: SourceModHandle[FrameIterator], buffer: str, maxlen: int) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -122,15 +122,15 @@ class SourceModIncNatives(SourceModNativesMixin):
     def GetMyHandle(self) -> SourceModHandle[SourcePawnPlugin]:
         return self.sys.handles.new_handle(self.runtime.plugin)
 
-    @native
+    @native(stub=True)
     def GetPluginIterator(self) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def MorePlugins(self, iter_: SourceModHandle) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReadPlugin(self, iter_: SourceModHandle) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
@@ -182,82 +182,82 @@ class SourceModIncNatives(SourceModNativesMixin):
         buf.write(value)
         return True
 
-    @native
+    @native(stub=True)
     def FindPluginByNumber(self, order_num: int) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetFailState(self, string: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ThrowError(self, fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LogStackTrace(self, fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTime(self, big_stamp: Array[int]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FormatTime(self, buffer: WritableString, format_: str, stamp: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LoadGameConfigFile(self, file: str) -> SourceModHandle[GameData]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameConfGetOffset(self, gc: SourceModHandle, key: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameConfGetKeyValue(self, gc: SourceModHandle, key: str, buffer: str, maxlen: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GameConfGetAddress(self, gameconf: SourceModHandle, name: str) -> Address:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetSysTickCount(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AutoExecConfig(self, auto_create: bool, name: str, folder: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RegPluginLibrary(self, name: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LibraryExists(self, name: str) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetExtensionFileStatus(self, name: str, error: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetMapListCompatBind(self, name: str, file: str) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetFeatureStatus(self, type_: FeatureType, name: str) -> FeatureStatus:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RequireFeature(self, type_: FeatureType, name: str, fmt: str, *args) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LoadFromAddress(self, addr: Address, size: NumberType) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StoreToAddress(self, addr: Address, data: int, size: NumberType, update_mem_access: bool) -> None:
         raise SourcePawnUnboundNativeError
@@ -44,47 +44,47 @@ class StringNatives(SourceModNativesMixin):
     def strcopy(self, dest: WritableString, src: str) -> int:
         return dest.write(src, null_terminate=True)
 
-    @native
+    @native(stub=True)
     def Format(self, buffer: WritableString, format_: str, *args) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FormatEx(self, buffer: WritableString, format_: str, *args) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def VFormat(self, buffer: WritableString, format_: str, varpos: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StringToInt(self, str_: str, n_base: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StringToIntEx(self, str_: str, result: Pointer[int], n_base: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StringToInt64(self, str_: str, result: Array[int], n_base: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IntToString(self, num: int, str: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Int64ToString(self, num: Array[int], str: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StringToFloat(self, str_: str) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StringToFloatEx(self, str_: str, result: Pointer[float]) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FloatToString(self, num: float, str: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
@@ -116,46 +116,46 @@ class StringNatives(SourceModNativesMixin):
         buf.max_length = len(string)
         return buf.write(string.strip(), null_terminate=True)
 
-    @native
+    @native(stub=True)
     def SplitString(self, source: str, split: str, part: str, part_len: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReplaceString(self, text: WritableString, search: str, replace: str, case_sensitive: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ReplaceStringEx(self, text: WritableString, search: str, replace: str, search_len: int, replace_len: int, case_sensitive: bool) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetCharBytes(self, source: str) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsCharAlpha(self, chr_: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsCharNumeric(self, chr_: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsCharSpace(self, chr_: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsCharMB(self, chr_: int) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsCharUpper(self, chr_: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsCharLower(self, chr_: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StripQuotes(self, text: str) -> bool:
         raise SourcePawnUnboundNativeError
@@ -47,11 +47,11 @@ class SMCParser:
 
 
 class SMCParserMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def ParseFile(self, this: SourceModHandle[SMCParser], file: str, line: Pointer[int], col: Pointer[int]) -> SMCError:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetErrorString(self, this: SourceModHandle[SMCParser], error: SMCError, buffer: str, buf_max: int) -> None:
         raise SourcePawnUnboundNativeError
 
@@ -59,30 +59,30 @@ class SMCParserMethodMap(MethodMap):
 class TextparseNatives(SourceModNativesMixin):
     SMCParser = SMCParserMethodMap()
 
-    @native
+    @native(stub=True)
     def SMC_CreateParser(self) -> SourceModHandle[SMCParser]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SMC_ParseFile(self, smc: SourceModHandle, file: str, line: Pointer[int], col: Pointer[int]) -> SMCError:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SMC_GetErrorString(self, error: SMCError, buffer: str, buf_max: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SMC_SetParseStart(self, smc: SourceModHandle, func: SMC_ParseStart) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SMC_SetParseEnd(self, smc: SourceModHandle, func: SMC_ParseEnd) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SMC_SetReaders(self, smc: SourceModHandle, ns: SMC_NewSection, kv: SMC_KeyValue, es: SMC_EndSection) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SMC_SetRawLine(self, smc: SourceModHandle, func: SMC_RawLine) -> None:
         raise SourcePawnUnboundNativeError
@@ -183,62 +183,62 @@ class TFObjectMode(IntEnum):
 
 
 class Tf2Natives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def TF2_IgnitePlayer(self, client: int, attacker: int, duration: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_RespawnPlayer(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_RegeneratePlayer(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_AddCondition(self, client: int, condition: TFCond, duration: float, inflictor: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_RemoveCondition(self, client: int, condition: TFCond) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_SetPlayerPowerPlay(self, client: int, enabled: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_DisguisePlayer(self, client: int, team: TFTeam, class_type: TFClassType, target: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_RemovePlayerDisguise(self, client: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_StunPlayer(self, client: int, duration: float, slowdown: float, stunflags: int, attacker: int) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_MakeBleed(self, client: int, attacker: int, duration: float) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_GetResourceEntity(self) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_GetClass(self, classname: str) -> TFClassType:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_IsHolidayActive(self, holiday: TFHoliday) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_IsPlayerInDuel(self, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TF2_RemoveWearable(self, client: int, wearable: int) -> None:
         raise SourcePawnUnboundNativeError
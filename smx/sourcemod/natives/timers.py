@@ -28,37 +28,40 @@ class TimerNatives(SourceModNativesMixin):
         @return            Handle to the timer object.  You do not need to call CloseHandle().
                                If the timer could not be created, INVALID_HANDLE will be returned.
         """
-        logger.info('Interval: %f, func: %d, data: %d, flags: %d' % (interval, func, data, flags))
-        return self.sys.timers.create_timer(interval, func, data, flags)
+        if func is None:
+            self.amx.report_error('Invalid function id')
 
-    @native
+        logger.info('Interval: %f, func: %d, data: %d, flags: %d', interval, func.func_id, data, flags)
+        return self.sys.timers.create_timer(interval, func.func_id, data, flags)
+
+    @native(stub=True)
     def KillTimer(self, timer: SourceModHandle, auto_close: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def TriggerTimer(self, timer: SourceModHandle, reset: bool) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTickedTime(self) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMapTimeLeft(self, timeleft: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetMapTimeLimit(self, time: Pointer[int]) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def ExtendMapTimeLimit(self, time: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTickInterval(self) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def IsServerProcessing(self) -> bool:
         raise SourcePawnUnboundNativeError
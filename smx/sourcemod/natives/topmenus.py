@@ -44,43 +44,43 @@ class TopMenu:
 
 
 class TopMenuMethodMap(MethodMap):
-    @native
+    @native(stub=True)
     def FromHandle(self, handle: SourceModHandle) -> SourceModHandle[TopMenu]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LoadConfig(self, this: SourceModHandle[TopMenu], file: str, error: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddCategory(self, this: SourceModHandle[TopMenu], name: str, handler: TopMenuHandler, cmdname: str, flags: int, info_string: str) -> TopMenuObject:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddItem(self, this: SourceModHandle[TopMenu], name: str, handler: TopMenuHandler, parent: TopMenuObject, cmdname: str, flags: int, info_string: str) -> TopMenuObject:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetInfoString(self, this: SourceModHandle[TopMenu], parent: TopMenuObject, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetObjName(self, this: SourceModHandle[TopMenu], topobj: TopMenuObject, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Remove(self, this: SourceModHandle[TopMenu], topobj: TopMenuObject) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def Display(self, this: SourceModHandle[TopMenu], client: int, position: TopMenuPosition) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DisplayCategory(self, this: SourceModHandle[TopMenu], category: TopMenuObject, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindCategory(self, this: SourceModHandle[TopMenu], name: str) -> TopMenuObject:
         raise SourcePawnUnboundNativeError
 
@@ -88,42 +88,42 @@ class TopMenuMethodMap(MethodMap):
 class TopmenusNatives(SourceModNativesMixin):
     TopMenu = TopMenuMethodMap()
 
-    @native
+    @native(stub=True)
     def CreateTopMenu(self, handler: TopMenuHandler) -> SourceModHandle[TopMenu]:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def LoadTopMenuConfig(self, topmenu: SourceModHandle, file: str, error: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def AddToTopMenu(self, topmenu: SourceModHandle, name: str, type_: TopMenuObjectType, handler: TopMenuHandler, parent: TopMenuObject, cmdname: str, flags: int, info_string: str) -> TopMenuObject:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTopMenuInfoString(self, topmenu: SourceModHandle, parent: TopMenuObject, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetTopMenuObjName(self, topmenu: SourceModHandle, topobj: TopMenuObject, buffer: WritableString) -> int:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def RemoveFromTopMenu(self, topmenu: SourceModHandle, topobj: TopMenuObject) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DisplayTopMenu(self, topmenu: SourceModHandle, client: int, position: TopMenuPosition) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def DisplayTopMenuCategory(self, topmenu: SourceModHandle, category: TopMenuObject, client: int) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def FindTopMenuCategory(self, topmenu: SourceModHandle, name: str) -> TopMenuObject:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def SetTopMenuTitleCaching(self, topmenu: SourceModHandle, cache_titles: bool) -> None:
         raise SourcePawnUnboundNativeError
@@ -27,34 +27,34 @@ class UserMessageType(IntEnum):
 
 
 class UsermessagesNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GetUserMessageType(self) -> UserMessageType:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetUserMessageId(self, msg: str) -> UserMsg:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetUserMessageName(self, msg_id: UserMsg, msg: WritableString) -> bool:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StartMessage(self, msgname: str, clients: Array[int], num_clients: int, flags: int) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def StartMessageEx(self, msg: UserMsg, clients: Array[int], num_clients: int, flags: int) -> SourceModHandle:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def EndMessage(self) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def HookUserMessage(self, msg_id: UserMsg, hook: MsgHook, intercept: bool, post: MsgPostHook) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def UnhookUserMessage(self, msg_id: UserMsg, hook: MsgHook, intercept: bool) -> None:
         raise SourcePawnUnboundNativeError
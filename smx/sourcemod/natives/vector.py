@@ -5,34 +5,34 @@ from smx.sourcemod.natives.base import Array, SourceModNativesMixin, native
 
 
 class VectorNatives(SourceModNativesMixin):
-    @native
+    @native(stub=True)
     def GetVectorLength(self, vec: Array[float], squared: bool) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetVectorDistance(self, vec1: Array[float], vec2: Array[float], squared: bool) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetVectorDotProduct(self, vec1: Array[float], vec2: Array[float]) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetVectorCrossProduct(self, vec1: Array[float], vec2: Array[float], result: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def NormalizeVector(self, vec: Array[float], result: Array[float]) -> float:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetAngleVectors(self, angle: Array[float], fwd: Array[float], right: Array[float], up: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetVectorAngles(self, vec: Array[float], angle: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
 
-    @native
+    @native(stub=True)
     def GetVectorVectors(self, vec: Array[float], right: Array[float], up: Array[float]) -> None:
         raise SourcePawnUnboundNativeError
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Type, TYPE_CHECKING
+from copy import deepcopy
+from typing import Any, Tuple, Type, TYPE_CHECKING
 
 from smx.engine import engine_time
 from smx.sourcemod.handles import SourceModHandles
@@ -30,7 +31,7 @@ class SourceModSystem:
         """
         self.amx: SourcePawnAbstractMachine = amx
         self.plugin: SourcePawnPlugin = self.amx.plugin
-        self.runtime: SourcePawnPluginRuntime = self.plugin.runtime
+        self.runtime: SourcePawnPluginRuntime = self.amx.runtime
 
         self.natives: SourceModNatives = natives_cls(self)
         self.timers = SourceModTimers(self)
@@ -42,5 +43,35 @@ class SourceModSystem:
 
         self.convars = {}
 
+    def snapshot(self) -> Tuple[Any, ...]:
+        """Capture the mutable state of the emulator: its handles, timers, and convars
+
+        Handle objects are deep-copied, so later changes to them don't leak into the
+        snapshot, and it can be restored any number of times.
+        """
+        return self._copy_state((
+            self.handles._handle_counter,
+            self.handles._handles,
+            self.timers._timers,
+            self.convars,
+            self.last_tick,
+        ))
+
+    def restore(self, state: Tuple[Any, ...]) -> None:
+        """Return the emulator to a state captured by `snapshot()`"""
+        (
+            self.handles._handle_counter,
+            self.handles._handles,
+            self.timers._timers,
+            self.convars,
+            self.last_tick,
+        ) = self._copy_state(state)
+
+    def _copy_state(self, state: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        # The emulator, and the machine it belongs to, must be shared by the copy
+        # (e.g. by the bound natives used as handles' on_close callbacks)
+        shared = (self, self.amx, self.runtime, self.plugin, self.natives, self.handles, self.timers)
+        return deepcopy(state, {id(obj): obj for obj in shared})
+
     def tick(self):
         self.last_tick = engine_time()
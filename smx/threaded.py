@@ -0,0 +1,957 @@
+# "Threaded code" execution engine: functions are compiled into chains of closures
+from __future__ import annotations
+
+from ctypes import sizeof
+from typing import Callable, Dict, List, TYPE_CHECKING
+
+from smx.definitions import cell
+
+if TYPE_CHECKING:
+    from smx.decoder import DecodedInstruction
+    from smx.plugin import SourcePawnPlugin
+    from smx.vm import SourcePawnAbstractMachine
+
+__all__ = ['ThreadedCode', 'OpClosure']
+
+#: A compiled instruction. It receives the abstract machine, and returns the
+#: address of the next instruction to execute (or a negative value to stop).
+OpClosure = Callable[['SourcePawnAbstractMachine'], int]
+
+CELL_SIZE = sizeof(cell)
+
+
+class ThreadedCode:
+    """Lazily compiles a plug-in's decoded instructions into specialized closures
+
+    Closures are compiled a whole function at a time (bounded by the function's
+    RTTIMethod.pcode_start/pcode_end), the first time execution reaches any
+    address within it. Operands, stack offsets, and jump targets are bound
+    into each closure, so executing an instruction is a single call, with no
+    param decoding, dispatch, or tracing checks.
+
+    Compiled code holds no reference to any abstract machine, so it is shared
+    by all runtimes of the plug-in.
+    """
+
+    def __init__(self, plugin: SourcePawnPlugin):
+        self.plugin = plugin
+        self.table: List[OpClosure | None] = [None] * len(plugin.decoded_code)
+
+    def run(self, amx: SourcePawnAbstractMachine) -> None:
+        """Execute from amx.CIP until a halt instruction (or the end of code) is reached"""
+        table = self.table
+        code_size = len(table) << 2
+        cip = amx.CIP
+        while cip >= 0:
+            op = table[cip >> 2] if cip < code_size else self._end_of_code
+            if op is None:
+                op = self.compile_at(cip)
+            cip = op(amx)
+
+    @staticmethod
+    def _end_of_code(amx: SourcePawnAbstractMachine) -> int:
+        return -1
+
+    def compile_at(self, cip: int) -> OpClosure:
+        """Compile the function containing the given address, and return the closure for `cip`"""
+        decoded = self.plugin.decoded_code
+        meth = self.plugin.find_method_by_addr(cip)
+        if meth is not None and meth.pcode_start <= cip < meth.pcode_end:
+            start, end = meth.pcode_start, meth.pcode_end
+        else:
+            # Without type info, we know no function bounds; compile just what's needed
+            start, end = cip, cip + CELL_SIZE
+
+        for addr in range(start, min(end, len(decoded) << 2), CELL_SIZE):
+            d = decoded[addr >> 2]
+            if d is not None and self.table[addr >> 2] is None:
+                self.table[addr >> 2] = compile_instruction(d)
+
+        op = self.table[cip >> 2]
+        if op is None:
+            op = self.table[cip >> 2] = _invalid_instruction(cip)
+        return op
+
+
+def compile_instruction(d: DecodedInstruction) -> OpClosure:
+    """Compile a single decoded instruction into a specialized closure"""
+    factory = _FACTORIES.get(d.instr.method)
+    if factory is None or len(d.params) != len(d.instr.params):
+        return _generic(d)
+    return factory(d, *d.params)
+
+
+def _invalid_instruction(addr: int) -> OpClosure:
+    from smx.errors import SourcePawnErrorCode
+
+    def invalid_instruction(amx: SourcePawnAbstractMachine) -> int:
+        _sync(amx, addr)
+        amx.report_error(SourcePawnErrorCode.INVALID_INSTRUCTION)
+        return -1
+    return invalid_instruction
+
+
+def _sync(amx: SourcePawnAbstractMachine, addr: int) -> None:
+    """Record the address of the executing instruction, for stack traces and error reports"""
+    amx.instr_addr = addr
+    if amx._frames:
+        amx._frames[-1].addr = addr
+
+
+def _generic(d: DecodedInstruction) -> OpClosure:
+    """Fallback which invokes the SMXInstructions handler, for complex or faulting opcodes"""
+    handler = d.handler
+    addr = d.addr
+    next_cip = d.next_cip
+    params = d.params
+    stack_params = d.stack_params
+
+    if handler is None:
+        # Mirror the interpreter, which skips over unimplemented opcodes
+        def unimplemented(amx: SourcePawnAbstractMachine) -> int:
+            return next_cip
+        return unimplemented
+
+    if not stack_params:
+        def generic(amx: SourcePawnAbstractMachine) -> int:
+            _sync(amx, addr)
+            amx.CIP = next_cip
+            handler(amx.instructions, amx, *params)
+            return amx.CIP
+    else:
+        def generic(amx: SourcePawnAbstractMachine) -> int:
+            _sync(amx, addr)
+            amx.CIP = next_cip
+            frm = amx.FRM
+            resolved = [frm + p if i in stack_params else p for i, p in enumerate(params)]
+            handler(amx.instructions, amx, *resolved)
+            return amx.CIP
+
+    return generic
+
+
+###
+# Specialized closure factories. Each receives the decoded instruction and its
+# raw params, and returns a closure with those params bound in advance.
+#
+# NOTE: the semantics of each closure must match its SMXInstructions handler
+#       in smx/pawn.py exactly.
+###
+
+def _load_pri(d, addr):
+    nxt = d.next_cip
+    def load_pri(amx):
+        amx.PRI = amx._getheapcell(addr)
+        return nxt
+    return load_pri
+
+
+def _load_alt(d, addr):
+    nxt = d.next_cip
+    def load_alt(amx):
+        amx.ALT = amx._getheapcell(addr)
+        return nxt
+    return load_alt
+
+
+def _load_s_pri(d, offs):
+    nxt = d.next_cip
+    def load_s_pri(amx):
+        amx.PRI = amx._getheapcell(amx.FRM + offs)
+        return nxt
+    return load_s_pri
+
+
+def _load_s_alt(d, offs):
+    nxt = d.next_cip
+    def load_s_alt(amx):
+        amx.ALT = amx._getheapcell(amx.FRM + offs)
+        return nxt
+    return load_s_alt
+
+
+def _lref_s_pri(d, offs):
+    nxt = d.next_cip
+    def lref_s_pri(amx):
+        amx.PRI = amx._getheapcell(amx._getheapcell(amx.FRM + offs))
+        return nxt
+    return lref_s_pri
+
+
+def _lref_s_alt(d, offs):
+    nxt = d.next_cip
+    def lref_s_alt(amx):
+        amx.ALT = amx._getheapcell(amx._getheapcell(amx.FRM + offs))
+        return nxt
+    return lref_s_alt
+
+
+def _load_i(d):
+    nxt = d.next_cip
+    def load_i(amx):
+        amx.PRI = amx._getheapcell(amx.PRI)
+        return nxt
+    return load_i
+
+
+def _const_pri(d, val):
+    nxt = d.next_cip
+    def const_pri(amx):
+        amx.PRI = val
+        return nxt
+    return const_pri
+
+
+def _const_alt(d, val):
+    nxt = d.next_cip
+    def const_alt(amx):
+        amx.ALT = val
+        return nxt
+    return const_alt
+
+
+def _addr_pri(d, offs):
+    nxt = d.next_cip
+    def addr_pri(amx):
+        amx.PRI = amx.FRM + offs
+        return nxt
+    return addr_pri
+
+
+def _addr_alt(d, offs):
+    nxt = d.next_cip
+    def addr_alt(amx):
+        amx.ALT = amx.FRM + offs
+        return nxt
+    return addr_alt
+
+
+def _stor_pri(d, addr):
+    nxt = d.next_cip
+    def stor_pri(amx):
+        amx._writeheap(addr, amx.PRI)
+        return nxt
+    return stor_pri
+
+
+def _stor_alt(d, addr):
+    nxt = d.next_cip
+    def stor_alt(amx):
+        amx._writeheap(addr, amx.ALT)
+        return nxt
+    return stor_alt
+
+
+def _stor_s_pri(d, offs):
+    nxt = d.next_cip
+    def stor_s_pri(amx):
+        amx._writeheap(amx.FRM + offs, amx.PRI)
+        return nxt
+    return stor_s_pri
+
+
+def _stor_s_alt(d, offs):
+    nxt = d.next_cip
+    def stor_s_alt(amx):
+        amx._writeheap(amx.FRM + offs, amx.ALT)
+        return nxt
+    return stor_s_alt
+
+
+def _sref_s_pri(d, offs):
+    nxt = d.next_cip
+    def sref_s_pri(amx):
+        amx._writeheap(amx._getheapcell(amx.FRM + offs), amx.PRI)
+        return nxt
+    return sref_s_pri
+
+
+def _sref_s_alt(d, offs):
+    nxt = d.next_cip
+    def sref_s_alt(amx):
+        amx._writeheap(amx._getheapcell(amx.FRM + offs), amx.ALT)
+        return nxt
+    return sref_s_alt
+
+
+def _stor_i(d):
+    nxt = d.next_cip
+    def stor_i(amx):
+        amx._writeheap(amx.ALT, amx.PRI)
+        return nxt
+    return stor_i
+
+
+def _lidx(d):
+    nxt = d.next_cip
+    def lidx(amx):
+        amx.PRI = amx._getheapcell(amx.PRI + CELL_SIZE + amx.ALT)
+        return nxt
+    return lidx
+
+
+def _idxaddr(d):
+    nxt = d.next_cip
+    def idxaddr(amx):
+        amx.PRI = amx.PRI * CELL_SIZE + amx.ALT
+        return nxt
+    return idxaddr
+
+
+def _move_pri(d):
+    nxt = d.next_cip
+    def move_pri(amx):
+        amx.PRI = amx.ALT
+        return nxt
+    return move_pri
+
+
+def _move_alt(d):
+    nxt = d.next_cip
+    def move_alt(amx):
+        amx.ALT = amx.PRI
+        return nxt
+    return move_alt
+
+
+def _xchg(d):
+    nxt = d.next_cip
+    def xchg(amx):
+        amx.ALT, amx.PRI = amx.PRI, amx.ALT
+        return nxt
+    return xchg
+
+
+def _push_pri(d):
+    nxt = d.next_cip
+    def push_pri(amx):
+        amx._push(amx.PRI)
+        return nxt
+    return push_pri
+
+
+def _push_alt(d):
+    nxt = d.next_cip
+    def push_alt(amx):
+        amx._push(amx.ALT)
+        return nxt
+    return push_alt
+
+
+def _pop_pri(d):
+    nxt = d.next_cip
+    def pop_pri(amx):
+        amx.PRI = amx._pop()
+        return nxt
+    return pop_pri
+
+
+def _pop_alt(d):
+    nxt = d.next_cip
+    def pop_alt(amx):
+        amx.ALT = amx._pop()
+        return nxt
+    return pop_alt
+
+
+def _push_n_c(d, *values):
+    nxt = d.next_cip
+    def push_n_c(amx):
+        for val in values:
+            amx._push(val)
+        return nxt
+    return push_n_c
+
+
+def _push_n(d, *addrs):
+    nxt = d.next_cip
+    def push_n(amx):
+        vals = [amx._getheapcell(addr) for addr in addrs]
+        for val in vals:
+            amx._push(val)
+        return nxt
+    return push_n
+
+
+def _push_n_s(d, *offsets):
+    nxt = d.next_cip
+    def push_n_s(amx):
+        frm = amx.FRM
+        vals = [amx._getheapcell(frm + offs) for offs in offsets]
+        for val in vals:
+            amx._push(val)
+        return nxt
+    return push_n_s
+
+
+def _push_n_adr(d, *offsets):
+    nxt = d.next_cip
+    def push_n_adr(amx):
+        frm = amx.FRM
+        for offs in offsets:
+            amx._push(frm + offs)
+        return nxt
+    return push_n_adr
+
+
+def _stack(d, offs):
+    nxt = d.next_cip
+    def stack(amx):
+        amx.ALT = amx.STK
+        amx.STK += offs
+        return nxt
+    return stack
+
+
+def _nop(d, *params):
+    nxt = d.next_cip
+    def nop(amx):
+        return nxt
+    return nop
+
+
+def _jump(d, target):
+    def jump(amx):
+        return target
+    return jump
+
+
+def _jzer(d, target):
+    nxt = d.next_cip
+    def jzer(amx):
+        return target if amx.PRI == 0 else nxt
+    return jzer
+
+
+def _jnz(d, target):
+    nxt = d.next_cip
+    def jnz(amx):
+        return target if amx.PRI != 0 else nxt
+    return jnz
+
+
+def _jeq(d, target):
+    nxt = d.next_cip
+    def jeq(amx):
+        return target if amx.PRI == amx.ALT else nxt
+    return jeq
+
+
+def _jneq(d, target):
+    nxt = d.next_cip
+    def jneq(amx):
+        return target if amx.PRI != amx.ALT else nxt
+    return jneq
+
+
+def _jsless(d, target):
+    nxt = d.next_cip
+    def jsless(amx):
+        return target if amx.PRI < amx.ALT else nxt
+    return jsless
+
+
+def _jsleq(d, target):
+    nxt = d.next_cip
+    def jsleq(amx):
+        return target if amx.PRI <= amx.ALT else nxt
+    return jsleq
+
+
+def _jsgrtr(d, target):
+    nxt = d.next_cip
+    def jsgrtr(amx):
+        return target if amx.PRI > amx.ALT else nxt
+    return jsgrtr
+
+
+def _jsgeq(d, target):
+    nxt = d.next_cip
+    def jsgeq(amx):
+        return target if amx.PRI >= amx.ALT else nxt
+    return jsgeq
+
+
+def _halt(d, param):
+    def halt(amx):
+        amx._halt(param)
+        return -1
+    return halt
+
+
+def _binary_op(name: str, fn: Callable[[int, int], int]):
+    def factory(d):
+        nxt = d.next_cip
+        def binary_op(amx):
+            amx.PRI = fn(amx.PRI, amx.ALT)
+            return nxt
+        binary_op.__name__ = name
+        return binary_op
+    return factory
+
+
+def _unary_pri_op(name: str, fn: Callable[[int], int]):
+    def factory(d):
+        nxt = d.next_cip
+        def unary_op(amx):
+            amx.PRI = fn(amx.PRI)
+            return nxt
+        unary_op.__name__ = name
+        return unary_op
+    return factory
+
+
+def _add(d):
+    nxt = d.next_cip
+    def add(amx):
+        amx.PRI += amx.ALT
+        return nxt
+    return add
+
+
+def _sub(d):
+    nxt = d.next_cip
+    def sub(amx):
+        amx.PRI = amx.PRI - amx.ALT
+        return nxt
+    return sub
+
+
+def _eq(d):
+    nxt = d.next_cip
+    def eq(amx):
+        amx.PRI = 1 if amx.PRI == amx.ALT else 0
+        return nxt
+    return eq
+
+
+def _neq(d):
+    nxt = d.next_cip
+    def neq(amx):
+        amx.PRI = 1 if amx.PRI != amx.ALT else 0
+        return nxt
+    return neq
+
+
+def _sless(d):
+    nxt = d.next_cip
+    def sless(amx):
+        amx.PRI = 1 if amx.PRI < amx.ALT else 0
+        return nxt
+    return sless
+
+
+def _sleq(d):
+    nxt = d.next_cip
+    def sleq(amx):
+        amx.PRI = 1 if amx.PRI <= amx.ALT else 0
+        return nxt
+    return sleq
+
+
+def _sgrtr(d):
+    nxt = d.next_cip
+    def sgrtr(amx):
+        amx.PRI = 1 if amx.PRI > amx.ALT else 0
+        return nxt
+    return sgrtr
+
+
+def _sgeq(d):
+    nxt = d.next_cip
+    def sgeq(amx):
+        amx.PRI = 1 if amx.PRI >= amx.ALT else 0
+        return nxt
+    return sgeq
+
+
+def _shl_c_pri(d, offs):
+    nxt = d.next_cip
+    def shl_c_pri(amx):
+        amx.PRI <<= offs
+        return nxt
+    return shl_c_pri
+
+
+def _shl_c_alt(d, offs):
+    nxt = d.next_cip
+    def shl_c_alt(amx):
+        amx.ALT <<= offs
+        return nxt
+    return shl_c_alt
+
+
+def _smul_c(d, val):
+    nxt = d.next_cip
+    def smul_c(amx):
+        amx.PRI *= val
+        return nxt
+    return smul_c
+
+
+def _add_c(d, val):
+    nxt = d.next_cip
+    def add_c(amx):
+        amx.PRI += val
+        return nxt
+    return add_c
+
+
+def _zero_pri(d):
+    nxt = d.next_cip
+    def zero_pri(amx):
+        amx.PRI = 0
+        return nxt
+    return zero_pri
+
+
+def _zero_alt(d):
+    nxt = d.next_cip
+    def zero_alt(amx):
+        amx.ALT = 0
+        return nxt
+    return zero_alt
+
+
+def _zero(d, addr):
+    nxt = d.next_cip
+    def zero(amx):
+        amx._writeheap(addr, 0)
+        return nxt
+    return zero
+
+
+def _zero_s(d, offs):
+    nxt = d.next_cip
+    def zero_s(amx):
+        amx._writeheap(amx.FRM + offs, 0)
+        return nxt
+    return zero_s
+
+
+def _eq_c_pri(d, val):
+    nxt = d.next_cip
+    def eq_c_pri(amx):
+        amx.PRI = 1 if amx.PRI == val else 0
+        return nxt
+    return eq_c_pri
+
+
+def _eq_c_alt(d, val):
+    nxt = d.next_cip
+    def eq_c_alt(amx):
+        amx.PRI = 1 if amx.ALT == val else 0
+        return nxt
+    return eq_c_alt
+
+
+def _inc_pri(d):
+    nxt = d.next_cip
+    def inc_pri(amx):
+        amx.PRI += 1
+        return nxt
+    return inc_pri
+
+
+def _inc_alt(d):
+    nxt = d.next_cip
+    def inc_alt(amx):
+        amx.ALT += 1
+        return nxt
+    return inc_alt
+
+
+def _dec_pri(d):
+    nxt = d.next_cip
+    def dec_pri(amx):
+        amx.PRI -= 1
+        return nxt
+    return dec_pri
+
+
+def _dec_alt(d):
+    nxt = d.next_cip
+    def dec_alt(amx):
+        amx.ALT -= 1
+        return nxt
+    return dec_alt
+
+
+def _inc(d, addr):
+    nxt = d.next_cip
+    def inc(amx):
+        amx._writeheap(addr, amx._getheapcell(addr) + 1)
+        return nxt
+    return inc
+
+
+def _dec(d, addr):
+    nxt = d.next_cip
+    def dec(amx):
+        amx._writeheap(addr, amx._getheapcell(addr) - 1)
+        return nxt
+    return dec
+
+
+def _inc_s(d, offs):
+    nxt = d.next_cip
+    def inc_s(amx):
+        addr = amx.FRM + offs
+        amx._writeheap(addr, amx._getheapcell(addr) + 1)
+        return nxt
+    return inc_s
+
+
+def _dec_s(d, offs):
+    nxt = d.next_cip
+    def dec_s(amx):
+        addr = amx.FRM + offs
+        amx._writeheap(addr, amx._getheapcell(addr) - 1)
+        return nxt
+    return dec_s
+
+
+def _inc_i(d):
+    nxt = d.next_cip
+    def inc_i(amx):
+        addr = amx.PRI
+        amx._writeheap(addr, amx._getheapcell(addr) + 1)
+        return nxt
+    return inc_i
+
+
+def _dec_i(d):
+    nxt = d.next_cip
+    def dec_i(amx):
+        addr = amx.PRI
+        amx._writeheap(addr, amx._getheapcell(addr) - 1)
+        return nxt
+    return dec_i
+
+
+def _swap_pri(d):
+    nxt = d.next_cip
+    def swap_pri(amx):
+        val = amx._getheapcell(amx.STK)
+        amx._writeheap(amx.STK, amx.PRI)
+        amx.PRI = val
+        return nxt
+    return swap_pri
+
+
+def _swap_alt(d):
+    nxt = d.next_cip
+    def swap_alt(amx):
+        val = amx._getheapcell(amx.STK)
+        amx._writeheap(amx.STK, amx.ALT)
+        amx.ALT = val
+        return nxt
+    return swap_alt
+
+
+def _load_both(d, pri_addr, alt_addr):
+    nxt = d.next_cip
+    def load_both(amx):
+        amx.PRI = amx._getheapcell(pri_addr)
+        amx.ALT = amx._getheapcell(alt_addr)
+        return nxt
+    return load_both
+
+
+def _load_s_both(d, pri_offs, alt_offs):
+    nxt = d.next_cip
+    def load_s_both(amx):
+        frm = amx.FRM
+        amx.PRI = amx._getheapcell(frm + pri_offs)
+        amx.ALT = amx._getheapcell(frm + alt_offs)
+        return nxt
+    return load_s_both
+
+
+def _const(d, addr, val):
+    nxt = d.next_cip
+    def const(amx):
+        amx._writeheap(addr, val)
+        return nxt
+    return const
+
+
+def _const_s(d, offs, val):
+    nxt = d.next_cip
+    def const_s(amx):
+        amx._writeheap(amx.FRM + offs, val)
+        return nxt
+    return const_s
+
+
+def _stradjust_pri(d):
+    nxt = d.next_cip
+    def stradjust_pri(amx):
+        amx.PRI = (amx.PRI + CELL_SIZE) << 2
+        return nxt
+    return stradjust_pri
+
+
+def _bounds(d, limit):
+    nxt = d.next_cip
+    addr = d.addr
+    def bounds(amx):
+        if amx.PRI & 0xffffffff > limit:
+            _sync(amx, addr)
+            amx.report_out_of_bounds_error(amx.PRI, limit)
+        return nxt
+    return bounds
+
+
+def _retn(d):
+    def retn(amx):
+        frame = amx._pop_frame()
+        num_params = amx._pop()
+        amx.STK += num_params * CELL_SIZE
+        return frame.return_addr
+    return retn
+
+
+def _call(d, target):
+    addr = d.addr
+    nxt = d.next_cip
+    def call(amx):
+        _sync(amx, addr)
+        amx._push_frame(addr=target, return_addr=nxt)
+        return target
+    return call
+
+
+def _sysreq_n(d, native_index, num_params):
+    addr = d.addr
+    nxt = d.next_cip
+    pop_size = (num_params + 1) * CELL_SIZE
+    def sysreq_n(amx):
+        _sync(amx, addr)
+        amx.CIP = nxt
+        amx._push(num_params)
+        amx.PRI = amx._nativecall(native_index, amx.STK)
+        amx.STK += pop_size
+        return nxt
+    return sysreq_n
+
+
+def _unsigned_shr(a: int, b: int) -> int:
+    return (a & 0xffffffff) >> b
+
+
+_FACTORIES: Dict[str, Callable[..., OpClosure]] = {
+    'load_pri': _load_pri,
+    'load_alt': _load_alt,
+    'load_s_pri': _load_s_pri,
+    'load_s_alt': _load_s_alt,
+    'lref_s_pri': _lref_s_pri,
+    'lref_s_alt': _lref_s_alt,
+    'load_i': _load_i,
+    'const_pri': _const_pri,
+    'const_alt': _const_alt,
+    'addr_pri': _addr_pri,
+    'addr_alt': _addr_alt,
+    'stor_pri': _stor_pri,
+    'stor_alt': _stor_alt,
+    'stor_s_pri': _stor_s_pri,
+    'stor_s_alt': _stor_s_alt,
+    'sref_s_pri': _sref_s_pri,
+    'sref_s_alt': _sref_s_alt,
+    'stor_i': _stor_i,
+    'lidx': _lidx,
+    'idxaddr': _idxaddr,
+    'move_pri': _move_pri,
+    'move_alt': _move_alt,
+    'xchg': _xchg,
+    'push_pri': _push_pri,
+    'push_alt': _push_alt,
+    'pop_pri': _pop_pri,
+    'pop_alt': _pop_alt,
+    'push_c': _push_n_c,
+    'push2_c': _push_n_c,
+    'push3_c': _push_n_c,
+    'push4_c': _push_n_c,
+    'push5_c': _push_n_c,
+    'push': _push_n,
+    'push2': _push_n,
+    'push3': _push_n,
+    'push4': _push_n,
+    'push5': _push_n,
+    'push_s': _push_n_s,
+    'push2_s': _push_n_s,
+    'push3_s': _push_n_s,
+    'push4_s': _push_n_s,
+    'push5_s': _push_n_s,
+    'push_adr': _push_n_adr,
+    'push2_adr': _push_n_adr,
+    'push3_adr': _push_n_adr,
+    'push4_adr': _push_n_adr,
+    'push5_adr': _push_n_adr,
+    'stack': _stack,
+    'proc': _nop,
+    'endproc': _nop,
+    'nop': _nop,
+    'break_': _nop,
+    'casetbl': _nop,
+    'retn': _retn,
+    'call': _call,
+    'jump': _jump,
+    'jzer': _jzer,
+    'jnz': _jnz,
+    'jeq': _jeq,
+    'jneq': _jneq,
+    'jsless': _jsless,
+    'jsleq': _jsleq,
+    'jsgrtr': _jsgrtr,
+    'jsgeq': _jsgeq,
+    'halt': _halt,
+    'shl': _binary_op('shl', lambda a, b: a << b),
+    'shr': _binary_op('shr', _unsigned_shr),
+    'sshr': _binary_op('sshr', lambda a, b: a >> b),
+    'shl_c_pri': _shl_c_pri,
+    'shl_c_alt': _shl_c_alt,
+    'smul': _binary_op('smul', lambda a, b: a * b),
+    'smul_c': _smul_c,
+    'add': _add,
+    'add_c': _add_c,
+    'sub': _sub,
+    'sub_alt': _binary_op('sub_alt', lambda a, b: b - a),
+    'and_': _binary_op('and_', lambda a, b: a & b),
+    'or_': _binary_op('or_', lambda a, b: a | b),
+    'xor': _binary_op('xor', lambda a, b: a ^ b),
+    'not_': _unary_pri_op('not_', lambda a: not a),
+    'neg': _unary_pri_op('neg', lambda a: -a),
+    'invert': _unary_pri_op('invert', lambda a: ~a),
+    'zero_pri': _zero_pri,
+    'zero_alt': _zero_alt,
+    'zero': _zero,
+    'zero_s': _zero_s,
+    'eq': _eq,
+    'neq': _neq,
+    'sless': _sless,
+    'sleq': _sleq,
+    'sgrtr': _sgrtr,
+    'sgeq': _sgeq,
+    'eq_c_pri': _eq_c_pri,
+    'eq_c_alt': _eq_c_alt,
+    'inc_pri': _inc_pri,
+    'inc_alt': _inc_alt,
+    'inc': _inc,
+    'inc_s': _inc_s,
+    'inc_i': _inc_i,
+    'dec_pri': _dec_pri,
+    'dec_alt': _dec_alt,
+    'dec': _dec,
+    'dec_s': _dec_s,
+    'dec_i': _dec_i,
+    'swap_pri': _swap_pri,
+    'swap_alt': _swap_alt,
+    'load_both': _load_both,
+    'load_s_both': _load_s_both,
+    'const_': _const,
+    'const_s': _const_s,
+    'stradjust_pri': _stradjust_pri,
+    'bounds': _bounds,
+    'sysreq_n': _sysreq_n,
+}
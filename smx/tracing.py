@@ -0,0 +1,118 @@
+# Pluggable tracing of the instructions executed by the interpreter
+from __future__ import annotations
+
+import itertools
+import logging
+import sys
+from typing import Any, Sequence, TextIO, TYPE_CHECKING
+
+from smx.compat import hexlify
+
+if TYPE_CHECKING:
+    from smx.opcodes import SourcePawnInstruction
+    from smx.vm import SourcePawnAbstractMachine
+
+__all__ = ['Tracer', 'SpewTracer']
+
+
+class Tracer:
+    """Receives callbacks as the interpreter executes a plug-in's code
+
+    Pass an instance as SourcePawnPluginRuntime's `tracer` option. While any
+    tracer (or spew, or execution history) is active, the interpreter runs an
+    instrumented step function; otherwise, no tracing code runs at all.
+    """
+
+    def begin(self, amx: SourcePawnAbstractMachine, code_offs: int) -> None:
+        """Called when execution begins at the given code address"""
+
+    def after_instruction(
+        self,
+        amx: SourcePawnAbstractMachine,
+        addr: int,
+        instr: SourcePawnInstruction,
+        params: Sequence[Any],
+        rval: Any,
+    ) -> None:
+        """Called after each instruction is executed — or fails to execute, in which case rval is None"""
+
+
+class SpewTracer(Tracer):
+    """Writes a line for each executed instruction, with its params and result
+
+    :param file:
+        Stream to write lines to (sys.stdout, by default)
+
+    :param logger:
+        If passed, lines are logged to it (at `level`), instead of written to a stream
+
+    :param stack:
+        Whether to include the contents of the stack on each line
+    """
+
+    def __init__(
+        self,
+        file: TextIO | None = None,
+        *,
+        logger: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+        stack: bool = False,
+    ):
+        self.file = file
+        self.logger = logger
+        self.level = level
+        self.stack = stack
+
+    def write(self, line: str) -> None:
+        if self.logger is not None:
+            self.logger.log(self.level, line)
+        else:
+            print(line, file=self.file or sys.stdout)
+
+    def begin(self, amx: SourcePawnAbstractMachine, code_offs: int) -> None:
+        self.write(f'\nBeginning execution at {hex(code_offs)}')
+
+    def after_instruction(
+        self,
+        amx: SourcePawnAbstractMachine,
+        addr: int,
+        instr: SourcePawnInstruction,
+        params: Sequence[Any],
+        rval: Any,
+    ) -> None:
+        formatted_params = instr.format_params(amx, params)
+        line = f'{addr:05x}: {instr.name} {", ".join(formatted_params)}'
+
+        if rval is not None:
+            if isinstance(rval, int):
+                rval = f'{hex(rval):>10} ({rval})'
+            elif isinstance(rval, bytes):
+                rval = hexlify(rval)
+            line = f'{line:<70}-> {rval}'
+
+        if self.stack:
+            line = f'{line:<100} : {self.format_stack(amx)}'
+
+        self.write(line)
+
+    @staticmethod
+    def format_stack(amx: SourcePawnAbstractMachine) -> str:
+        stack_groups = itertools.groupby(reversed(amx.stack_values()), key=lambda sv: sv.frame)
+        stack_groups_str = []
+        for frame, frame_stack in stack_groups:
+            prefix = ''
+
+            if frame:
+                stp = frame.frm
+                name = frame.name or hex(frame.frm)
+                prefix = f'{name} - '
+            else:
+                stp = amx.STP
+
+            frame_stack_values = [
+                f'[{hex(sv.addr):>4}/{hex(sv.addr-stp):>4}] {hex(sv.value)}'
+                for sv in frame_stack
+            ]
+            stack_groups_str.append(prefix + ', '.join(frame_stack_values))
+
+        return ' || '.join(stack_groups_str)
@@ -2,48 +2,60 @@ from __future__ import annotations
 
 import ctypes
 import dataclasses
-import itertools
 import logging
 import os.path
 import struct
 import typing
 from contextlib import contextmanager
+from copy import copy
 from ctypes import (
-    addressof,
     c_byte,
-    c_char_p,
     c_float,
-    c_int16,
-    c_int8,
-    c_uint8,
-    c_void_p,
-    memmove,
-    memset,
     POINTER,
     pointer,
     sizeof,
 )
 from enum import Enum
-from typing import Any, List, NamedTuple, Tuple, Type, TYPE_CHECKING, TypeVar
+from typing import Any, Callable, List, NamedTuple, Sequence, Set, Tuple, TYPE_CHECKING, TypeVar
 
-from smx.compat import hexlify
-from smx.definitions import cell, PyCSimpleType
+from smx.compat import StrEnum
+from smx.definitions import cell, wrap_cell
 from smx.errors import SourcePawnErrorCode
 from smx.exceptions import SourcePawnPluginError, SourcePawnRuntimeError, SourcePawnUnboundNativeError
-from smx.opcodes import opcodes, SourcePawnInstruction
+from smx.opcodes import StackAddr
 from smx.pawn import SMXInstructions
 
 if TYPE_CHECKING:
     from typing import NoReturn
 
+    from smx.decoder import DecodedInstruction
     from smx.plugin import SourcePawnPlugin
     from smx.reader import DbgFile, DbgLine, Native, RTTIMethod
     from smx.runtime import SourcePawnPluginRuntime
+    from smx.tracing import Tracer
 
 logger = logging.getLogger(__name__)
 
 V = TypeVar('V')
-CType = TypeVar('CType', bound=PyCSimpleType)
+
+# Unaligned heap accesses, and all reads of the code and data sections, go through struct
+_unpack_cell = struct.Struct('<i').unpack_from
+_unpack_short = struct.Struct('<h').unpack_from
+_unpack_byte = struct.Struct('<b').unpack_from
+_pack_cell = struct.Struct('<i').pack_into
+_pack_short = struct.Struct('<H').pack_into
+
+# Number of bytes scanned at a time when reading null-terminated strings
+_STRING_CHUNK_SIZE = 256
+
+
+class ExecutionEngine(StrEnum):
+    #: Dispatch one (super)instruction at a time, supporting spew
+    INTERPRETER = 'interpreter'
+    #: Run functions compiled into chains of closures (see smx.threaded). Does not spew.
+    THREADED = 'threaded'
+    #: Interpret, compiling hot functions into Python source (see smx.jit). Compiled code does not spew.
+    JIT = 'jit'
 
 
 class FrameType(Enum):
@@ -106,8 +118,23 @@ class Frame:
 
 class StackValue(NamedTuple):
     addr: int
-    value: PyCSimpleType
-    frame: Frame
+    value: int
+    frame: Frame | None
+
+
+class AmxSnapshot(NamedTuple):
+    """State of an abstract machine, captured by `SourcePawnAbstractMachine.snapshot()`"""
+    #: Values of the registers, in the order of `SourcePawnAbstractMachine.SNAPSHOT_REGISTERS`
+    registers: Tuple[Any, ...]
+    #: Contents of the plug-in's memory: its data, heap, and stack
+    memory: bytes
+    frames: Tuple[Frame, ...]
+    #: State of the SourceMod system emulator (see `SourceModSystem.snapshot()`)
+    sys_state: Any
+    #: Lines printed to the runtime's console
+    console: Tuple[Tuple[Any, str], ...]
+    #: State of the runtime's random number generator, if it's been used
+    rand_state: Any
 
 
 def dump_stack(frames: List[Frame]) -> str:
@@ -154,7 +181,11 @@ class RelativeIndirectionVectorData:
 
 
 class SourcePawnAbstractMachine:
-    ZERO = cell(0)
+    #: Attributes saved and restored by snapshot() and restore()
+    SNAPSHOT_REGISTERS = (
+        'PRI', 'ALT', 'FRM', 'CIP', 'STK', 'HEA', '_hp_scope',
+        'instr', 'instr_addr', 'instr_line', 'halted', 'exception',
+    )
 
     def __init__(self, runtime: SourcePawnPluginRuntime, plugin: SourcePawnPlugin):
         """
@@ -184,25 +215,34 @@ class SourcePawnAbstractMachine:
         # heap
         self._hp_scope: int = 0
 
-        self.data = None  # Actual data section in memory
-        self.code = None  # Code section in memory
+        self.data: memoryview | None = None  # Initial contents of the data section (read-only)
+        self.code: memoryview | None = None  # Code section (read-only)
         self.heap = None
+        # Views over the heap buffer, through which all loads and stores go
+        self.mem: memoryview | None = None         # unsigned bytes
+        self.mem_i8: memoryview | None = None      # signed bytes
+        self.mem_i16: memoryview | None = None     # shorts, indexed by offset >> 1
+        self.mem_cells: memoryview | None = None   # cells, indexed by offset >> 2
+
+        # Decoded instructions executed by the interpreter, with superinstructions fused
+        # (the JIT engine installs its own, unfused copy)
+        self._code: List[DecodedInstruction | None] = []
+        # Tracers called by _step_traced
+        self._tracers: List[Tracer] = []
 
         self.smsys = None           # Our local copy of the SourceMod system emulator
         self.sm_natives = None      # Our local copy of the SourceMod Python natives
         self.instructions: SMXInstructions | None = None    # The SMX instructions methods
+        # Implementation of each of the plug-in's natives, by index
+        self.native_table: List[Callable[[Sequence[int]], int]] = []
+        # Natives the plug-in uses which have no implementation
+        self._unbound_natives: List[Native] = []
+        # Names of natives the plug-in has marked optional (with MarkNativeAsOptional)
+        self.optional_natives: Set[str] = set()
 
         # Stack of frame pointers — one for each nested CALL executed
         self._frames: List[Frame] = []
 
-        # Records the current stack in a list
-        # Each item is (data_offset, c_type())
-        self._stack: List[StackValue] = []
-
-        # The list of instructions executed
-        # TODO: tie this to the current frame
-        self._executed: List[Tuple[int, SourcePawnInstruction, Tuple[int, ...], Any]] = []
-
         # The current instruction being executed
         self.instr = None
         # Address of the current instruction being executed
@@ -216,19 +256,27 @@ class SourcePawnAbstractMachine:
         self.exception = None
 
     def init(self):
+        from smx.sourcemod.natives.base import unbound_native
         from smx.sourcemod.system import SourceModSystem
 
         self.COD = self.plugin.pcode.pcode
         self.DAT = self.plugin.data
 
-        # TODO(zk): use memoryview to prevent copying
-        self.data = self.plugin.base[self.DAT:][:self.plugin.datasize]
-        self.code = self.plugin.base[self.COD:][:self.plugin.pcode.size]
+        # NOTE: these views are shared with the plug-in (and all its other runtimes);
+        #       the data section is only copied once, into the heap.
+        self.data = self.plugin.data_section
+        self.code = self.plugin.code_section
 
-        self.heap = (c_byte * self.plugin.memsize)()
-        memmove(self.heap, self.data, self.plugin.datasize)
-        # XXX(zk): is this necessary? does ctypes automatically zero out requested memory?
-        memset(addressof(self.heap) + self.plugin.datasize, 0, self.plugin.memsize - self.plugin.datasize)
+        # NOTE: ctypes zero-initializes the buffer
+        memsize = self.plugin.memsize
+        self.heap = (c_byte * memsize)()
+        self.mem = memoryview(self.heap).cast('B')
+        self.mem_i8 = self.mem.cast('b')
+        self.mem_i16 = self.mem[:memsize & ~1].cast('h')
+        self.mem_cells = self.mem[:memsize & ~3].cast('i')
+        self.mem[:self.plugin.datasize] = self.data
+
+        self._code = self.plugin.fused_code
 
         self.HEA = self.plugin.datasize
         self._hp_scope = self.HEA
@@ -240,8 +288,17 @@ class SourcePawnAbstractMachine:
         self.sm_natives = self.smsys.natives
         self.instructions = SMXInstructions()
 
-        self._stack = []
-        self._executed = []
+        # Resolve natives once, rather than on every call
+        self.native_table = self.sm_natives.bind_natives(self.plugin.natives)
+        self._unbound_natives = [
+            native
+            for native, func in zip(self.plugin.natives, self.native_table)
+            if func is unbound_native
+        ]
+        self.optional_natives = set()
+
+        if self.runtime.history is not None:
+            self.runtime.history.clear()
 
         self.instr = 0
         self.instr_addr = 0
@@ -252,6 +309,66 @@ class SourcePawnAbstractMachine:
 
         self.initialized = True
 
+        # As SourceMod does when loading a plug-in, let the includes of the plug-ins and
+        # extensions it uses mark their natives optional, before checking for unbound ones
+        for public in self.plugin.publics:
+            if public.name.startswith(('__pl_', '__ext_')) and public.name.endswith('_SetNTVOptional'):
+                self.runtime.call_function_by_name(public.name)
+
+        unbound_natives = self.unbound_natives
+        if unbound_natives and self.runtime.strict_natives:
+            self.initialized = False
+            names = ', '.join(native.name for native in unbound_natives)
+            raise SourcePawnUnboundNativeError(f'Plug-in requires unbound natives: {names}')
+
+    @property
+    def unbound_natives(self) -> List[Native]:
+        """Natives the plug-in uses which have no implementation, and which it hasn't marked optional"""
+        return [native for native in self._unbound_natives if native.name not in self.optional_natives]
+
+    def snapshot(self) -> AmxSnapshot:
+        """Capture the state of the abstract machine, to return to it later with `restore()`
+
+        The snapshot holds the registers, a copy of the plug-in's memory, and the
+        state of the SourceMod system (handles, timers, and convars) and of the
+        runtime (its console and random number generator). Take it after, say,
+        OnPluginStart, and restore it before each test case, instead of running
+        the plug-in from scratch.
+        """
+        if not self.initialized:
+            self.init()
+
+        rand = self.runtime._rand
+        return AmxSnapshot(
+            registers=tuple(getattr(self, name) for name in self.SNAPSHOT_REGISTERS),
+            memory=bytes(self.mem),
+            frames=tuple(copy(frame) for frame in self._frames),
+            sys_state=self.smsys.snapshot(),
+            console=tuple(self.runtime.console),
+            rand_state=rand.getstate() if rand is not None else None,
+        )
+
+    def restore(self, snapshot: AmxSnapshot) -> None:
+        """Return the abstract machine to the state captured by `snapshot()`
+
+        A snapshot may be restored any number of times.
+        """
+        for name, value in zip(self.SNAPSHOT_REGISTERS, snapshot.registers):
+            setattr(self, name, value)
+
+        # NOTE: the whole of memory is copied in a single memmove. Finding the pages which
+        #       changed would mean comparing them all, which costs more than copying them.
+        ctypes.memmove(self.heap, snapshot.memory, len(snapshot.memory))
+
+        self._frames = [copy(frame) for frame in snapshot.frames]
+        self.smsys.restore(snapshot.sys_state)
+
+        self.runtime.console[:] = snapshot.console
+        if snapshot.rand_state is not None:
+            self.runtime.rand.setstate(snapshot.rand_state)
+        else:
+            self.runtime._rand = None
+
     def _cip(self):
         cip = self.CIP
         self.CIP += sizeof(cell)
@@ -270,42 +387,51 @@ class SourcePawnAbstractMachine:
         return self._readcodecell(cip)
 
     def _readcodecell(self, address):
-        off = address + 4
-        return struct.unpack('<l', self.code[address:off])[0]
+        return _unpack_cell(self.code, address)[0]
 
     def _getdatacell(self, offset):
-        val, = struct.unpack('<l', self.data[offset:offset + sizeof(cell)])
-        return val
-
-    def _getheap(self, offset: int, ctype: Type[CType]) -> Any:
-        heap = ctypes.cast(self.heap, POINTER(ctype))
-        heap_ptr = ctypes.cast(pointer(heap), POINTER(c_void_p))
-        heap_ptr.contents.value += offset
-        return heap.contents.value
+        return _unpack_cell(self.data, offset)[0]
 
     def _getheapcell(self, offset: int) -> int:
-        return self._getheap(offset, cell)
+        if offset & 3:
+            return _unpack_cell(self.mem, offset)[0]
+        return self.mem_cells[offset >> 2]
 
     def _getheapbyte(self, offset: int) -> int:
-        return self._getheap(offset, c_int8)
+        return self.mem_i8[offset]
 
     def _getheapchar(self, offset: int) -> int:
-        return self._getheap(offset, c_uint8)
+        return self.mem[offset]
 
     def _getheapshort(self, offset: int) -> int:
-        return self._getheap(offset, c_int16)
+        if offset & 1:
+            return _unpack_short(self.mem, offset)[0]
+        return self.mem_i16[offset >> 1]
 
     def _getstackcell(self, offset=0):
         return self._getheapcell(self.STK + offset)
 
     def _getdatabyte(self, offset):
-        return struct.unpack('<b', self.data[offset:offset+sizeof(c_int8)])[0]
+        return _unpack_byte(self.data, offset)[0]
 
     def _getdatashort(self, offset):
-        return struct.unpack('<h', self.data[offset:offset+sizeof(c_int16)])[0]
+        return _unpack_short(self.data, offset)[0]
+
+    def _getheapbytes(self, offset: int) -> bytes:
+        """Read the null-terminated byte string at the given heap offset"""
+        mem = self.mem
+        chunks = []
+        for start in range(offset, len(mem), _STRING_CHUNK_SIZE):
+            chunk = bytes(mem[start:start + _STRING_CHUNK_SIZE])
+            end = chunk.find(b'\0')
+            if end != -1:
+                chunks.append(chunk[:end])
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
 
     def _getheapstring(self, offset) -> str:
-        return c_char_p(addressof(self.heap) + offset).value.decode('utf-8')
+        return self._getheapbytes(offset).decode('utf-8')
 
     def _local_to_string(self, addr):
         return self.plugin._get_data_string(addr)
@@ -352,35 +478,32 @@ class SourcePawnAbstractMachine:
     def _push(self, value):
         """Pushes a cell onto the stack"""
         self.STK -= sizeof(cell)
-        val = cell(value)
-        self._writeheap(self.STK, val)
-        self._stack.append(StackValue(self.STK, val, self._cur_frame()))
+        self._writeheap(self.STK, value)
 
     def _pop(self):
         v = self._peek()
         self.STK += sizeof(cell)
-        self._stack.pop()
         return v
 
     def _peek(self, offset: int = 0):
         return self._getheapcell(self.STK + offset)
 
-    def _filter_stack(self, new_stk):
-        self._stack = [sv for sv in self._stack if sv.addr >= new_stk]
+    def stack_values(self) -> List[StackValue]:
+        """Reconstruct the values on the stack (from STK to STP), with the frames owning them
 
-    def _stack_set(self, set_addr, set_val):
-        """
-        When writing directly to the stack, instead of popping and pushing, we
-        need to manually find and update values.
+        Each value is attributed to the innermost frame it lies above — i.e. a
+        frame owns its locals, and its caller owns the saved FRM, heap scope,
+        and params of the call.
         """
-        index = None
-        for i, sv in enumerate(self._stack):
-            if set_addr == sv.addr:
-                index = i
-                break
-
-        if index is not None:
-            self._stack[index] = StackValue(set_addr, set_val, self._cur_frame())
+        values = []
+        frames = self._frames
+        owner_idx = len(frames) - 1
+        for addr in range(self.STK, self.STP, sizeof(cell)):
+            while owner_idx >= 0 and frames[owner_idx].frm <= addr:
+                owner_idx -= 1
+            frame = frames[owner_idx] if owner_idx >= 0 else None
+            values.append(StackValue(addr, self._getheapcell(addr), frame))
+        return values
 
     ###
 
@@ -427,7 +550,7 @@ class SourcePawnAbstractMachine:
 
     def _enter_heap_scope(self):
         saved_hp_scope = self._heap_alloc(sizeof(cell))
-        self._writeheap(saved_hp_scope, cell(self._hp_scope))
+        self._writeheap(saved_hp_scope, self._hp_scope)
         return saved_hp_scope
 
     def _leave_heap_scope(self, saved_hp_scope: int | None = None):
@@ -450,17 +573,35 @@ class SourcePawnAbstractMachine:
 
     ###
 
-    def _write(self, addr, value):
-        memmove(addr, pointer(value), sizeof(value))
+    def _writestack(self, value: int):
+        self._writeheap(self.STK, value)
+
+    def _writeheap(self, offset: int, value: int, *, is_heap: bool = False):
+        """Store a cell at the given offset, truncating the value to 32 bits"""
+        self._throw_if_bad_addr(offset, is_heap=is_heap)
+        if offset & 3:
+            _pack_cell(self.mem, offset, wrap_cell(value))
+            return
+
+        try:
+            self.mem_cells[offset >> 2] = value
+        except ValueError:
+            self.mem_cells[offset >> 2] = wrap_cell(value)
+
+    def _writeheapbyte(self, offset: int, value: int):
+        self._throw_if_bad_addr(offset)
+        self.mem[offset] = value & 0xff
 
-    def _writestack(self, value, **kwargs):
-        self._writeheap(self.STK, value, **kwargs)
+    def _writeheapshort(self, offset: int, value: int):
+        self._throw_if_bad_addr(offset)
+        _pack_short(self.mem, offset, value & 0xffff)
 
-    def _writeheap(self, offset, value, **kwargs):
-        addr = self._throw_if_bad_addr(offset, **kwargs)
-        self._write(addr, value)
+    def _writeheapbytes(self, offset: int, data: bytes | memoryview, *, is_heap: bool = False):
+        """Copy a buffer into memory at the given offset"""
+        self._throw_if_bad_addr(offset, is_heap=is_heap)
+        self.mem[offset:offset + len(data)] = data
 
-    def _throw_if_bad_addr(self, offset: int, *, is_heap: bool = False) -> int:
+    def _throw_if_bad_addr(self, offset: int, *, is_heap: bool = False) -> None:
         if (
             offset < 0 or
             not is_heap and (self.HEA <= offset < self.STK or offset >= self.STP) or
@@ -469,8 +610,6 @@ class SourcePawnAbstractMachine:
             # TODO(zk): report actual error code
             raise ValueError(f'Address {offset} is out of bounds')
 
-        return addressof(self.heap) + offset
-
     ###
 
     def _heap_alloc(self, amount: int) -> int:
@@ -492,7 +631,8 @@ class SourcePawnAbstractMachine:
         base_addr = self._heap_alloc(num_bytes)
 
         if auto_zero:
-            memset(addressof(self.heap) + base_addr + iv_size, 0, num_bytes - iv_size)
+            data_addr = base_addr + iv_size
+            self.mem[data_addr:base_addr + num_bytes] = bytes(num_bytes - iv_size)
 
         if self.plugin.uses_direct_arrays():
             info = AbsoluteIndirectionVectorData(
@@ -523,7 +663,7 @@ class SourcePawnAbstractMachine:
             next_array_offset = self._gen_absolute_indirection_vectors(info, dim - 1)
             iv_cell = iv_base_offset + i * sizeof(cell)
             next_array_addr = info.addr + next_array_offset
-            self._writeheap(info.addr + iv_cell, cell(next_array_addr))
+            self._writeheap(info.addr + iv_cell, next_array_addr)
 
         return iv_base_offset
 
@@ -556,7 +696,7 @@ class SourcePawnAbstractMachine:
             for i in range(info.dims[dim]):
                 self._writeheap(
                     offset=info.addr + write_offs * sizeof(cell),
-                    value=cell((cur_offs - write_offs) * sizeof(cell)),
+                    value=(cur_offs - write_offs) * sizeof(cell),
                 )
                 write_offs += 1
                 cur_offs = self._generate_inner_array_indirection_vectors(info, dim + 1, cur_offs)
@@ -564,7 +704,7 @@ class SourcePawnAbstractMachine:
             for i in range(info.dims[dim]):
                 self._writeheap(
                     offset=info.addr + write_offs * sizeof(cell),
-                    value=cell((info.data_offs - write_offs) * sizeof(cell)),
+                    value=(info.data_offs - write_offs) * sizeof(cell),
                 )
                 write_offs += 1
                 info.data_offs += info.dims[dim + 1]
@@ -575,14 +715,14 @@ class SourcePawnAbstractMachine:
         array_addr = self._generate_array([stride, length], auto_zero=init_addr is None)
 
         if init_addr is not None:
-            init_phys = addressof(self.heap) + init_addr
+            row_size = stride * sizeof(cell)
             for i in range(length):
                 elt_base = self._getheapcell(array_addr + i * sizeof(cell))
                 if not self.plugin.uses_direct_arrays():
                     elt_base += array_addr + i * sizeof(cell)
 
-                init_row = (cell * stride).from_address(init_phys + i * stride * sizeof(cell))
-                self._writeheap(elt_base, init_row)
+                init_row = init_addr + i * row_size
+                self._writeheapbytes(elt_base, self.mem[init_row:init_row + row_size])
 
         return array_addr
 
@@ -631,21 +771,14 @@ class SourcePawnAbstractMachine:
     def _nativecall(self, index: int, paramoffs: int):
         try:
             native = self.plugin.natives[index]
+            pyfunc = self.native_table[index]
         except IndexError:
             self.report_error(SourcePawnErrorCode.INVALID_NATIVE)
             return
 
         self._push_frame(0, native=native)
         try:
-            pyfunc = self.sm_natives.get_native(native.name)
-            if pyfunc is None:
-                raise SourcePawnUnboundNativeError
-
-            params = ctypes.cast(self.heap, POINTER(cell))
-            params_ptr = ctypes.cast(pointer(params), POINTER(c_void_p))
-            params_ptr.contents.value += paramoffs
-
-            return pyfunc(params)
+            return pyfunc(self.mem_cells[paramoffs >> 2:])
         except SourcePawnUnboundNativeError:
             self.report_error(SourcePawnErrorCode.INVALID_NATIVE)
             return
@@ -658,29 +791,42 @@ class SourcePawnAbstractMachine:
                 'Invalid public function ID %d' % func_id)
 
         index = func_id >> 1
-
-        try:
-            # TODO(zk): store publics by index, as well
-            func = tuple(self.plugin.publics_by_name.values())[index]
-        except IndexError:
+        if index >= len(self.plugin.publics):
             raise SourcePawnPluginError(
                 'Invalid public function index %d' % index)
 
+        func = self.plugin.publics[index]
+
         return self._execute(func.code_offs)
 
-    def _execute(self, code_offs):
+    def _execute(self, code_offs, *, interpret: bool = True):
         if not self.initialized:
             self.init()
 
-        if self.runtime.spew:
-            print(f'\nBeginning execution at {hex(code_offs)}')
+        tracers = self.runtime.get_tracers()
+        for tracer in tracers:
+            tracer.begin(self, code_offs)
 
         self.halted = False
         self.CIP = code_offs
-        while not self.halted and self.CIP < self.plugin.pcode.size:
-            self._step()
+        if self.runtime.engine is ExecutionEngine.THREADED:
+            self.plugin.threaded_code.run(self)
+        else:
+            if self.runtime.engine is ExecutionEngine.JIT and self._code is self.plugin.fused_code:
+                self._code = self.plugin.jit_code.install(self)
+
+            if tracers:
+                self._tracers = tracers
+                step = self._step_traced
+            else:
+                step = self._step
+
+            while not self.halted and self.CIP < self.plugin.pcode.size:
+                step()
 
         rval = self.runtime.amx.PRI
+        if not interpret:
+            return rval
 
         # Peer into debugging symbols to interpret return value as native Python type
         func = self.plugin.find_symbol_by_addr(code_offs)
@@ -691,71 +837,71 @@ class SourcePawnAbstractMachine:
 
         return rval
 
-    def _step(self):
-        self.instr_addr = self.CIP
-        frame = self._cur_frame()
-        if frame:
-            frame.addr = self.instr_addr
-
-        c = self._instr()
-        self.instr = c
-        op = c & ((1 << sizeof(cell)*4)-1)
-
-        instr = opcodes[op]
-        params = instr.read_params(self)
+    def _invalid_instruction(self, cip: int) -> NoReturn:
+        self.instr_addr = cip
+        if self._frames:
+            self._frames[-1].addr = cip
+        self.report_error(SourcePawnErrorCode.INVALID_INSTRUCTION)
 
-        exec_entry = (self.instr_addr, instr, tuple(params), None)
-        self._executed.append(exec_entry)
+    def _step(self):
+        """Execute the instruction at CIP
 
-        spew_line = ''
-        if self.runtime.spew:
-            formatted_params = instr.format_params(self, params)
-            spew_line = f'{self.instr_addr:05x}: {instr.name} {", ".join(formatted_params)}'
-            print(spew_line, end='')
+        NOTE: this must not carry any tracing; see _step_traced
+        """
+        cip = self.CIP
+        try:
+            decoded = self._code[cip >> 2]
+        except IndexError:
+            decoded = None
+        if decoded is None:
+            self._invalid_instruction(cip)
+
+        # NOTE: a `break` folded into the instruction following it is attributed to that instruction
+        addr, self.instr, instr, op_handler, params, self.CIP, stack_params = decoded
+        self.instr_addr = addr
+        if self._frames:
+            self._frames[-1].addr = addr
+        if stack_params:
+            frm = self.FRM
+            params = [frm + param if i in stack_params else param for i, param in enumerate(params)]
 
-        op_handler = getattr(self.instructions, instr.method, None)
         if not op_handler:
             ######################
             # TODO: handle this intentionally
-            logger.info(opcodes[op])
+            logger.info(instr)
             return
 
+        op_handler(self.instructions, self, *params)
+
+    def _step_traced(self):
+        """Execute the instruction at CIP, calling the active tracers"""
+        cip = self.CIP
+        try:
+            decoded = self._code[cip >> 2]
+        except IndexError:
+            decoded = None
+        if decoded is None:
+            self._invalid_instruction(cip)
+
+        # NOTE: a `break` folded into the instruction following it is attributed to that instruction
+        addr, self.instr, instr, op_handler, params, self.CIP, stack_params = decoded
+        self.instr_addr = addr
+        if self._frames:
+            self._frames[-1].addr = addr
+        if stack_params:
+            params = list(params)
+            for i in stack_params:
+                params[i] = StackAddr(self.FRM + params[i], params[i])
+
         rval = None
         try:
-            rval = op_handler(self, *params)
+            if not op_handler:
+                ######################
+                # TODO: handle this intentionally
+                logger.info(instr)
+                return
+
+            rval = op_handler(self.instructions, self, *params)
         finally:
-            if rval is not None:
-                self._executed[-1] = exec_entry[:-1] + (rval,)
-
-            if self.runtime.spew:
-                if rval is not None:
-                    if isinstance(rval, int):
-                        rval = f'{hex(rval):>10} ({rval})'
-                    elif isinstance(rval, bytes):
-                        rval = hexlify(rval)
-                    spew_line = f'{spew_line:<70}-> {rval}'
-
-                if self.runtime.spew_stack:
-                    stack_groups = itertools.groupby(self._stack, key=lambda sv: sv.frame)
-                    stack_groups_str = []
-                    for frame, frame_stack in stack_groups:
-                        prefix = ''
-
-                        if frame:
-                            stp = frame.frm
-                            name = frame.name or hex(frame.frm)
-                            prefix = f'{name} - '
-                        else:
-                            stp = self.STP
-
-                        frame_stack_values = [
-                            f'[{hex(sv.addr):>4}/{hex(sv.addr-stp):>4}] {hex(sv.value.value)}'
-                            for sv in frame_stack
-                        ]
-                        stack_groups_str.append(prefix + ', '.join(frame_stack_values))
-
-                    stk = ' || '.join(stack_groups_str)
-                    spew_line = f'{spew_line:<100} : {stk}'
-
-                # TODO(zk): use logger?
-                print('\r' + spew_line)
+            for tracer in self._tracers:
+                tracer.after_instruction(self, cip, instr, params, rval)
@@ -9,6 +9,7 @@ import smx
 import smx.plugin
 from smx.exceptions import SourcePawnRuntimeError
 from smx.sourcemod.natives import SourceModTestNatives
+from smx.vm import ExecutionEngine
 from .runtests import TestPlan as SMTestPlan, TestRunner as SMTestRunner
 
 sourcemod_tests_dir = Path(__file__).parent
@@ -30,12 +31,17 @@ runner = lambda_fixture(lambda: SMTestRunner(plan), scope='session')
 core_include_dir = lambda_fixture(lambda repo_dir: repo_dir / 'smx/include', scope='session')
 
 
+@pytest.mark.parametrize('engine', [
+    pytest.param(ExecutionEngine.INTERPRETER, id='interpreter'),
+    pytest.param(ExecutionEngine.THREADED, id='threaded'),
+    pytest.param(ExecutionEngine.JIT, id='jit'),
+])
 @pytest.mark.parametrize(
     'test',
     [t for t in plan.tests if t.type not in ('compiler-output', 'compile-only')],
     ids=lambda test: str(Path(test.path).relative_to(sourcemod_tests_dir)),
 )
-def test_sm_test(test, runner):
+def test_sm_test(test, runner, engine):
     if test.path.endswith('.sp'):
         source_dir = os.path.dirname(test.path)
         include_dirs = [sourcemod_tests_dir, source_dir]
@@ -57,6 +63,9 @@ def test_sm_test(test, runner):
         with open(test.path, 'rb') as fp:
             plugin = smx.plugin.SourcePawnPlugin(fp)
 
+    plugin.runtime.engine = engine
+    # Compile every function on first entry, so all code runs compiled
+    plugin.runtime.jit_threshold = 1
     plugin.runtime.spew = True
     plugin.runtime.spew_stack = True
 
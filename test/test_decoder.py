@@ -0,0 +1,76 @@
+from smx.opcodes import opcodes
+
+
+def test_decoded_instructions_chain(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Choose(int value) {
+            switch (value) {
+                case 1: return 10;
+                case 2: return 20;
+                case 5: return 50;
+            }
+            return 0;
+        }
+    ''')
+
+    cip = 0
+    seen = []
+    while cip < plugin.pcode.size:
+        decoded = plugin.decoded_code[cip >> 2]
+        assert decoded is not None, f'No instruction decoded at {hex(cip)}'
+        assert decoded.addr == cip
+        seen.append(decoded.instr)
+        cip = decoded.next_cip
+
+    assert cip == plugin.pcode.size
+    assert opcodes['casetbl'] in seen
+
+
+def test_superinstructions_fused(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        int Add(int a, int b) {
+            return a + b;
+        }
+
+        public int Sum(int n) {
+            int total;
+            for (int i = 0; i < n; i++) {
+                total = Add(total, i);
+            }
+            return total;
+        }
+    ''', spew=False, spew_stack=False)
+
+    fused_names = {d.instr.name for d in plugin.fused_code if d is not None and ' + ' in d.instr.name}
+    assert 'load.s.pri + push.pri' in fused_names
+    assert not any(d.instr.name == 'break' for d in plugin.fused_code if d is not None)
+
+    # Unfused instructions remain in place, so jumps into the middle of a sequence still work
+    for fused, decoded in zip(plugin.fused_code, plugin.decoded_code):
+        assert (fused is None) == (decoded is None)
+
+    assert plugin.runtime.call_function_by_name('Sum', 10) == 45
+
+
+def test_case_tables_decoded(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Choose(int value) {
+            switch (value) {
+                case 1: return 10;
+                case 2, 3: return 20;
+                case -5: return 50;
+            }
+            return 0;
+        }
+    ''', spew=False, spew_stack=False)
+
+    (casetbl_addr, table), = plugin.case_tables.items()
+    assert plugin.decoded_code[casetbl_addr >> 2].instr is opcodes['casetbl']
+    assert table.cases.keys() == {1, 2, 3, -5}
+    assert table.cases[2] == table.cases[3]
+
+    for value, expected in {1: 10, 2: 20, 3: 20, -5: 50, 4: 0}.items():
+        assert plugin.runtime.call_function_by_name('Choose', value) == expected
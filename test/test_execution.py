@@ -1,5 +1,26 @@
+import io
+import mmap
+from types import SimpleNamespace
+
+import pytest
 from pytest_lambda import lambda_fixture, static_fixture
 
+from smx.cache import SMXC_EXTENSION
+from smx.compiler import compile_to_string
+from smx.exceptions import SourcePawnRuntimeError, SourcePawnUnboundNativeError
+from smx.history import ExecutionHistory, FileHistory, RingBufferHistory
+from smx.interfaces import ParamCopyFlag
+import smx.plugin as plugin_module
+from smx.plugin import SourcePawnPlugin
+from smx.runtime import SourcePawnPluginRuntime
+from smx.sourcemod.natives import BaseSourceModNatives
+from smx.sourcemod.natives.adt_array import ArrayList
+from smx.sourcemod.natives.adt_trie import StringMap
+from smx.sourcemod.natives.base import SourceModNativesMixin, native, sp_ctof, unbound_native
+from smx.sourcemod.natives.float import FloatNatives
+from smx.tracing import SpewTracer, Tracer
+from smx.vm import ExecutionEngine
+
 
 def test_function_calling(compile_plugin):
     # language=SourcePawn
@@ -117,3 +138,738 @@ class TestInterpreter:
         expected = 23
         actual = plugin.runtime.call_function_by_name('ReturnTwentyThree')
         assert expected == actual
+
+
+def test_history_ring_buffer(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Count(int n) {
+            int total;
+            for (int i = 0; i < n; i++) {
+                total += i;
+            }
+            return total;
+        }
+    ''', history=RingBufferHistory(size=10))
+
+    assert plugin.runtime.call_function_by_name('Count', 100) == 4950
+
+    history = list(plugin.runtime.history)
+    assert len(history) == 10
+    assert history[-1].instr.name == 'halt'
+
+
+def test_history_file(compile_plugin):
+    output = io.StringIO()
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Test() {
+            return 1337;
+        }
+    ''', history=FileHistory(output))
+
+    assert plugin.runtime.call_function_by_name('Test') == 1337
+    assert 'const.pri 1337' in output.getvalue()
+
+
+def test_history_file_closed_by_runtime(compile_plugin, tmp_path):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Test() {
+            return 1337;
+        }
+    ''', history=FileHistory(tmp_path / 'first.txt'))
+
+    history = plugin.runtime.history
+    assert plugin.runtime.call_function_by_name('Test') == 1337
+
+    # Replacing the history closes the file it owns
+    plugin.runtime.history = FileHistory(tmp_path / 'second.txt')
+    assert history.fp.closed
+    assert 'const.pri 1337' in (tmp_path / 'first.txt').read_text()
+
+    history = plugin.runtime.history
+    plugin.runtime.close()
+    assert history.fp.closed
+
+    # Files passed in open are left for the caller to close
+    output = io.StringIO()
+    with FileHistory(output) as history:
+        plugin.runtime.history = history
+        plugin.runtime.close()
+        assert not output.closed
+
+
+def test_history_owned_by_one_runtime(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Test() {
+            return 1337;
+        }
+    ''', history=RingBufferHistory(size=10))
+
+    history = plugin.runtime.history
+    with pytest.raises(ValueError, match='already attached'):
+        plugin.new_runtime()
+
+    other = plugin.new_runtime(history=None)
+    with pytest.raises(ValueError, match='already attached'):
+        other.history = history
+
+    # Once detached, the history may be handed to another runtime
+    plugin.runtime.history = None
+    other.history = history
+    assert other.call_function_by_name('Test') == 1337
+    assert len(history) > 0
+
+
+def test_history_requires_record():
+    class NoRecordHistory(ExecutionHistory):
+        pass
+
+    with pytest.raises(TypeError, match='record'):
+        NoRecordHistory()
+
+
+def test_spew_tracer_file(compile_plugin):
+    output = io.StringIO()
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Test(int a) {
+            return a * 3;
+        }
+    ''', spew=False, tracer=SpewTracer(output))
+
+    assert plugin.runtime.call_function_by_name('Test', 4) == 12
+
+    lines = output.getvalue().strip().splitlines()
+    assert lines[0].startswith('Beginning execution at')
+    assert any(': smul' in line and '-> ' in line for line in lines)
+
+
+def test_stack_values_reconstructed(compile_plugin):
+    class DeepestStackTracer(Tracer):
+        def __init__(self):
+            self.frames = []
+            self.stack = []
+
+        def after_instruction(self, amx, addr, instr, params, rval):
+            if instr.name == 'proc' and len(amx._frames) > len(self.frames):
+                self.frames = list(amx._frames)
+                self.stack = amx.stack_values()
+
+    tracer = DeepestStackTracer()
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Depth(int n) {
+            return n > 0 ? Depth(n - 1) + 1 : 0;
+        }
+    ''', spew=False, tracer=tracer)
+
+    assert plugin.runtime.call_function_by_name('Depth', 3) == 3
+
+    # Each call pushes (from the top of the stack) the heap scope, the caller's FRM,
+    # the number of params, and the param `n` — all owned by the calling frame.
+    params = tracer.stack[3::4]
+    assert [sv.value for sv in params] == [0, 1, 2, 3]
+    assert [sv.frame for sv in params] == tracer.frames[-2::-1] + [None]
+
+
+@pytest.mark.parametrize('engine', list(ExecutionEngine))
+def test_memory_stores_wrap_to_cells(compile_plugin, engine):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Overflow() {
+            int values[2];
+            values[0] = 0x7fffffff;
+            values[0]++;
+            values[1] = values[0] - 1;
+            return values[1];
+        }
+    ''', engine=engine, jit_threshold=1, spew=False, spew_stack=False)
+
+    assert plugin.runtime.call_function_by_name('Overflow') == 0x7fffffff
+
+
+def test_runtimes_share_code_and_data_sections(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        int counter = 5;
+
+        public int Increment() {
+            return ++counter;
+        }
+    ''', spew=False, spew_stack=False)
+
+    other = SourcePawnPluginRuntime(plugin, spew=False)
+    assert plugin.runtime.call_function_by_name('Increment') == 6
+    assert other.call_function_by_name('Increment') == 6
+
+    for runtime in (plugin.runtime, other):
+        assert runtime.amx.code.obj is plugin.base
+        assert runtime.amx.data.obj is plugin.base
+
+
+def test_unbound_natives_reported_before_execution(compile_plugin):
+    # language=SourcePawn
+    source = '''
+        native int NotImplementedAnywhere(int value);
+
+        public int Twice(int value) {
+            return value * 2;
+        }
+
+        public int Missing() {
+            return NotImplementedAnywhere(1);
+        }
+    '''
+    plugin = compile_plugin(source, spew=False, spew_stack=False)
+    assert plugin.runtime.get_unbound_natives() == ['NotImplementedAnywhere']
+    assert plugin.runtime.call_function_by_name('Twice', 4) == 8
+
+    with pytest.raises(SourcePawnRuntimeError):
+        plugin.runtime.call_function_by_name('Missing')
+
+    strict_plugin = compile_plugin(source, spew=False, spew_stack=False, strict_natives=True)
+    with pytest.raises(SourcePawnUnboundNativeError, match='NotImplementedAnywhere'):
+        strict_plugin.runtime.call_function_by_name('Twice', 4)
+
+
+def test_optional_natives_allowed_when_strict(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        native int NotImplementedAnywhere(int value);
+
+        public void __pl_missing_SetNTVOptional() {
+            MarkNativeAsOptional("NotImplementedAnywhere");
+        }
+
+        public int Twice(int value) {
+            return value * 2;
+        }
+
+        public int Missing() {
+            return NotImplementedAnywhere(1);
+        }
+    ''', spew=False, spew_stack=False, strict_natives=True)
+
+    assert plugin.runtime.call_function_by_name('Twice', 4) == 8
+    assert plugin.runtime.get_unbound_natives() == []
+    assert 'NotImplementedAnywhere' in plugin.runtime.amx.optional_natives
+
+    # Marking a native optional is local to the runtime, leaving the plug-in untouched
+    assert plugin.natives_by_name['NotImplementedAnywhere'].flags == 0
+    other_runtime = plugin.new_runtime(strict_natives=True)
+    other_runtime.amx.optional_natives.add('Twice')
+    assert 'Twice' not in plugin.runtime.amx.optional_natives
+
+
+def test_timer_invalid_function(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public void Test() {
+            CreateTimer(0.1, view_as<Timer>(INVALID_FUNCTION));
+        }
+    ''', spew=False, spew_stack=False)
+
+    with pytest.raises(SourcePawnRuntimeError, match='Invalid function id'):
+        plugin.runtime.call_function_by_name('Test')
+
+
+def test_publics_resolved_by_id(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public void OnPluginStart() {
+            CreateTimer(0.01, Timer_Callback, 5);
+        }
+
+        public Action Timer_Callback(Handle timer, any data) {
+            PrintToServer("Timer fired with: %d", data);
+            return Plugin_Stop;
+        }
+
+        public int One() { return 1; }
+        public int Two() { return 2; }
+    ''', spew=False, spew_stack=False)
+
+    for index, pub in enumerate(plugin.publics):
+        assert pub.funcid >> 1 == index
+        assert plugin.runtime.get_function_by_id(pub.funcid).code_offs == pub.code_offs
+
+    two = plugin.publics_by_name['Two']
+    assert plugin.runtime.call_function(two.funcid) == 2
+    assert plugin.runtime.get_function_by_id(len(plugin.publics) << 1 | 1) is None
+
+    plugin.runtime.run()
+    assert plugin.runtime.get_console_lines() == ['Timer fired with: 5']
+
+
+def test_metadata_loaded_lazily(compile_plugin):
+    # language=SourcePawn
+    source = '''
+        public float Half(int value) {
+            return value / 2.0;
+        }
+    '''
+    plugin = compile_plugin(source, spew=False, spew_stack=False)
+    assert 'rtti_methods' not in vars(plugin)
+    assert 'dbg_lines' not in vars(plugin)
+
+    assert plugin.runtime.call_function_by_name('Half', 3) == pytest.approx(1.5)
+    assert plugin.rtti_methods_by_name['Half'].rtti is not None
+    assert plugin.dbg_lines
+
+    code_only = compile_plugin(source, code_only=True, spew=False, spew_stack=False)
+    assert 'rtti.methods' not in code_only.sections
+    assert code_only.rtti_methods == []
+    assert code_only.dbg_lines == []
+
+    # Without RTTI, args must be pushed manually, and return values are raw cells
+    half = code_only.runtime.get_function_by_name('Half')
+    half.push_cell(3)
+    call_rval, _ = half.invoke()
+    assert sp_ctof(call_rval.rval) == pytest.approx(1.5)
+
+
+def test_runtimes_share_plugin(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        int g_Count = 0;
+
+        public int Increment() {
+            PrintToServer("Count: %d", ++g_Count);
+            return g_Count;
+        }
+    ''', spew=False, spew_stack=False)
+
+    first = plugin.new_runtime()
+    second = plugin.new_runtime(engine='threaded')
+    assert first is not second and first is not plugin.runtime
+    assert second.engine is ExecutionEngine.THREADED
+
+    assert [first.call_function_by_name('Increment') for _ in range(3)] == [1, 2, 3]
+    assert second.call_function_by_name('Increment') == 1
+    assert plugin.runtime.call_function_by_name('Increment') == 1
+
+    # Natives act on the runtime which called them
+    assert first.get_console_lines() == ['Count: 1', 'Count: 2', 'Count: 3']
+    assert second.get_console_lines() == ['Count: 1']
+
+    assert first.amx.code is second.amx.code is plugin.code_section
+    assert first.amx.heap is not second.amx.heap
+
+
+def test_pushed_params_invoked_repeatedly(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Double(int values[3]) {
+            for (int i = 0; i < sizeof(values); i++) {
+                values[i] *= 2;
+            }
+            return values[0] + values[1] + values[2];
+        }
+    ''', spew=False, spew_stack=False)
+
+    plugin.runtime.amx.init()
+    func = plugin.runtime.get_function_by_name('Double')
+    param = func.push_array([1, 2, 3], ParamCopyFlag.COPYBACK)
+    hea = plugin.runtime.amx.HEA
+
+    # Invoking leaves the pushed params untouched, so each invocation sees the same args
+    for _ in range(2):
+        call_rval, _ = func.invoke()
+        assert call_rval.rval == 12
+        assert call_rval.args == [[2, 4, 6]]
+
+    assert param.value == [1, 2, 3]
+    assert plugin.runtime.amx.HEA == hea
+
+
+def test_function_map(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public float Sum(const int[] values, int count, const char[] label, float &mean) {
+            int total = 0;
+            for (int i = 0; i < count; i++) {
+                total += values[i];
+            }
+            mean = float(total) / float(count) + float(strlen(label));
+            return float(total);
+        }
+    ''', spew=False, spew_stack=False)
+
+    func = plugin.runtime.get_function_by_name('Sum')
+    arg_tuples = [
+        ([1, 2, 3], 3, '', 0.0),
+        ([10] * 40, 40, 'label', 0.0),
+        ([5], 1, 'x', 0.0),
+    ]
+    expected = [func.call(*args)[0] for args in arg_tuples]
+    hea = plugin.runtime.amx.HEA
+
+    results = list(func.map(iter(arg_tuples)))
+    assert [(r.rval, r.args) for r in results] == [(r.rval, r.args) for r in expected]
+    assert results[1].rval == 400.0 and results[1].args[-1] == 15.0
+    assert plugin.runtime.amx.HEA == hea
+
+
+def test_snapshot_restore(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        int g_Count = 0;
+        int g_Values[64];
+
+        public void OnPluginStart() {
+            CreateConVar("sm_started", "1");
+            g_Count = 10;
+        }
+
+        public int Mutate(int seed) {
+            CreateConVar("sm_mutated", "1");
+            for (int i = 0; i < sizeof(g_Values); i++) {
+                g_Values[i] += seed;
+            }
+            PrintToServer("Mutated");
+            return ++g_Count + g_Values[63];
+        }
+    ''', spew=False, spew_stack=False)
+
+    runtime = plugin.runtime
+    runtime.run()
+    snapshot = runtime.amx.snapshot()
+
+    for seed in (5, 7, 5):
+        runtime.amx.restore(snapshot)
+        assert runtime.call_function_by_name('Mutate', seed) == 11 + seed
+        assert set(runtime.amx.smsys.convars) == {'sm_started', 'sm_mutated'}
+        assert runtime.get_console_lines() == ['Mutated']
+
+    runtime.amx.restore(snapshot)
+    assert set(runtime.amx.smsys.convars) == {'sm_started'}
+    assert runtime.amx.STK == runtime.amx.STP
+    assert bytes(runtime.amx.mem) == snapshot.memory
+
+
+def test_plugin_cache(tmp_path):
+    # language=SourcePawn
+    smx = compile_to_string('''
+        public int Classify(int value) {
+            switch (value) {
+                case 1: return 10;
+                case 2, 3: return 20;
+                case 7: return 70;
+            }
+            return -1;
+        }
+    ''')
+
+    plugin = SourcePawnPlugin(smx, cache_dir=tmp_path, spew=False, spew_stack=False)
+    assert list(tmp_path.glob('*' + SMXC_EXTENSION))
+    assert not isinstance(plugin.base, mmap.mmap)
+
+    cached = SourcePawnPlugin(smx, cache_dir=tmp_path, spew=False, spew_stack=False)
+    assert isinstance(cached.base, mmap.mmap)
+    assert cached.decoded_code == plugin.decoded_code
+    assert cached.case_tables == plugin.case_tables
+    assert cached.rtti_methods_by_name.keys() == plugin.rtti_methods_by_name.keys()
+    assert [cached.runtime.call_function_by_name('Classify', v) for v in (1, 3, 5, 7)] == [10, 20, -1, 70]
+
+
+@pytest.mark.parametrize('keep', [
+    pytest.param(lambda size: 8, id='header'),
+    pytest.param(lambda size: 100, id='meta'),
+    pytest.param(lambda size: size - 1, id='image'),
+])
+def test_truncated_plugin_cache(tmp_path, keep):
+    # language=SourcePawn
+    smx = compile_to_string('''
+        public int Add(int a, int b) {
+            return a + b;
+        }
+    ''')
+
+    SourcePawnPlugin(smx, cache_dir=tmp_path, spew=False, spew_stack=False)
+    path, = tmp_path.glob('*' + SMXC_EXTENSION)
+    data = path.read_bytes()
+    path.write_bytes(data[:keep(len(data))])
+
+    plugin = SourcePawnPlugin(smx, cache_dir=tmp_path, spew=False, spew_stack=False)
+    assert not isinstance(plugin.base, mmap.mmap)
+    assert plugin.runtime.call_function_by_name('Add', 2, 3) == 5
+
+    # The damaged cache is rewritten
+    assert path.read_bytes() == data
+
+
+@pytest.mark.parametrize('compression_args, base_type', [
+    pytest.param(['-z0'], mmap.mmap, id='uncompressed'),
+    pytest.param([], bytearray, id='compressed'),
+])
+def test_plugin_file_loaded(tmp_path, compression_args, base_type):
+    # language=SourcePawn
+    smx = compile_to_string('''
+        public int Add(int a, int b) {
+            return a + b;
+        }
+    ''', extra_args=compression_args)
+    path = tmp_path / 'add.smx'
+    path.write_bytes(smx)
+
+    plugin = SourcePawnPlugin(str(path), spew=False, spew_stack=False)
+    assert isinstance(plugin.base, base_type)
+    assert plugin.filename == str(path)
+    assert plugin.runtime.call_function_by_name('Add', 2, 3) == 5
+
+
+def test_compressed_plugin_file_unmapped(tmp_path, monkeypatch):
+    # language=SourcePawn
+    smx = compile_to_string('''
+        public int Add(int a, int b) {
+            return a + b;
+        }
+    ''')
+    path = tmp_path / 'add.smx'
+    path.write_bytes(smx)
+
+    mapped = []
+    map_plugin_file = plugin_module._map_plugin_file
+
+    def record_mapped_file(fp):
+        data = map_plugin_file(fp)
+        mapped.append(data)
+        return data
+
+    monkeypatch.setattr(plugin_module, '_map_plugin_file', record_mapped_file)
+
+    plugin = SourcePawnPlugin(str(path), spew=False, spew_stack=False)
+    assert isinstance(plugin.base, bytearray)
+    assert isinstance(mapped[0], mmap.mmap)
+    assert mapped[0].closed
+
+
+def test_debug_lines_found_by_addr(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int First() {
+            return 1;
+        }
+
+        public int Second() {
+            return 2;
+        }
+    ''', filename='lines.sp', spew=False, spew_stack=False)
+
+    assert list(plugin.dbg_line_addrs) == sorted(plugin.dbg_line_addrs)
+    assert [(line.addr, line.line) for line in plugin.dbg_lines] == list(
+        zip(plugin.dbg_line_addrs, plugin.dbg_line_numbers)
+    )
+
+    first = plugin.rtti_methods_by_name['First']
+    second = plugin.rtti_methods_by_name['Second']
+    first_line = plugin.find_line_by_addr(first.pcode_end - 4).line
+    assert plugin.find_line_by_addr(second.pcode_end - 4).line == first_line + 4
+    assert plugin.find_file_by_addr(second.pcode_start).name.endswith('lines.sp')
+
+
+def test_native_args_marshalled(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        public int Contains() {
+            return StrContains("pysmx runs plugins", "runs", false);
+        }
+
+        public float Absolute(float value) {
+            return FloatAbs(value);
+        }
+
+        public int Copied() {
+            char buffer[8];
+            strcopy(buffer, sizeof(buffer), "pysmx");
+            return StrContains(buffer, "smx");
+        }
+    ''', spew=False, spew_stack=False)
+
+    assert plugin.runtime.call_function_by_name('Contains') == 6
+    assert plugin.runtime.call_function_by_name('Absolute', -2.5) == pytest.approx(2.5)
+    assert plugin.runtime.call_function_by_name('Copied') == 2
+
+    # Natives with the same signature share their generated marshalling code
+    natives = FloatNatives.__dict__
+    assert natives['FloatAbs'].native_func.__code__ is natives['SquareRoot'].native_func.__code__
+
+
+def test_stub_natives_bound_as_unbound():
+    class Natives(BaseSourceModNatives, SourceModNativesMixin):
+        @native(stub=True)
+        def Stubbed(self, value: int) -> int:
+            """Generated stub"""
+            raise SourcePawnUnboundNativeError
+
+        @native
+        def Refusing(self, value: int) -> int:
+            raise SourcePawnUnboundNativeError
+
+    natives = Natives.__new__(Natives)
+    stubbed, refusing = natives.bind_natives([SimpleNamespace(name='Stubbed'), SimpleNamespace(name='Refusing')])
+    assert stubbed is unbound_native
+    assert refusing is not unbound_native
+
+
+def test_array_list(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin(r'''
+        public int ReverseCompare(int index1, int index2, Handle array, Handle hndl) {
+            ArrayList list = view_as<ArrayList>(array);
+            return list.Get(index2) - list.Get(index1);
+        }
+
+        public void OnPluginStart() {
+            ArrayList list = new ArrayList(2);
+            for (int i = 0; i < 100; i++) {
+                int pair[2];
+                pair[0] = i;
+                pair[1] = i * i;
+                list.PushArray(pair);
+            }
+            list.Set(10, 4, 1);
+
+            int pair[2];
+            list.GetArray(50, pair);
+            PrintToServer("%d %d %d\n", list.Length, pair[0], pair[1]);
+            PrintToServer("%d %d %d\n", list.FindValue(81, 1), list.FindValue(4, 1), list.FindValue(100, 1));
+
+            list.SortCustom(ReverseCompare);
+            PrintToServer("%d %d\n", list.Get(0), list.Get(0, 1));
+            list.Sort(Sort_Ascending, Sort_Integer);
+            PrintToServer("%d %d\n", list.Get(0), list.Get(99, 1));
+
+            ArrayList names = new ArrayList(ByteCountToCells(8));
+            names.PushString("pysmx runs plugins");
+            names.PushString("spcomp");
+            char name[16];
+            names.GetString(0, name, sizeof(name));
+            PrintToServer("%s %d %d\n", name, names.FindString("spcomp"), names.FindString("sm"));
+            delete list;
+            delete names;
+        }
+    ''', spew=False, spew_stack=False)
+
+    plugin.run()
+    assert plugin.runtime.get_console_output() == '\n'.join((
+        '100 50 2500',
+        '9 2 -1',
+        '99 9801',
+        '0 9801',
+        'pysmx r 1 -1',
+    )) + '\n'
+
+
+def test_array_list_indexes_survive_resize():
+    array_list = ArrayList()
+    for value in range(1, 101):
+        array_list.push(value)
+    assert array_list.find_value(5) == 4
+    assert array_list.find_string(b'') == -1
+
+    # Resizing to the current length appends nothing
+    array_list.resize(100)
+    assert array_list.find_value(5) == 4
+    assert array_list.find_string(b'') == -1
+
+    # Growing the list indexes the (zeroed) blocks appended
+    array_list.resize(102)
+    assert array_list.find_value(0) == 100
+    assert array_list.find_string(b'') == 100
+
+
+def test_closed_string_map_snapshots_released(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        StringMap g_map;
+
+        public void OnPluginStart() {
+            g_map = new StringMap();
+            g_map.SetValue("answer", 42);
+            for (int i = 0; i < 100; i++) {
+                StringMapSnapshot snapshot = g_map.Snapshot();
+                delete snapshot;
+            }
+        }
+
+        public int Map() {
+            return view_as<int>(g_map);
+        }
+
+        public int Snapshot() {
+            return view_as<int>(g_map.Snapshot());
+        }
+    ''', spew=False, spew_stack=False)
+
+    plugin.run()
+    handles = plugin.runtime.amx.smsys.handles
+    string_map = handles[plugin.runtime.call_function_by_name('Map')]
+    assert isinstance(string_map, StringMap)
+    assert len(string_map._snapshots) == 0
+
+    snapshot = handles[plugin.runtime.call_function_by_name('Snapshot')]
+    assert list(string_map._snapshots) == [snapshot]
+
+    # Changing the map's keys hands the snapshot its own copy
+    string_map.set(b'name', b'pysmx')
+    assert len(string_map._snapshots) == 0
+    assert snapshot[0] == b'answer' and len(snapshot) == 1
+
+    # Snapshots taken between changes of the keys share one tuple of them
+    first = handles[plugin.runtime.call_function_by_name('Snapshot')]
+    second = handles[plugin.runtime.call_function_by_name('Snapshot')]
+    assert first[1] == b'name'
+    assert second.materialize() is first.materialize() is string_map.ordered_keys()
+    string_map.remove(b'answer')
+    assert first.materialize() == (b'answer', b'name') and string_map.ordered_keys() == (b'name',)
+
+
+def test_string_map(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin(r'''
+        public void OnPluginStart() {
+            StringMap map = new StringMap();
+            map.SetValue("answer", 42);
+            map.SetString("name", "pysmx");
+            int cells[3] = {1, 2, 3};
+            map.SetArray("cells", cells, sizeof(cells));
+            PrintToServer("%d %d\n", map.Size, map.SetValue("answer", 0, false));
+
+            StringMapSnapshot snapshot = map.Snapshot();
+            map.Remove("cells");
+
+            int value, size;
+            char name[16];
+            int read[3];
+            map.GetValue("answer", value);
+            map.GetString("name", name, sizeof(name), size);
+            PrintToServer("%d %s %d %d\n", value, name, size, map.GetValue("name", value));
+            PrintToServer("%d\n", map.GetArray("cells", read, sizeof(read)));
+            SetTrieArray(map, "cells", cells, 2);
+            GetTrieArray(map, "cells", read, sizeof(read), size);
+            PrintToServer("%d %d %d %d\n", read[0], read[1], read[2], size);
+
+            char key[16];
+            for (int i = 0; i < snapshot.Length; i++) {
+                snapshot.GetKey(i, key, sizeof(key));
+                PrintToServer("%s %d\n", key, snapshot.KeyBufferSize(i));
+            }
+            delete snapshot;
+            delete map;
+        }
+    ''', spew=False, spew_stack=False)
+
+    plugin.run()
+    assert plugin.runtime.get_console_output() == '\n'.join((
+        '3 0',
+        '42 pysmx 5 0',
+        '0',
+        '1 2 0 2',
+        'answer 7',
+        'name 5',
+        'cells 6',
+    )) + '\n'
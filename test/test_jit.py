@@ -0,0 +1,51 @@
+from smx.vm import ExecutionEngine
+
+
+def test_hot_functions_compiled(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        int Choose(int value) {
+            switch (value) {
+                case 1: return 10;
+                case 2: return 20;
+                case 5: return 50;
+            }
+            return value;
+        }
+
+        public int Sum(int n) {
+            int values[8];
+            int total;
+            for (int i = 0; i < n; i++) {
+                values[i % sizeof(values)] += Choose(i % 7);
+                total += values[i % sizeof(values)];
+            }
+            return total;
+        }
+    ''', engine=ExecutionEngine.JIT, jit_threshold=10, spew=False, spew_stack=False)
+
+    expected = plugin.runtime.call_function_by_name('Sum', 5)
+    assert not plugin.jit_code.functions
+
+    assert plugin.runtime.call_function_by_name('Sum', 100) == _sum(100)
+    assert expected == _sum(5)
+
+    compiled = {
+        plugin.find_method_by_addr(start).name: func
+        for start, func in plugin.jit_code.functions.items()
+    }
+    assert compiled.keys() == {'Choose', 'Sum'}
+    assert all(func is not None for func in compiled.values())
+
+    # Compiled code is entered by subsequent calls
+    assert plugin.runtime.call_function_by_name('Sum', 100) == _sum(100)
+
+
+def _sum(n: int) -> int:
+    choices = {1: 10, 2: 20, 5: 50}
+    values = [0] * 8
+    total = 0
+    for i in range(n):
+        values[i % 8] += choices.get(i % 7, i % 7)
+        total += values[i % 8]
+    return total
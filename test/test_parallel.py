@@ -0,0 +1,78 @@
+import pytest
+
+from smx.exceptions import SourcePawnWorkerError
+from smx.parallel import PluginPool
+
+
+@pytest.fixture
+def runtime(compile_plugin):
+    # language=SourcePawn
+    plugin = compile_plugin('''
+        int g_Offset = 0;
+
+        public void OnPluginStart() {
+            g_Offset = 1000;
+        }
+
+        public int Collatz(int n, int &max) {
+            int steps = 0;
+            max = n;
+            while (n != 1) {
+                n = n % 2 == 0 ? n / 2 : 3 * n + 1;
+                if (n > max) {
+                    max = n;
+                }
+                steps++;
+            }
+            return steps + g_Offset++;
+        }
+
+        public int Divide(int a, int b) {
+            return a / b;
+        }
+    ''', spew=False, spew_stack=False)
+
+    runtime = plugin.runtime
+    runtime.run()
+    return runtime
+
+
+def test_map(runtime):
+    with PluginPool(runtime, processes=2) as pool:
+        results = list(pool.map('Collatz', ((n, 0) for n in range(1, 51)), chunksize=4))
+
+    # Each call is made from the state at pool creation, so g_Offset is always 1000
+    assert [r.rval for r in results] == [1000 + _collatz(n)[0] for n in range(1, 51)]
+    assert [r.args for r in results] == [[n, _collatz(n)[1]] for n in range(1, 51)]
+
+    # The parent's runtime is left as it was
+    assert runtime.call_function_by_name('Collatz', 1, 0) == 1000
+
+
+def test_map_unordered(runtime):
+    with PluginPool(runtime, processes=2, reset=False) as pool:
+        results = list(pool.map('Collatz', [(1, 0)] * 20, ordered=False))
+
+    # Without resets, each worker's g_Offset increases with the calls it makes
+    assert len({r.rval for r in results}) > 2
+    assert all(r.rval >= 1000 for r in results)
+
+
+def test_map_error(runtime):
+    with PluginPool(runtime, processes=1) as pool:
+        results = pool.map('Divide', [(4, 2), (1, 0)])
+        assert next(results).rval == 2
+        with pytest.raises(SourcePawnWorkerError, match='Divide by zero'):
+            next(results)
+
+        with pytest.raises(ValueError):
+            pool.map('Missing', [()])
+
+
+def _collatz(n):
+    steps, max_n = 0, n
+    while n != 1:
+        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        max_n = max(max_n, n)
+        steps += 1
+    return steps, max_n